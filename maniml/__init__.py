@@ -150,7 +150,7 @@ from .mobject.three_dimensions import (
     Dodecahedron
 )
 from .mobject.types.dot_cloud import (
-    DotCloud, TrueDot
+    DotArray, DotCloud, DotView, TrueDot
 )
 from .mobject.types.image_mobject import (
     ImageMobject
@@ -323,7 +323,8 @@ __all__ += [
     'cycle_animation', 'turn_animation_into_updater', 'NumberLine',
     'UnitInterval', 'Integer', 'BackgroundRectangle', 'Cross', 'Underline',
     'Brace', 'BraceLabel', 'BraceText', 'SVGMobject', 'VMobjectFromSVGPath',
-    'Code', 'register_font', 'Table', 'MathTable', 'Dodecahedron', 'DotCloud', 'TrueDot',
+    'Code', 'register_font', 'Table', 'MathTable', 'Dodecahedron',
+    'DotArray', 'DotCloud', 'DotView', 'TrueDot',
     'ImageMobject', 'PGroup', 'PMobject', 'CurvesAsSubmobjects',
     'DashedVMobject', 'VectorizedPoint', 'ComplexValueTracker',
     'ValueTracker', 'ShaderWrapper', 'Window', 'SceneFileWriter', 'bezier',
@@ -12,6 +12,7 @@ USAGE = """
 maniml - ManimCE-compatible API on an OpenGL backend
 
 Usage: maniml [file] [Scene] [mode]
+       maniml batch [files or dirs...] [--jobs=N] [--force] [--export]
        maniml app [dir]
        maniml agent [install [dir] | open | status | uninstall]
 
@@ -27,6 +28,15 @@ App:
                    http://localhost:8685 is always there
   maniml agent open | status | restart | uninstall
 
+Batch:
+  maniml batch     Render every scene found under the given files and
+                   directories (default: cwd) as --render does, several
+                   at once (--jobs=N, default: one per CPU). Scenes whose
+                   source and config are unchanged since their last
+                   successful render are skipped unless --force.
+                   With --export, bakes each scene's web player instead;
+                   the scenes share one copy of the player's files
+
 Modes:
   (default)        Interactive development: window + hot-reload
   --web            Same interactive development, viewed in the browser
@@ -36,6 +46,10 @@ Modes:
                    watcher, then starts at the first checkpoint
   --render         No window: write the scene to a video file and
                    each checkpoint to a PNG, under ./media/
+  --frames=FORMAT  With --render: write frames instead of a video, as
+                   numbered png or exr files (./media/Scene_frames/),
+                   or rgba: raw frames in one memory-mapped file
+                   (./media/Scene.rgba) with no encoding at all
   --export         Bake the scene into a self-contained web player
                    (./media/SceneName_web/) — a static folder anyone
                    can open in a browser with no Python; host it on
@@ -91,6 +105,24 @@ def main():
         )
         sys.exit(1)
 
+    if args and args[0] == "batch":
+        from maniml import batch
+
+        jobs = None
+        for flag in flags:
+            if flag.startswith("--jobs="):
+                value = flag.split("=", 1)[1]
+                if not (value.isascii() and value.isdigit() and int(value) > 0):
+                    print(f"--jobs must be a positive whole number, not {value!r}")
+                    sys.exit(1)
+                jobs = int(value)
+        unknown = {f for f in flags if not f.startswith("--jobs=")} - {"--force", "--export"}
+        if unknown:
+            print(f"Unknown option(s): {', '.join(sorted(unknown))}")
+            sys.exit(1)
+        sys.exit(batch.main(
+            args[1:], jobs=jobs, force="--force" in flags, export="--export" in flags))
+
     if args and args[0] == "app":
         from maniml.web.cli import run_app
 
@@ -108,12 +140,25 @@ def main():
         print(USAGE)
         sys.exit(0)
 
-    unknown = flags - {"--present", "--render", "--web", "--no-browser", "--export"}
+    frames = None
+    for flag in flags:
+        if flag.startswith("--frames="):
+            frames = flag.split("=", 1)[1]
+    unknown = {f for f in flags if not f.startswith("--frames=")} - {
+        "--present", "--render", "--web", "--no-browser", "--export"
+    }
     if unknown:
         print(f"Unknown option(s): {', '.join(sorted(unknown))}")
         print(USAGE)
         sys.exit(1)
 
+    if frames is not None:
+        from maniml.scene.frame_sequence import SEQUENCE_FORMATS
+
+        if "--render" not in flags or frames not in SEQUENCE_FORMATS:
+            print(f"--frames takes --render and one of: {', '.join(SEQUENCE_FORMATS)}")
+            sys.exit(1)
+
     script_file = args[0]
     scene_name = args[1] if len(args) > 1 else None
 
@@ -129,6 +174,7 @@ def main():
         web="--web" in flags,
         export="--export" in flags,
         open_browser="--no-browser" not in flags,
+        frames=frames,
     )
 
 
@@ -235,6 +281,24 @@ def _run_web_scenes(viewer, script_file, scene_name, scene_class, present):
         scene_name, scene_class = pending, next_class
 
 
+def make_render_scene(scene_class, script_file, scene_name, frames=None):
+    """A headless scene that writes ./media/<scene_name>.mp4 next to the
+    script — or, with `frames`, that image sequence — plus one PNG per
+    checkpoint, when run."""
+    media_dir = os.path.join(os.path.dirname(os.path.abspath(script_file)), "media")
+    scene = scene_class(
+        window=None,
+        file_writer_config=dict(
+            write_to_movie=True,
+            output_directory=media_dir,
+            file_name=scene_name,
+            image_sequence=frames,
+        ),
+    )
+    scene._render_mode = True
+    return scene
+
+
 def run_scene(
     script_file,
     scene_name,
@@ -243,6 +307,7 @@ def run_scene(
     web=False,
     export=False,
     open_browser=True,
+    frames=None,
 ):
     module = load_scene_module(script_file)
 
@@ -289,16 +354,7 @@ def run_scene(
         return
 
     if render:
-        media_dir = os.path.join(os.path.dirname(os.path.abspath(script_file)), "media")
-        scene = scene_class(
-            window=None,
-            file_writer_config=dict(
-                write_to_movie=True,
-                output_directory=media_dir,
-                file_name=scene_name,
-            ),
-        )
-        scene._render_mode = True
+        scene = make_render_scene(scene_class, script_file, scene_name, frames)
     elif web:
         from maniml.web import WebViewer
 
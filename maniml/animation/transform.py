@@ -105,6 +105,7 @@ class Transform(Animation):
         mob.set_submobjects(list(target.submobjects))
         mob.set_uniforms(target.uniforms)
         mob.bounding_box[:] = target.bounding_box
+        mob._family_has_points = target._family_has_points
         mob.shader_folder = target.shader_folder
         mob.texture_paths = target.texture_paths
         mob.depth_test = target.depth_test
@@ -0,0 +1,300 @@
+"""`maniml batch`: render or export every scene under a directory, in
+parallel.
+
+`maniml file.py Scene --render` is one scene per invocation; a course
+repository has hundreds. This finds the scenes (by AST, the same way the
+app lists them), renders each in its own worker process — a fresh
+interpreter per scene, so one scene's GL context, module state or crash
+never reaches another — and skips any scene whose output is already
+current.
+
+With `--export` each scene is baked into its web player folder instead,
+`media/<Scene>_web/` as `--export` writes it. The player's static files
+are written once per media directory, to `media/_player/`, and every
+scene folder hard-links them from there rather than holding its own copy.
+
+"Current" is decided by a job key: a hash of the scene file's source,
+the scene's name, the maniml version and the resolved render config.
+A scene's key and output path are recorded next to its output, in
+`media/.batch.json`, only when it renders successfully. Only the scene
+file itself is hashed; a change to a module or asset it reads needs
+`--force`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from maniml.web.library import find_scene_classes
+
+CACHE_NAME = ".batch.json"
+PLAYER_BUNDLE = "_player"
+# Directories that never hold scenes worth rendering
+SKIP_DIRS = {"media", "__pycache__", "node_modules", "venv"}
+
+
+@dataclass
+class Job:
+    path: str
+    scene: str
+    key: str
+    export: bool = False
+    status: str = "pending"  # rendered | cached | failed
+    seconds: float = 0.0
+    frames: int = 0
+    error: str = ""
+
+    @property
+    def media_dir(self) -> str:
+        return os.path.join(os.path.dirname(self.path), "media")
+
+    @property
+    def entry(self) -> str:
+        """This job's name in the media directory's cache."""
+        return f"{self.scene}_web" if self.export else self.scene
+
+
+def discover(paths: list[str]) -> list[tuple[str, str]]:
+    """(absolute file, scene name) for every scene class in `paths`,
+    which may mix files and directories."""
+    found = []
+    for path in paths:
+        path = os.path.abspath(path)
+        if os.path.isfile(path):
+            files = [path]
+        else:
+            files = []
+            for root, dirs, names in os.walk(path):
+                dirs[:] = sorted(
+                    d for d in dirs
+                    if d not in SKIP_DIRS and not d.startswith(".")
+                )
+                files.extend(
+                    os.path.join(root, n) for n in sorted(names) if n.endswith(".py")
+                )
+        for file in files:
+            found.extend((file, scene) for scene in find_scene_classes(file))
+    return found
+
+
+def _render_config() -> str:
+    from maniml.config import manim_config
+    return json.dumps(manim_config, sort_keys=True, default=str)
+
+
+def job_key(path: str, scene: str, config: str | None = None, export: bool = False) -> str:
+    """Changes whenever re-rendering `scene` could change its output."""
+    from maniml.web.assets import _package_version
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        digest.update(f.read())
+    mode = "export" if export else "render"
+    for part in (scene, mode, _package_version(), config or _render_config()):
+        digest.update(b"\0" + part.encode())
+    return digest.hexdigest()
+
+
+def _load_cache(media_dir: str) -> dict:
+    try:
+        with open(os.path.join(media_dir, CACHE_NAME)) as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(media_dir: str, cache: dict) -> None:
+    os.makedirs(media_dir, exist_ok=True)
+    path = os.path.join(media_dir, CACHE_NAME)
+    temporary = path + ".tmp"
+    with open(temporary, "w") as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+    os.replace(temporary, path)
+
+
+def is_current(job: Job, cache: dict) -> bool:
+    entry = cache.get(job.entry)
+    return (
+        isinstance(entry, dict)
+        and entry.get("key") == job.key
+        and os.path.exists(entry.get("output", ""))
+    )
+
+
+def _render_job(path: str, scene_name: str, assets: str | None = None) -> dict:
+    """Worker: render one scene, or export it when given the player
+    bundle to link from. Runs in its own process; returns a summary
+    instead of raising, so one failure never stops the batch."""
+    from maniml.__main__ import load_scene_module, make_render_scene
+
+    started = time.perf_counter()
+    log = io.StringIO()
+    try:
+        # Scenes narrate their progress; from N processes at once that is
+        # noise, so it is kept and shown only if the scene fails
+        with contextlib.redirect_stdout(log):
+            module = load_scene_module(path)
+            scene_class = getattr(module, scene_name)
+            if assets is not None:
+                return _export_job(scene_class, path, scene_name, assets, started)
+            scene = make_render_scene(scene_class, path, scene_name)
+            scene._scene_filepath = path
+            scene._propagate_animation_errors = True
+            scene.run()
+    except BaseException as error:
+        lines = log.getvalue().strip().splitlines()
+        return {
+            "ok": False,
+            "seconds": time.perf_counter() - started,
+            "error": f"{type(error).__name__}: {error}",
+            "log": lines[-5:],
+        }
+    return {
+        "ok": True,
+        "seconds": time.perf_counter() - started,
+        "frames": scene.file_writer.frames_written,
+        "output": str(scene.file_writer.get_movie_file_path()),
+    }
+
+
+def _export_job(scene_class, path: str, scene_name: str, assets: str, started: float) -> dict:
+    from maniml.web.export import export_scene
+
+    scene = scene_class(window=None)
+    scene._scene_filepath = path
+    output = os.path.join(os.path.dirname(path), "media", f"{scene_name}_web")
+    export_scene(scene, output, assets=assets)
+    with open(os.path.join(output, "scene.json")) as f:
+        frames = len(json.load(f)["frames"])
+    return {
+        "ok": True,
+        "seconds": time.perf_counter() - started,
+        "frames": frames,
+        "output": output,
+    }
+
+
+def default_jobs() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+def run_batch(
+    paths: list[str], jobs: int | None = None, force: bool = False, export: bool = False
+) -> list[Job]:
+    """Render (or export) every scene found under `paths`; returns one
+    Job per scene."""
+    config = _render_config()
+    queue = [
+        Job(path, scene, job_key(path, scene, config, export), export)
+        for path, scene in discover(paths)
+    ]
+    caches: dict[str, dict] = {}
+    pending = []
+    for job in queue:
+        cache = caches.setdefault(job.media_dir, _load_cache(job.media_dir))
+        if not force and is_current(job, cache):
+            job.status = "cached"
+            job.frames = cache[job.entry].get("frames", 0)
+        else:
+            pending.append(job)
+
+    bundles = {}
+    if export:
+        from maniml.web.export import write_player_assets
+
+        for media_dir in sorted({job.media_dir for job in pending}):
+            bundles[media_dir] = str(
+                write_player_assets(os.path.join(media_dir, PLAYER_BUNDLE)))
+
+    if pending:
+        workers = min(jobs or default_jobs(), len(pending))
+        # spawn, one task per child: every scene starts from a clean
+        # interpreter, exactly as `maniml file.py Scene --render` would
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=1,
+        ) as pool:
+            futures = {
+                pool.submit(_render_job, job.path, job.scene, bundles.get(job.media_dir)): job
+                for job in pending
+            }
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    result = future.result()
+                except Exception as error:  # the worker itself died
+                    result = {"ok": False, "seconds": 0.0,
+                              "error": f"{type(error).__name__}: {error}", "log": []}
+                job.seconds = result["seconds"]
+                if result["ok"]:
+                    job.status = "rendered"
+                    job.frames = result["frames"]
+                    cache = caches[job.media_dir]
+                    cache[job.entry] = {
+                        "key": job.key,
+                        "output": result["output"],
+                        "frames": job.frames,
+                    }
+                    _save_cache(job.media_dir, cache)
+                else:
+                    job.status = "failed"
+                    job.error = "\n".join([*result["log"], result["error"]])
+                print(f"{job.status:>8}  {_label(job)}", flush=True)
+    return queue
+
+
+def _label(job: Job) -> str:
+    return f"{os.path.relpath(job.path)}:{job.scene}"
+
+
+def format_summary(queue: list[Job]) -> str:
+    rows = [("scene", "status", "wall (s)", "frames", "fps")]
+    for job in queue:
+        rendered = job.status == "rendered"
+        rows.append((
+            _label(job),
+            job.status,
+            f"{job.seconds:.1f}" if rendered or job.status == "failed" else "-",
+            str(job.frames) if job.frames else "-",
+            f"{job.frames / job.seconds:.1f}" if rendered and job.seconds else "-",
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if i < 2 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    counts = {s: sum(j.status == s for j in queue) for s in ("rendered", "cached", "failed")}
+    lines.append(
+        f"\n{len(queue)} scenes: {counts['rendered']} rendered, "
+        f"{counts['cached']} up to date, {counts['failed']} failed"
+    )
+    for job in queue:
+        if job.status == "failed":
+            lines.append(f"\n{_label(job)} failed:\n{job.error}")
+    return "\n".join(lines)
+
+
+def main(
+    paths: list[str], jobs: int | None = None, force: bool = False, export: bool = False
+) -> int:
+    queue = run_batch(paths or ["."], jobs=jobs, force=force, export=export)
+    if not queue:
+        print("No scenes found.")
+        return 1
+    print()
+    print(format_summary(queue))
+    return 1 if any(job.status == "failed" for job in queue) else 0
@@ -185,6 +185,17 @@ class Camera(object):
             dtype=dtype,
         )
 
+    def read_raw_fbo_into(self, buffer, write_offset: int = 0) -> None:
+        """get_raw_fbo_data straight into a writable buffer (e.g. a memory
+        map) at `write_offset`, with no intermediate bytes object."""
+        self.blit(self.fbo, self.draw_fbo)
+        self.draw_fbo.read_into(
+            buffer,
+            viewport=self.draw_fbo.viewport,
+            components=self.n_channels,
+            write_offset=write_offset,
+        )
+
     def get_image(self) -> Image.Image:
         return Image.frombytes(
             'RGBA',
@@ -4,6 +4,7 @@ import numpy as np
 
 from maniml.event_handler.event_listner import EventListener
 from maniml.event_handler.event_type import EventType
+from maniml.utils.hit_testing import BoundingBoxIndex
 
 
 class EventDispatcher(object):
@@ -18,6 +19,11 @@ class EventDispatcher(object):
         self.mouse_drag_point = np.array((0., 0., 0.))
         self.pressed_keys: set[int] = set()
         self.draggable_object_listners: list[EventListener] = []
+        # Listener mobjects' boxes, per mouse event type
+        self._hit_indexes: dict[EventType, BoundingBoxIndex] = {
+            event_type: BoundingBoxIndex()
+            for event_type in EventType
+        }
 
     def add_listner(self, event_listner: EventListener):
         assert isinstance(event_listner, EventListener)
@@ -44,11 +50,8 @@ class EventDispatcher(object):
         elif event_type == EventType.KeyReleaseEvent:
             self.pressed_keys.difference_update({event_data["symbol"]})  # Modifiers?
         elif event_type == EventType.MousePressEvent:
-            self.draggable_object_listners = [
-                listner
-                for listner in self.event_listners[EventType.MouseDragEvent]
-                if listner.mobject.is_point_touching(self.mouse_point)
-            ]
+            self.draggable_object_listners = self.touched_listners(
+                EventType.MouseDragEvent)
         elif event_type == EventType.MouseReleaseEvent:
             self.draggable_object_listners = []
 
@@ -62,12 +65,11 @@ class EventDispatcher(object):
                     return propagate_event
 
         elif event_type.value.startswith('mouse'):
-            for listner in self.event_listners[event_type]:
-                if listner.mobject.is_point_touching(self.mouse_point):
-                    propagate_event = listner.callback(
-                        listner.mobject, event_data)
-                    if propagate_event is not None and propagate_event is False:
-                        return propagate_event
+            for listner in self.touched_listners(event_type):
+                propagate_event = listner.callback(
+                    listner.mobject, event_data)
+                if propagate_event is not None and propagate_event is False:
+                    return propagate_event
 
         elif event_type.value.startswith('key'):
             for listner in self.event_listners[event_type]:
@@ -77,6 +79,15 @@ class EventDispatcher(object):
 
         return propagate_event
 
+    def touched_listners(self, event_type: EventType) -> list[EventListener]:
+        """The listeners for `event_type` whose mobject the mouse is over."""
+        listners = self.event_listners[event_type]
+        if not listners:
+            return []
+        touched = self._hit_indexes[event_type].touching(
+            [listner.mobject for listner in listners], self.mouse_point)
+        return [listner for listner, hit in zip(listners, touched) if hit]
+
     def get_listners_count(self) -> int:
         return sum([len(value) for key, value in self.event_listners.items()])
 
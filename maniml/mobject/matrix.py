@@ -8,6 +8,7 @@ from maniml.mobject.numbers import DecimalNumber
 from maniml.mobject.svg.tex_mobject import MathTex as Tex
 from maniml.mobject.types.vectorized_mobject import VGroup
 from maniml.mobject.types.vectorized_mobject import VMobject
+from maniml.utils.family_ops import family_member_indices
 
 from typing import TYPE_CHECKING
 
@@ -72,11 +73,11 @@ class Matrix(VMobject):
 
     def copy(self, deep: bool = False):
         result = super().copy(deep)
-        self_family = self.get_family()
+        indices = family_member_indices(self.get_family())
         copy_family = result.get_family()
         for attr in ["elements", "ellipses"]:
             setattr(result, attr, [
-                copy_family[self_family.index(mob)]
+                copy_family[indices[id(mob)]]
                 for mob in getattr(self, attr)
             ])
         return result
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 import copy
 from functools import wraps
+import inspect
 import itertools as it
 import pickle
 import random
@@ -23,9 +25,10 @@ from maniml.event_handler.event_listner import EventListener
 from maniml.event_handler.event_type import EventType
 from maniml.rendering.shader_wrapper import ShaderWrapper
 from maniml.utils.color import color_gradient
-from maniml.utils.color import color_to_rgb
+from maniml.utils.color import colors_to_rgbs
 from maniml.utils.color import get_colormap_list
 from maniml.utils.color import rgb_to_hex
+from maniml.utils.family_ops import family_member_indices
 from maniml.utils.iterables import arrays_match
 from maniml.utils.iterables import array_is_constant
 from maniml.utils.iterables import batch_by_property
@@ -58,6 +61,93 @@ if TYPE_CHECKING:
     NonTimeUpdater = Callable[["Mobject"], "Mobject" | None]
     Updater = Union[TimeBasedUpdater, NonTimeUpdater]
 
+# Every data change takes a fresh number from here, so a mobject's
+# `_data_version` names its data at one moment across all mobjects: the
+# geometry stream (web/geometry.py) reuses the previous frame's bytes
+# for any mobject whose (id, version) it has already serialized.
+_data_versions = it.count()
+
+# While a batch_updates block is open: the mobjects already noted as
+# changed within it, and those whose ancestors are owed a note when it
+# closes (see Mobject.batch_updates)
+_batched_changes: tuple[set, dict] | None = None
+
+# Per class, whether copy.copy would copy an instance as nothing more than
+# its __dict__, which _shallow_copy then does directly
+_plain_copy_classes: dict[type, bool] = dict()
+
+
+def _shallow_copy(mobject: Mobject) -> Mobject:
+    """
+    copy.copy(mobject), skipping the generic copy protocol's dispatch for
+    classes that do not customize it
+    """
+    cls = type(mobject)
+    plain = _plain_copy_classes.get(cls)
+    if plain is None:
+        plain = _plain_copy_classes[cls] = (
+            cls.__reduce_ex__ is object.__reduce_ex__
+            and cls.__reduce__ is object.__reduce__
+            and cls.__getstate__ is object.__getstate__
+            and not hasattr(cls, "__copy__")
+            and not hasattr(cls, "__setstate__")
+            and not any("__slots__" in vars(base) for base in cls.__mro__)
+        )
+    if not plain:
+        return copy.copy(mobject)
+    result = cls.__new__(cls)
+    result.__dict__.update(mobject.__dict__)
+    return result
+
+
+# Attribute values Mobject.copy leaves shared, recognized by exact type
+# before anything slower is asked of them
+_SHARED_ATTRIBUTE_TYPES = frozenset((
+    str, int, float, bool, type(None), tuple, list, set, dict,
+))
+
+
+def updater_takes_dt(updater: Updater) -> bool:
+    """
+    Whether `updater` takes dt, the change in time since it last ran,
+    as a keyword argument
+    """
+    code = getattr(updater, "__code__", None)
+    if code is None:
+        return "dt" in inspect.signature(updater).parameters
+    return "dt" in code.co_varnames
+
+
+def _bounding_box_points(boxes: np.ndarray, direction: Vect3) -> np.ndarray:
+    """
+    Mobject.get_bounding_box_point for each of a stack of bounding boxes
+    """
+    indices = (np.sign(direction) + 1).astype(int)
+    return boxes[:, indices, [0, 1, 2]]
+
+
+def _moves_by_bounding_box(mobjects: Iterable[Mobject]) -> bool:
+    """
+    Whether next_to and move_to would do no more with each of `mobjects`
+    than shift it by what its bounding box says, so a layout can solve
+    every shift from the boxes at once
+    """
+    return all(
+        type(mob).get_bounding_box_point is Mobject.get_bounding_box_point
+        and type(mob).shift is Mobject.shift
+        and type(mob).next_to is Mobject.next_to
+        and type(mob).move_to is Mobject.move_to
+        for mob in mobjects
+    )
+
+
+def _copy_array(array: np.ndarray) -> np.ndarray:
+    # A mobject's data is a small structured array, which copies about
+    # twice as fast through a raw byte view as it does field by field
+    if array.dtype.names is not None and array.ndim and array.flags.c_contiguous:
+        return array.view(np.uint8).copy().view(array.dtype)
+    return array.copy()
+
 
 class Mobject(object):
     """
@@ -73,6 +163,10 @@ class Mobject(object):
     ])
     aligned_data_keys = ['point']
     pointlike_data_keys = ['point']
+    # Bumped whenever a mobject flagged by a scene, for having no updaters
+    # in its family, may have gained some (see Scene.get_updating_mobjects)
+    _updater_epoch: int = 0
+    _wakes_updater_schedule: bool = False
 
     def __init__(
         self,
@@ -106,7 +200,12 @@ class Mobject(object):
         self.shader_wrapper: Optional[ShaderWrapper] = None
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
+        # Whether any family member has points, as of the last bounding box
+        self._family_has_points: bool = False
         self._data_has_changed: bool = True
+        self._data_version: int = next(_data_versions)
+        # Set by pack_family: (family, packs, members without points)
+        self._packed: tuple | None = None
         self.shader_code_replacements: dict[str, str] = dict()
 
         self.init_data()
@@ -252,15 +351,56 @@ class Mobject(object):
         return _FunctionalUpdaterBuilder(self)
 
     def note_changed_data(self, recurse_up: bool = True) -> Self:
+        batch = _batched_changes
+        if batch is not None:
+            noted, owed = batch
+            if recurse_up:
+                owed[self] = None
+            if self in noted:
+                return self
+            noted.add(self)
         self._data_has_changed = True
-        # Clear triangulation cache if it exists
-        if hasattr(self, '_triangulation_cache'):
-            delattr(self, '_triangulation_cache')
-        if recurse_up:
+        self._data_version = next(_data_versions)
+        self.__dict__.pop('_triangulation_cache', None)
+        if recurse_up and batch is None:
             for mob in self.parents:
                 mob.note_changed_data()
         return self
 
+    @contextmanager
+    def batch_updates(self) -> Iterator[Self]:
+        """
+        Within the block, each changed mobject is noted once, however
+        often it changes, and the note to its ancestors waits until the
+        block exits, when each ancestor is noted once.
+
+        with group.batch_updates():
+            for dot in group:
+                dot.set_points(...)
+
+        Nothing should render the changed mobjects inside the block.
+        Nested blocks defer to the outermost.
+        """
+        global _batched_changes
+        if _batched_changes is not None:
+            yield self
+            return
+        noted, owed = _batched_changes = (set(), dict())
+        try:
+            yield self
+        finally:
+            _batched_changes = None
+            visited = set()
+            to_visit = [parent for mob in owed for parent in mob.parents]
+            while to_visit:
+                mob = to_visit.pop()
+                if mob in visited:
+                    continue
+                visited.add(mob)
+                if mob not in noted:
+                    mob.note_changed_data(recurse_up=False)
+                to_visit.extend(mob.parents)
+
     @staticmethod
     def affects_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
@@ -275,11 +415,32 @@ class Mobject(object):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             result = func(self, *args, **kwargs)
-            for mob in self.family_members_with_points():
-                mob.note_changed_data()
+            # Each member once, then whatever holds the family from
+            # outside, rather than walking up from every member in turn
+            family = self.get_family()
+            for mob in family:
+                mob.note_changed_data(recurse_up=False)
+            members = set(family)
+            holders = {
+                parent: None
+                for mob in family
+                for parent in mob.parents
+                if parent not in members
+            }
+            for parent in holders:
+                parent.note_changed_data()
             return result
         return wrapper
 
+    @staticmethod
+    def batches_updates(func: Callable[..., T]) -> Callable[..., T]:
+        """For methods changing many members: runs them in batch_updates"""
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.batch_updates():
+                return func(self, *args, **kwargs)
+        return wrapper
+
     # Only these methods should directly affect points
     @affects_data
     def set_data(self, data: np.ndarray) -> Self:
@@ -338,18 +499,26 @@ class Mobject(object):
         if about_point is None and about_edge is not None:
             about_point = self.get_bounding_box_point(about_edge)
 
-        for mob in self.get_family():
-            arrs = [mob.data[key] for key in mob.pointlike_data_keys if mob.has_points()]
-            if works_on_bounding_box:
-                arrs.append(mob.get_bounding_box())
-
-            for arr in arrs:
-                if about_point is None:
-                    arr[:] = func(arr)
-                else:
-                    arr[:] = func(arr - about_point) + about_point
+        packs = self.get_point_packs()
+        if packs is not None:
+            # One call per packed buffer rather than one per member; the
+            # bounding boxes are recomputed (from those buffers) on demand
+            arrs = [buffer[key] for buffer, keys, _, _ in packs for key in keys]
+        else:
+            arrs = []
+            for mob in self.get_family():
+                if mob.has_points():
+                    arrs.extend(mob.data[key] for key in mob.pointlike_data_keys)
+                if works_on_bounding_box:
+                    arrs.append(mob.get_bounding_box())
+
+        for arr in arrs:
+            if about_point is None:
+                arr[:] = func(arr)
+            else:
+                arr[:] = func(arr - about_point) + about_point
 
-        if not works_on_bounding_box:
+        if not works_on_bounding_box or packs is not None:
             self.refresh_bounding_box(recurse_down=True)
         else:
             for parent in self.parents:
@@ -391,14 +560,24 @@ class Mobject(object):
         return self.bounding_box
 
     def compute_bounding_box(self) -> Vect3Array:
-        all_points = np.vstack([
-            self.get_points(),
-            *(
-                mob.get_bounding_box()
-                for mob in self.get_family()[1:]
-                if mob.has_points()
-            )
-        ])
+        packs = self.get_point_packs()
+        if packs is not None and self._packed[3]:
+            all_points = np.vstack([buffer["point"] for buffer, _, _, _ in packs])
+        else:
+            # Each child's cached box already covers its own family, so a
+            # box is built from one level down rather than the whole family
+            child_boxes = [sm.get_bounding_box() for sm in self.submobjects]
+            all_points = self.get_points()
+            if child_boxes:
+                all_points = np.vstack([
+                    all_points,
+                    *(
+                        box
+                        for sm, box in zip(self.submobjects, child_boxes)
+                        if sm._family_has_points
+                    )
+                ])
+        self._family_has_points = len(all_points) > 0
         if len(all_points) == 0:
             return np.zeros((3, self.dim))
         else:
@@ -445,6 +624,71 @@ class Mobject(object):
             (bb2[0] > bb1[2] + buff).any(),  # E.g. Left of mobject is right of self's right
         ))
 
+    # Packed point storage
+
+    def pack_family(self) -> Self:
+        """
+        Move the data of every family member with points into shared
+        buffers, one per data layout, each member's `data` becoming a view
+        into its buffer. Until the layout changes, family-wide point
+        functions (shift, scale, rotate, apply_matrix...), this mobject's
+        bounding box and its shader data each take one NumPy operation per
+        buffer instead of one per member.
+
+        The packing undoes itself, back to per-member storage, as soon as a
+        member's data is reallocated (its number of points changes) or the
+        family changes; call this again afterwards to repack.
+        """
+        groups: dict[tuple, list[Mobject]] = dict()
+        empty = []
+        for mob in dict.fromkeys(self.get_family()):
+            if mob.has_points():
+                key = (mob.data.dtype, tuple(mob.pointlike_data_keys))
+                groups.setdefault(key, []).append(mob)
+            else:
+                empty.append(mob)
+        packs = []
+        for (_, keys), members in groups.items():
+            buffer = np.concatenate([mob.data for mob in members])
+            lengths = [len(mob.data) for mob in members]
+            start = 0
+            for mob, length in zip(members, lengths):
+                mob.data = buffer[start:start + length]
+                start += length
+            packs.append((buffer, keys, members, lengths))
+        # Whether the packed points alone give the bounding box, which a
+        # member padding its own (a DotCloud's radius) rules out
+        exact_bounds = all(
+            type(mob).compute_bounding_box is Mobject.compute_bounding_box
+            for _, _, members, _ in packs
+            for mob in members
+            if mob is not self
+        )
+        self._packed = (self.get_family(), packs, empty, exact_bounds)
+        return self
+
+    def get_point_packs(self) -> list[tuple] | None:
+        """
+        The buffers set up by `pack_family`, as (buffer, pointlike keys,
+        members, lengths), or None when the family is not (or is no
+        longer) packed.
+        """
+        packed = getattr(self, "_packed", None)
+        if packed is None:
+            return None
+        family, packs, empty, _ = packed
+        if family is not self.family or not (
+            all(
+                mob.data.base is buffer and len(mob.data) == length
+                for buffer, _, members, lengths in packs
+                for mob, length in zip(members, lengths)
+            )
+            and all(len(mob.data) == 0 for mob in empty)
+        ):
+            self._packed = None
+            return None
+        return packs
+
     # Family matters
 
     def __getitem__(self, value: int | slice) -> Mobject:
@@ -572,18 +816,45 @@ class Mobject(object):
 
     # Submobject organization
 
+    @batches_updates
     def arrange(
         self,
         direction: Vect3 = RIGHT,
         center: bool = True,
         **kwargs
     ) -> Self:
-        for m1, m2 in zip(self.submobjects, self.submobjects[1:]):
-            m2.next_to(m1, direction, **kwargs)
+        submobs = self.submobjects
+        if len(submobs) > 1 and set(kwargs) <= {"buff", "aligned_edge", "coor_mask"} \
+                and _moves_by_bounding_box(submobs):
+            # Each next_to moves a submobject against the one before as
+            # it was after its own move, so the shifts are a running sum
+            # of the steps between neighbouring boxes
+            direction = np.asarray(direction)
+            aligned_edge = np.asarray(kwargs.get("aligned_edge", ORIGIN))
+            buff = kwargs.get("buff", DEFAULT_MOBJECT_TO_MOBJECT_BUFF)
+            coor_mask = np.asarray(kwargs.get("coor_mask", np.array([1, 1, 1])))
+            boxes = np.array([sm.get_bounding_box() for sm in submobs])
+            steps = _bounding_box_points(boxes[:-1], aligned_edge + direction) \
+                - _bounding_box_points(boxes[1:], aligned_edge - direction) \
+                + buff * direction
+            if (coor_mask == 1).all():
+                shifts = np.cumsum(steps, axis=0)
+            else:
+                shifts = np.zeros_like(steps)
+                total = np.zeros(3)
+                for index, step in enumerate(steps):
+                    total = (total + step) * coor_mask
+                    shifts[index] = total
+            for sm, shift in zip(submobs[1:], shifts):
+                sm.shift(shift)
+        else:
+            for m1, m2 in zip(submobs, submobs[1:]):
+                m2.next_to(m1, direction, **kwargs)
         if center:
             self.center()
         return self
 
+    @batches_updates
     def arrange_in_grid(
         self,
         n_rows: int | None = None,
@@ -616,19 +887,30 @@ class Mobject(object):
             if v_buff is None:
                 v_buff = v_buff_ratio * self[0].get_height()
 
-        x_unit = h_buff + max([sm.get_width() for sm in submobs])
-        y_unit = v_buff + max([sm.get_height() for sm in submobs])
+        boxes = np.array([sm.get_bounding_box() for sm in submobs])
+        x_unit = h_buff + (boxes[:, 2, 0] - boxes[:, 0, 0]).max()
+        y_unit = v_buff + (boxes[:, 2, 1] - boxes[:, 0, 1]).max()
 
-        for index, sm in enumerate(submobs):
-            if fill_rows_first:
-                x, y = index % n_cols, index // n_cols
-            else:
-                x, y = index // n_rows, index % n_rows
-            sm.move_to(ORIGIN, aligned_edge)
-            sm.shift(x * x_unit * RIGHT + y * y_unit * DOWN)
+        indices = np.arange(n_submobs)
+        if fill_rows_first:
+            xs, ys = indices % n_cols, indices // n_cols
+        else:
+            xs, ys = indices // n_rows, indices % n_rows
+        offsets = np.outer(xs * x_unit, RIGHT) + np.outer(ys * y_unit, DOWN)
+        if _moves_by_bounding_box(submobs):
+            # Moving the aligned edge to the origin, then out to its cell,
+            # is one shift per submobject
+            shifts = offsets - _bounding_box_points(boxes, aligned_edge)
+            for sm, shift in zip(submobs, shifts):
+                sm.shift(shift)
+        else:
+            for sm, offset in zip(submobs, offsets):
+                sm.move_to(ORIGIN, aligned_edge)
+                sm.shift(offset)
         self.center()
         return self
 
+    @batches_updates
     def arrange_to_fit_dim(self, length: float, dim: int, about_edge=ORIGIN) -> Self:
         ref_point = self.get_bounding_box_point(about_edge)
         n_submobs = len(self.submobjects)
@@ -685,7 +967,7 @@ class Mobject(object):
     def stash_mobject_pointers(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            uncopied_attrs = ["parents", "target", "saved_state"]
+            uncopied_attrs = ["parents", "target", "saved_state", "_packed"]
             stash = dict()
             for attr in uncopied_attrs:
                 if hasattr(self, attr):
@@ -714,7 +996,7 @@ class Mobject(object):
         if deep:
             return self.deepcopy()
 
-        result = copy.copy(self)
+        result = _shallow_copy(self)
 
         result.parents = []
         result.target = None
@@ -734,21 +1016,39 @@ class Mobject(object):
         result.submobjects = [sm.copy() for sm in self.submobjects]
         for sm in result.submobjects:
             sm.parents = [result]
-        result.family = [result, *it.chain(*(sm.get_family() for sm in result.submobjects))]
+        result.family = [
+            result,
+            *it.chain.from_iterable(sm.get_family() for sm in result.submobjects)
+        ]
 
         # Similarly, instead of calling match_updaters, since we know the status
         # won't have changed, just directly match.
         result.updaters = list(self.updaters)
+        result._updater_intervals = {
+            updater: [every, 0, 0.0]
+            for updater, (every, _, _) in self._updater_intervals.items()
+        }
+        result._updater_conventions = dict(self._updater_conventions)
+        result._wakes_updater_schedule = False
+        result._packed = None
         result._data_has_changed = True
+        result._data_version = next(_data_versions)
         result.shader_wrapper = None
 
-        family = self.get_family()
+        # Attributes naming a family member (axes.x_axis and the like) are
+        # pointed at that member's copy, found by position in the family
+        indices = None
         for attr, value in self.__dict__.items():
-            if isinstance(value, Mobject) and value is not self:
-                if value in family:
-                    setattr(result, attr, result.family[family.index(value)])
-            elif isinstance(value, np.ndarray):
-                setattr(result, attr, value.copy())
+            if type(value) in _SHARED_ATTRIBUTE_TYPES:
+                continue
+            if isinstance(value, np.ndarray):
+                setattr(result, attr, _copy_array(value))
+            elif isinstance(value, Mobject) and value is not self:
+                if indices is None:
+                    indices = family_member_indices(self.get_family())
+                index = indices.get(id(value))
+                if index is not None:
+                    setattr(result, attr, result.family[index])
         return result
 
     def generate_target(self, use_deepcopy: bool = False) -> Self:
@@ -779,6 +1079,7 @@ class Mobject(object):
             sm1.set_data(sm2.data)
             sm1.set_uniforms(sm2.uniforms)
             sm1.bounding_box[:] = sm2.bounding_box
+            sm1._family_has_points = sm2._family_has_points
             sm1.shader_folder = sm2.shader_folder
             sm1.texture_paths = sm2.texture_paths
             sm1.depth_test = sm2.depth_test
@@ -868,6 +1169,11 @@ class Mobject(object):
 
     def init_updaters(self):
         self.updaters: list[Updater] = list()
+        # Updaters run only every so many frames: updater -> [every,
+        # frames since it last ran, time since it last ran]
+        self._updater_intervals: dict[Updater, list] = dict()
+        # Whether each updater takes dt, read once when it is added
+        self._updater_conventions: dict[Updater, bool] = dict()
         self._has_updaters_in_family: Optional[bool] = False
         self.updating_suspended: bool = False
 
@@ -876,12 +1182,28 @@ class Mobject(object):
             return self
         if recurse:
             for submob in self.submobjects:
-                submob.update(dt, recurse)
+                if submob._has_updaters_in_family is not False:
+                    submob.update(dt, recurse)
         for updater in self.updaters:
-            # This is hacky, but if an updater takes dt as an arg,
-            # it will be passed the change in time from here
-            if "dt" in updater.__code__.co_varnames:
-                updater(self, dt=dt)
+            if self._updater_intervals and updater in self._updater_intervals and dt > 0:
+                # Count the frame, and run only once enough have passed,
+                # with the time since the last run as dt
+                interval = self._updater_intervals[updater]
+                interval[1] += 1
+                interval[2] += dt
+                if interval[1] < interval[0]:
+                    continue
+                updater_dt = interval[2]
+                interval[1:] = [0, 0.0]
+            else:
+                updater_dt = dt
+            takes_dt = self._updater_conventions.get(updater)
+            if takes_dt is None:
+                # Put in the updaters list directly, not through add_updater
+                takes_dt = updater_takes_dt(updater)
+                self._updater_conventions[updater] = takes_dt
+            if takes_dt:
+                updater(self, dt=updater_dt)
             else:
                 updater(self)
         return self
@@ -889,8 +1211,16 @@ class Mobject(object):
     def get_updaters(self) -> list[Updater]:
         return self.updaters
 
-    def add_updater(self, update_func: Updater, call: bool = True) -> Self:
+    def add_updater(self, update_func: Updater, call: bool = True, every: int = 1) -> Self:
+        """
+        Call `update_func` on each frame, or with `every` > 1, on only
+        every so many frames, passing it (if it takes dt) the time since
+        it last ran.  Calls with dt = 0, as when `call` is set, always run.
+        """
         self.updaters.append(update_func)
+        self._updater_conventions[update_func] = updater_takes_dt(update_func)
+        if every > 1:
+            self._updater_intervals[update_func] = [every, 0, 0.0]
         if call:
             self.update(dt=0)
         self.refresh_has_updater_status()
@@ -899,18 +1229,23 @@ class Mobject(object):
 
     def insert_updater(self, update_func: Updater, index=0):
         self.updaters.insert(index, update_func)
+        self._updater_conventions[update_func] = updater_takes_dt(update_func)
         self.refresh_has_updater_status()
         return self
 
     def remove_updater(self, update_func: Updater) -> Self:
         while update_func in self.updaters:
             self.updaters.remove(update_func)
+        self._updater_intervals.pop(update_func, None)
+        self._updater_conventions.pop(update_func, None)
         self.refresh_has_updater_status()
         return self
 
     def clear_updaters(self, recurse: bool = True) -> Self:
         for mob in self.get_family(recurse):
             mob.updaters = []
+            mob._updater_intervals = dict()
+            mob._updater_conventions = dict()
             mob._has_updaters_in_family = False
         for parent in self.get_ancestors():
             parent._has_updaters_in_family = False
@@ -918,6 +1253,11 @@ class Mobject(object):
 
     def match_updaters(self, mobject: Mobject) -> Self:
         self.updaters = list(mobject.updaters)
+        self._updater_intervals = {
+            updater: [every, 0, 0.0]
+            for updater, (every, _, _) in mobject._updater_intervals.items()
+        }
+        self._updater_conventions = dict(mobject._updater_conventions)
         self.refresh_has_updater_status()
         return self
 
@@ -948,6 +1288,8 @@ class Mobject(object):
         return self._has_updaters_in_family
 
     def refresh_has_updater_status(self) -> Self:
+        if self._wakes_updater_schedule and self._has_updaters_in_family is False:
+            Mobject._updater_epoch += 1
         self._has_updaters_in_family = None
         for parent in self.parents:
             parent.refresh_has_updater_status()
@@ -1370,6 +1712,7 @@ class Mobject(object):
             data[name][:] = rgba_array
         return self
 
+    @batches_updates
     def set_color_by_rgba_func(
         self,
         func: Callable[[Vect3Array], Vect4Array],
@@ -1382,6 +1725,7 @@ class Mobject(object):
             mob.set_rgba_array(func(mob.get_points()))
         return self
 
+    @batches_updates
     def set_color_by_rgb_func(
         self,
         func: Callable[[Vect3Array], Vect3Array],
@@ -1405,19 +1749,32 @@ class Mobject(object):
         name: str = "rgba",
         recurse: bool = True
     ) -> Self:
+        # Parsed once for the whole family rather than per member
+        rgbs = None if color is None else colors_to_rgbs(color)
+        uniform_opacity = opacity is None or isinstance(opacity, (float, int, np.floating))
+        packs = self.get_point_packs() if recurse else None
+        if packs is not None and uniform_opacity and (rgbs is None or len(rgbs) == 1) \
+                and all(name in buffer.dtype.names for buffer, _, _, _ in packs):
+            # One write per shared buffer, then the members without points
+            arrays = [buffer[name] for buffer, _, _, _ in packs]
+            arrays.extend(mob._data_defaults[name] for mob in self._packed[2])
+            for array in arrays:
+                if rgbs is not None:
+                    array[:, :3] = rgbs
+                if opacity is not None:
+                    array[:, 3] = opacity
+            return self
         for mob in self.get_family(recurse):
             data = mob.data if mob.has_points() > 0 else mob._data_defaults
-            if color is not None:
-                rgbs = np.array(list(map(color_to_rgb, listify(color))))
-                if 1 < len(rgbs):
-                    rgbs = resize_with_interpolation(rgbs, len(data))
-                data[name][:, :3] = rgbs
+            if rgbs is not None:
+                data[name][:, :3] = rgbs if len(rgbs) == 1 \
+                    else resize_with_interpolation(rgbs, len(data))
             if opacity is not None:
-                if not isinstance(opacity, (float, int, np.floating)):
-                    opacity = resize_with_interpolation(np.array(opacity), len(data))
-                data[name][:, 3] = opacity
+                data[name][:, 3] = opacity if uniform_opacity \
+                    else resize_with_interpolation(np.array(opacity), len(data))
         return self
 
+    @batches_updates
     def set_color(
         self,
         color: ManimColor | Iterable[ManimColor] | None,
@@ -1432,6 +1789,7 @@ class Mobject(object):
                 submob.set_color(color, recurse=True)
         return self
 
+    @batches_updates
     def set_opacity(
         self,
         opacity: float | Iterable[float] | None,
@@ -1459,6 +1817,7 @@ class Mobject(object):
             self.set_submobject_colors_by_gradient(*colors)
         return self
 
+    @batches_updates
     def set_submobject_colors_by_gradient(self, *colors: ManimColor) -> Self:
         if len(colors) == 0:
             raise Exception("Need at least one color")
@@ -2082,10 +2441,24 @@ class Mobject(object):
         family = self.family_members_with_points()
         batches = batch_by_property(family, lambda sm: sm.get_shader_wrapper(ctx).get_id())
 
+        packed = {
+            id(members[0]): (buffer, members)
+            for buffer, _, members, _ in self.get_point_packs() or ()
+        }
+
         result = []
         for submobs, sid in batches:
             shader_wrapper = submobs[0].shader_wrapper
-            data_list = [sm.get_shader_data() for sm in submobs]
+            buffer, members = packed.get(id(submobs[0]), (None, None))
+            if members == submobs and all(
+                type(sm).get_shader_data is Mobject.get_shader_data
+                and sm.get_shader_vert_indices() is None
+                for sm in submobs
+            ):
+                # The batch is one packed buffer, already concatenated
+                data_list = [buffer]
+            else:
+                data_list = [sm.get_shader_data() for sm in submobs]
             shader_wrapper.read_in(data_list)
             # The wrapper renders the whole batch but only knows
             # submobs[0] as self.mobject; paths that need per-mobject
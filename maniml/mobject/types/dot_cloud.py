@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numbers
+
 import moderngl
 import numpy as np
 
@@ -7,13 +9,16 @@ from maniml.constants import GREY_C, YELLOW
 from maniml.constants import ORIGIN, NULL_POINTS
 from maniml.mobject.mobject import Mobject
 from maniml.mobject.types.point_cloud_mobject import PMobject
+from maniml.utils.color import color_to_rgb
+from maniml.utils.color import color_to_rgba
+from maniml.utils.color import rgb_to_hex
 from maniml.utils.iterables import resize_with_interpolation
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import numpy.typing as npt
-    from typing import Sequence, Tuple
+    from typing import Iterable, Iterator, Sequence, Tuple
     from maniml.typing import ManimColor, Vect3, Vect3Array, Self
 
 
@@ -157,6 +162,98 @@ class DotCloud(PMobject):
         return self
 
 
+class DotArray(DotCloud):
+    """
+    Many dots as one mobject, each a row of its data rather than a
+    mobject of its own, for scenes with tens of thousands of them.
+    `view` gives a DotView onto one dot, or a slice or index array of
+    them, which moves and styles them in place:
+
+        dots = DotArray.from_dots(Dot(point) for point in points)
+        dots.view(3).set_color(RED)
+        dots.view(np.s_[::2]).shift(UP)
+
+    It is still one mobject with no submobjects, so iterating or
+    unpacking it (`Group(*dots)`, `LaggedStartMap(FadeIn, dots)`) finds
+    no dots; `views` is what walks them.
+    """
+    @classmethod
+    def from_dots(cls, dots: Iterable[Mobject], **kwargs) -> DotArray:
+        """
+        A DotArray standing in for `dots`, taking each one's center,
+        radius (half its width), color and opacity
+        """
+        dots = list(dots)
+        result = cls(np.array([dot.get_center() for dot in dots]).reshape((-1, 3)), **kwargs)
+        if dots:
+            result.set_radii([dot.get_width() / 2 for dot in dots])
+            result.data["rgba"][:] = [
+                color_to_rgba(dot.get_color(), dot.get_opacity())
+                for dot in dots
+            ]
+        return result
+
+    def view(self, index: int | slice | npt.ArrayLike) -> DotView:
+        num_dots = self.get_num_points()
+        if isinstance(index, numbers.Integral) and not -num_dots <= index < num_dots:
+            raise IndexError(f"DotArray index {index} out of range")
+        return DotView(self, index)
+
+    def views(self) -> Iterator[DotView]:
+        return (DotView(self, index) for index in range(self.get_num_points()))
+
+
+class DotView:
+    """Some dots of a DotArray, by index, which it moves and styles in place"""
+    __slots__ = ("array", "index")
+
+    def __init__(self, array: DotArray, index: int | slice | npt.ArrayLike):
+        self.array = array
+        self.index = index
+
+    def note_changed(self) -> Self:
+        self.array.note_changed_data()
+        self.array.refresh_bounding_box()
+        return self
+
+    def get_points(self) -> Vect3Array:
+        return np.reshape(self.array.get_points()[self.index], (-1, 3))
+
+    def get_center(self) -> Vect3:
+        points = self.get_points()
+        return (points.min(0) + points.max(0)) / 2
+
+    def shift(self, vector: Vect3) -> Self:
+        self.array.data["point"][self.index] += vector
+        return self.note_changed()
+
+    def move_to(self, point: Vect3) -> Self:
+        return self.shift(np.asarray(point) - self.get_center())
+
+    def get_radius(self) -> float:
+        return float(np.max(self.array.data["radius"][self.index]))
+
+    def set_radius(self, radius: float) -> Self:
+        self.array.data["radius"][self.index] = radius
+        return self.note_changed()
+
+    def get_color(self) -> str:
+        return rgb_to_hex(np.reshape(self.array.data["rgba"][self.index], (-1, 4))[0, :3])
+
+    def get_opacity(self) -> float:
+        return float(np.reshape(self.array.data["rgba"][self.index], (-1, 4))[0, 3])
+
+    def set_color(self, color: ManimColor, opacity: float | None = None) -> Self:
+        self.array.data["rgba"][self.index, :3] = color_to_rgb(color)
+        if opacity is not None:
+            self.array.data["rgba"][self.index, 3] = opacity
+        return self.note_changed()
+
+    def set_opacity(self, opacity: float) -> Self:
+        self.array.data["rgba"][self.index, 3] = opacity
+        return self.note_changed()
+
+
 class TrueDot(DotCloud):
     def __init__(self, center: Vect3 = ORIGIN, **kwargs):
         super().__init__(points=np.array([center]), **kwargs)
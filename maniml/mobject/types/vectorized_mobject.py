@@ -211,6 +211,7 @@ class VMobject(Mobject):
         self.set_stroke(color, width, behind=True)
         return self
 
+    @Mobject.batches_updates
     @Mobject.affects_family_data
     def set_style(
         self,
@@ -286,6 +287,7 @@ class VMobject(Mobject):
                 sm1.match_style(sm2)
         return self
 
+    @Mobject.batches_updates
     def set_color(
         self,
         color: ManimColor | Iterable[ManimColor] | None,
@@ -296,6 +298,7 @@ class VMobject(Mobject):
         self.set_stroke(color, opacity=opacity, recurse=recurse)
         return self
 
+    @Mobject.batches_updates
     def set_opacity(
         self,
         opacity: float | Iterable[float] | None,
@@ -309,6 +312,7 @@ class VMobject(Mobject):
         self.set_uniform(recurse, anti_alias_width=anti_alias_width)
         return self
 
+    @Mobject.batches_updates
     def fade(self, darkness: float = 0.5, recurse: bool = True) -> Self:
         mobs = self.get_family() if recurse else [self]
         for mob in mobs:
@@ -365,6 +365,8 @@ class CheckpointMixin:
             self.animation_checkpoints[self.current_animation_index] = checkpoint
         else:
             self.animation_checkpoints.append(checkpoint)
+        if self._checkpoint_images is not None:
+            self._save_checkpoint_image()
 
     def _remember_scene_filepath(self) -> None:
         """Record the user's scene file path from the stack if not yet known."""
@@ -718,6 +720,14 @@ def _rebind_functions(old_namespace: dict, new_namespace: dict, memo: dict) -> N
     for value in list(memo.values()):
         if isinstance(value, Mobject) and getattr(value, 'updaters', None):
             value.updaters = [rebind(u) for u in value.updaters]
+            if getattr(value, '_updater_intervals', None):
+                value._updater_intervals = {
+                    rebind(u): interval for u, interval in value._updater_intervals.items()
+                }
+            if getattr(value, '_updater_conventions', None):
+                value._updater_conventions = {
+                    rebind(u): takes_dt for u, takes_dt in value._updater_conventions.items()
+                }
 
 
 def deepcopy_namespace(namespace_or_checkpoint):
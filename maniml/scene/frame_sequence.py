@@ -0,0 +1,143 @@
+"""Image-sequence output for SceneFileWriter, for compositing pipelines
+that want frames rather than one ffmpeg movie.
+
+Two shapes:
+
+- ``png`` / ``exr``: one numbered file per frame in ``<name>_frames/``.
+  The render thread only reads the framebuffer back; encoding runs on an
+  `ImageEncoder` pool (utils/images.py), which bounds the frames waiting.
+  EXR frames are half-float, read back as floats, and need the optional
+  ``OpenEXR`` package.
+- ``rgba``: no encoding at all. Frames are read straight from the GPU
+  into one preallocated, memory-mapped ``<name>.rgba`` file: a 64-byte
+  header, then every frame's raw RGBA8 bytes back to back, rows
+  bottom-up as OpenGL stores them. `read_rgba_frames` maps it back as
+  an array without copying.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from maniml.utils.images import ImageEncoder, write_png
+
+if TYPE_CHECKING:
+    from maniml.camera.camera import Camera
+
+SEQUENCE_FORMATS = ("png", "exr", "rgba")
+
+RGBA_MAGIC = b"MNMLRGBA"
+RGBA_VERSION = 1
+# magic, version, width, height, channels, fps, frame count; padded to
+# HEADER_SIZE so frame data starts on a cache-line boundary
+RGBA_HEADER = struct.Struct("<8sIIIIdQ")
+HEADER_SIZE = 64
+
+
+def _write_exr(path: str, size: tuple[int, int], raw: bytes) -> None:
+    import OpenEXR
+
+    width, height = size
+    pixels = np.frombuffer(raw, dtype=np.float32).reshape(height, width, 4)
+    header = {"compression": OpenEXR.ZIP_COMPRESSION, "type": OpenEXR.scanlineimage}
+    channels = {"RGBA": np.ascontiguousarray(pixels[::-1], dtype=np.float16)}
+    with OpenEXR.File(header, channels) as file:
+        file.write(path)
+
+
+class ImageSequenceWriter:
+    """Numbered PNG or EXR files, encoded off the render thread."""
+
+    def __init__(self, directory: str | Path, fmt: str, workers: int | None = None):
+        if fmt == "exr":
+            try:
+                import OpenEXR  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "EXR frames need the OpenEXR package: pip install OpenEXR"
+                ) from None
+        self.path = Path(directory)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.format = fmt
+        self.frames = 0
+        self._write = _write_exr if fmt == "exr" else write_png
+        self._encoder = ImageEncoder(workers, name="maniml-frames")
+
+    def write_frame(self, camera: Camera) -> None:
+        raw = camera.get_raw_fbo_data(dtype="f4" if self.format == "exr" else "f1")
+        path = self.path / f"{self.frames:05d}.{self.format}"
+        self._encoder.submit(self._write, str(path), camera.get_pixel_shape(), raw)
+        self.frames += 1
+
+    def close(self) -> None:
+        """Wait for every queued frame; re-raises the first encode error."""
+        self._encoder.close()
+
+
+class RawFrameFile:
+    """Raw RGBA8 frames in one memory-mapped file, read back from the GPU
+    directly into the map.
+
+    The file is preallocated for `capacity` frames (the scene's expected
+    frame count when known) and doubles when a render runs past it; close
+    trims it to the frames actually written and records their count."""
+
+    def __init__(self, path: str | Path, size: tuple[int, int], fps: float, capacity: int = 0):
+        self.path = Path(path)
+        self.width, self.height = size
+        self.fps = fps
+        self.frame_nbytes = self.width * self.height * 4
+        self.frames = 0
+        self._file = open(self.path, "w+b")
+        self._map = None
+        self._capacity = 0
+        self._grow(max(capacity, 1))
+
+    def _grow(self, capacity: int) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._capacity = capacity
+        self._file.truncate(HEADER_SIZE + capacity * self.frame_nbytes)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._write_header()
+
+    def _write_header(self) -> None:
+        RGBA_HEADER.pack_into(
+            self._map, 0, RGBA_MAGIC, RGBA_VERSION, self.width, self.height,
+            4, float(self.fps), self.frames)
+
+    def write_frame(self, camera: Camera) -> None:
+        if self.frames == self._capacity:
+            self._grow(2 * self._capacity)
+        camera.read_raw_fbo_into(
+            self._map, HEADER_SIZE + self.frames * self.frame_nbytes)
+        self.frames += 1
+
+    def close(self) -> None:
+        self._write_header()
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(HEADER_SIZE + self.frames * self.frame_nbytes)
+        self._file.close()
+
+
+def read_rgba_frames(path: str | Path) -> tuple[np.ndarray, float]:
+    """Map a ``.rgba`` file as a read-only (frames, height, width, 4)
+    uint8 array, rows top-down, without reading or copying it; returns
+    (frames, fps)."""
+    with open(path, "rb") as f:
+        header = f.read(RGBA_HEADER.size)
+    magic, version, width, height, channels, fps, count = RGBA_HEADER.unpack(header)
+    if magic != RGBA_MAGIC or version != RGBA_VERSION:
+        raise ValueError(f"not a maniml RGBA frame file: {path}")
+    if count == 0:
+        return np.zeros((0, height, width, channels), np.uint8), fps
+    frames = np.memmap(
+        path, dtype=np.uint8, mode="r", offset=HEADER_SIZE,
+        shape=(count, height, width, channels))
+    return frames[:, ::-1], fps
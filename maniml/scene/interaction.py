@@ -33,17 +33,7 @@ class InteractionMixin:
     def _name_of(self, mobject) -> str | None:
         """Variable name of a live mobject in the current animation's
         namespace — or of the container (e.g. VGroup) holding it."""
-        items = [
-            (name, value) for name, value in self._live_namespace.items()
-            if not name.startswith('_') and name != 'self'
-        ]
-        for name, value in items:
-            if value is mobject:
-                return name
-        for name, value in items:
-            if isinstance(value, Mobject) and mobject in value.get_family():
-                return name
-        return None
+        return self._name_index.name_of(self._live_namespace, mobject)
 
     def _begin_grab(self, mobject: Mobject, point) -> None:
         name = self._name_of(mobject)
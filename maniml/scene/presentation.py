@@ -11,9 +11,32 @@ import os
 import numpy as np
 
 from maniml.mobject.mobject import Group
+from maniml.utils.images import ImageEncoder, write_png
+
+
+class CheckpointImageWriter:
+    """Writes checkpoint snapshots as numbered PNGs through an
+    `ImageEncoder`, so a burst of checkpoints costs the render thread
+    only the framebuffer reads."""
+
+    def __init__(self, image_dir: str, workers: int | None = None):
+        self.image_dir = image_dir
+        self._encoder = ImageEncoder(workers, name="maniml-png")
+
+    def submit(self, index: int, size: tuple[int, int], raw: bytes) -> None:
+        path = os.path.join(self.image_dir, f"{index:03d}.png")
+        self._encoder.submit(write_png, path, size, raw)
+
+    def close(self) -> None:
+        """Wait for every queued image; re-raises the first encode error."""
+        self._encoder.close()
 
 
 class PresentationMixin:
+    # Set for the duration of _render_all: every checkpoint saved is
+    # snapshotted as it is saved (see CheckpointMixin._save_checkpoint)
+    _checkpoint_images: CheckpointImageWriter | None = None
+
     def _prepare_presentation(self) -> None:
         """Pre-run every animation unit (skipped, so it takes seconds)
         to validate the whole scene and build every checkpoint, then
@@ -31,33 +54,32 @@ class PresentationMixin:
 
     def _render_all(self) -> None:
         """Run every unit at full speed so frames reach the file writer,
-        saving a PNG snapshot of each checkpoint along the way."""
+        saving a PNG snapshot of each checkpoint along the way.
+
+        Snapshots are taken as each checkpoint is saved, so a unit that
+        saves several (play() in a loop) costs no restores afterwards."""
         image_dir = os.path.join(
             self.file_writer.output_directory,
             f"{self.file_writer.get_output_file_name()}_checkpoints",
         )
         os.makedirs(image_dir, exist_ok=True)
-        self._save_checkpoint_image(image_dir)  # initial (empty) state
-        while True:
-            last_index = self.current_animation_index
-            self.run_next_animation()
-            final = self.current_animation_index
-            if final == last_index:
-                break
-            if final == last_index + 1:
-                self._save_checkpoint_image(image_dir)
-            else:
-                # One unit produced several checkpoints (e.g. play() in a
-                # loop): restore each to capture its snapshot
-                for i in range(last_index + 1, final + 1):
-                    self._restore_checkpoint_for_display(i)
-                    self._save_checkpoint_image(image_dir)
+        self._checkpoint_images = CheckpointImageWriter(image_dir)
+        try:
+            self._save_checkpoint_image()  # initial (empty) state
+            self._run_all_units()
+        finally:
+            images, self._checkpoint_images = self._checkpoint_images, None
+            images.close()
         print(f"Wrote {self.current_animation_index + 1} checkpoint images to {image_dir}")
 
-    def _save_checkpoint_image(self, image_dir: str) -> None:
+    def _save_checkpoint_image(self) -> None:
+        """Queue the current frame as the current checkpoint's PNG."""
         self.update_frame(dt=0, force_draw=True)
-        path = os.path.join(image_dir, f"{self.current_animation_index:03d}.png")
-        self.get_image().save(path)
+        self._checkpoint_images.submit(
+            self.current_animation_index,
+            self.camera.get_pixel_shape(),
+            self.camera.get_raw_fbo_data(),
+        )
 
     # Presentation timeline (clickable checkpoint scrubber)
 
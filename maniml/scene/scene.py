@@ -27,8 +27,11 @@ from maniml.mobject.types.vectorized_mobject import VGroup
 from maniml.mobject.types.vectorized_mobject import VMobject
 from maniml.scene.scene_file_writer import SceneFileWriter
 from maniml.utils.dict_ops import merge_dicts_recursively
+from maniml.utils.family_ops import FamilyIndex
 from maniml.utils.family_ops import extract_mobject_family_members
 from maniml.utils.family_ops import recursive_mobject_remove
+from maniml.utils.hit_testing import BoundingBoxIndex
+from maniml.utils.hit_testing import NameIndex
 from maniml.utils.iterables import batch_by_property
 from maniml.utils.sounds import play_sound
 from maniml.utils.color import color_to_rgba
@@ -152,6 +155,10 @@ class Scene(CheckpointMixin, InteractionMixin, PresentationMixin):
         self._processing_key = False  # Flag to prevent re-entry during key processing
         self._source_units_cache = None  # ((path, mtime), units) for the parsed scene file
         self._live_namespace = {}  # Variable name -> live (on-screen) object, for click-to-inspect
+        self._name_index = NameIndex()  # Reverse of _live_namespace
+        self._hit_index = BoundingBoxIndex()  # For point_to_mobject
+        self._family_index = FamilyIndex()  # What holds each mobject on screen
+        self._updating = None  # (mobjects list, its length, epoch, those to update)
 
         # Run modes (set by __main__)
         self._present_mode = False  # Pre-built checkpoints, watcher off, timeline scrubber
@@ -377,7 +384,8 @@ class Scene(CheckpointMixin, InteractionMixin, PresentationMixin):
             self.window._window.dispatch_events()
             return
 
-        self.camera.capture(*self.render_groups)
+        if self._web_viewer is None or self._web_viewer.needs_capture():
+            self.camera.capture(*self.render_groups)
 
         if self._web_viewer is not None:
             self._web_viewer.on_frame_rendered()
@@ -394,12 +402,35 @@ class Scene(CheckpointMixin, InteractionMixin, PresentationMixin):
     # Related to updating
 
     def update_mobjects(self, dt: float) -> None:
-        for mobject in self.mobjects:
+        for mobject in self.get_updating_mobjects():
             mobject.update(dt)
 
+    def get_updating_mobjects(self) -> list[Mobject]:
+        """
+        The mobjects of the scene with updaters somewhere in their family,
+        in scene order, so a frame need not visit the static ones.
+
+        Recomputed when the mobject list changes, or when one of the others
+        may have gained an updater: each is flagged to bump
+        Mobject._updater_epoch when its updater status next changes.
+        """
+        cached = self._updating
+        if cached is not None and cached[0] is self.mobjects \
+                and cached[1] == len(self.mobjects) \
+                and cached[2] == Mobject._updater_epoch:
+            return cached[3]
+        updating = []
+        for mob in self.mobjects:
+            if mob.has_updaters():
+                updating.append(mob)
+            else:
+                mob._wakes_updater_schedule = True
+        self._updating = (self.mobjects, len(self.mobjects), Mobject._updater_epoch, updating)
+        return updating
+
     def should_update_mobjects(self) -> bool:
         return self.always_update_mobjects or any(
-            mob.has_updaters() for mob in self.mobjects
+            mob.has_updaters() for mob in self.get_updating_mobjects()
         )
 
     # Related to time
@@ -415,16 +446,8 @@ class Scene(CheckpointMixin, InteractionMixin, PresentationMixin):
     def get_top_level_mobjects(self) -> list[Mobject]:
         # Return only those which are not in the family
         # of another mobject from the scene
-        mobjects = self.get_mobjects()
-        families = [m.get_family() for m in mobjects]
-
-        def is_top_level(mobject):
-            num_families = sum([
-                (mobject in family)
-                for family in families
-            ])
-            return num_families == 1
-        return list(filter(is_top_level, mobjects))
+        holders = self._family_index.holders(self.mobjects)
+        return [m for m in self.get_mobjects() if len(holders[id(m)]) == 1]
 
     def get_mobject_family_members(self) -> list[Mobject]:
         return extract_mobject_family_members(self.mobjects)
@@ -456,6 +479,7 @@ class Scene(CheckpointMixin, InteractionMixin, PresentationMixin):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             func(self, *args, **kwargs)
+            self._updating = None
             self.assemble_render_groups()
             return self
         return wrapper
@@ -514,7 +538,19 @@ class Scene(CheckpointMixin, InteractionMixin, PresentationMixin):
         the desired behavior is for the scene to then include m2 and m3 (ungrouped).
         """
         to_remove = set(extract_mobject_family_members(mobjects_to_remove))
-        new_mobjects, _ = recursive_mobject_remove(self.mobjects, to_remove)
+        holders = self._family_index.holders(self.mobjects)
+        # Only the mobjects holding something to remove need walking
+        affected = {
+            id(holder)
+            for mob in to_remove
+            for holder in holders.get(id(mob), ())
+        }
+        new_mobjects = []
+        for mob in self.mobjects:
+            if id(mob) in affected:
+                new_mobjects.extend(recursive_mobject_remove([mob], to_remove)[0])
+            else:
+                new_mobjects.append(mob)
         self.mobjects = new_mobjects
 
     @affects_mobject_list
@@ -555,10 +591,7 @@ class Scene(CheckpointMixin, InteractionMixin, PresentationMixin):
         """
         if search_set is None:
             search_set = self.mobjects
-        for mobject in reversed(search_set):
-            if mobject.is_point_touching(point, buff=buff):
-                return mobject
-        return None
+        return self._hit_index.topmost(list(search_set), point, buff=buff)
 
     def get_group(self, *mobjects):
         if all(isinstance(m, VMobject) for m in mobjects):
@@ -681,7 +714,7 @@ class Scene(CheckpointMixin, InteractionMixin, PresentationMixin):
         self.num_plays += 1
 
     def begin_animations(self, animations: Iterable[Animation]) -> None:
-        all_mobjects = set(self.get_mobject_family_members())
+        holders = self._family_index.holders(self.mobjects)
         for animation in animations:
             animation.begin()
             # Anything animated that's not already in the
@@ -689,9 +722,9 @@ class Scene(CheckpointMixin, InteractionMixin, PresentationMixin):
             # animated mobjects that are in the family of
             # those on screen, this can result in a restructuring
             # of the scene.mobjects list, which is usually desired.
-            if animation.mobject not in all_mobjects:
+            if id(animation.mobject) not in holders:
                 self.add(animation.mobject)
-                all_mobjects = all_mobjects.union(animation.mobject.get_family())
+                holders = self._family_index.holders(self.mobjects)
 
     def progress_through_animations(self, animations: Iterable[Animation]) -> None:
         if self.window:
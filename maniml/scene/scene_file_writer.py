@@ -17,6 +17,11 @@ from pathlib import Path
 
 from maniml.logger import log
 from maniml.mobject.mobject import Mobject
+from maniml.scene.frame_sequence import (
+    SEQUENCE_FORMATS,
+    ImageSequenceWriter,
+    RawFrameFile,
+)
 from maniml.utils.file_ops import guarantee_existence
 from maniml.utils.sounds import get_full_sound_file_path
 
@@ -34,6 +39,9 @@ class FFmpegError(RuntimeError):
 
 
 class SceneFileWriter(object):
+    # Open image-sequence writer; None unless image_sequence is set
+    frame_sequence: ImageSequenceWriter | RawFrameFile | None = None
+
     def __init__(
         self,
         scene: Scene,
@@ -56,7 +64,17 @@ class SceneFileWriter(object):
         pixel_format: str = "yuv420p",
         saturation: float = 1.0,
         gamma: float = 1.0,
+        # Write frames as an image sequence instead of a movie: "png" or
+        # "exr" files, or "rgba" for one raw memory-mapped file (see
+        # frame_sequence.py); sequence_workers sizes the encoder pool
+        image_sequence: str | None = None,
+        sequence_workers: int | None = None,
     ):
+        if image_sequence is not None and image_sequence not in SEQUENCE_FORMATS:
+            raise ValueError(
+                f"image_sequence must be one of {', '.join(SEQUENCE_FORMATS)}, "
+                f"not {image_sequence!r}"
+            )
         self.scene: Scene = scene
         self.write_to_movie = write_to_movie
         self.subdivide_output = subdivide_output
@@ -75,12 +93,18 @@ class SceneFileWriter(object):
         self.pixel_format = pixel_format
         self.saturation = saturation
         self.gamma = gamma
+        self.image_sequence = image_sequence
+        self.sequence_workers = sequence_workers
+        if image_sequence:
+            # The sequence takes the frames ffmpeg would have
+            self.write_to_movie = False
 
         # State during file writing
         self.writing_process: sp.Popen | None = None
         self.progress_display: ProgressDisplay | None = None
         self.ended_with_interrupt: bool = False
         self._movie_staging_dir: Path | None = None
+        self.frames_written: int = 0
 
         self.init_output_directories()
         self.init_audio()
@@ -190,6 +214,8 @@ class SceneFileWriter(object):
 
     # Writers
     def begin(self) -> None:
+        if self.image_sequence:
+            self.open_frame_sequence()
         if not self.subdivide_output and self.write_to_movie:
             self.open_movie_pipe(self.get_movie_file_path())
 
@@ -202,6 +228,8 @@ class SceneFileWriter(object):
             self.close_movie_pipe()
 
     def finish(self) -> None:
+        if self.frame_sequence is not None:
+            self.close_frame_sequence()
         if not self.subdivide_output and self.write_to_movie:
             self.close_movie_pipe()
             if self.includes_sound:
@@ -319,7 +347,33 @@ class SceneFileWriter(object):
             full_desc += " " * (desc_len - len(full_desc))
         self.progress_display.set_description(full_desc)
 
+    # Image sequences
+    def get_frame_sequence_path(self) -> Path:
+        rootname = self.get_output_file_rootname()
+        if self.image_sequence == "rgba":
+            return rootname.with_suffix(".rgba")
+        return rootname.with_name(f"{rootname.name}_frames")
+
+    def open_frame_sequence(self) -> None:
+        path = self.get_frame_sequence_path()
+        if self.image_sequence == "rgba":
+            camera = self.scene.camera
+            self.frame_sequence = RawFrameFile(
+                path, camera.get_pixel_shape(), camera.fps, self.total_frames)
+        else:
+            self.frame_sequence = ImageSequenceWriter(
+                path, self.image_sequence, self.sequence_workers)
+
+    def close_frame_sequence(self) -> None:
+        sequence, self.frame_sequence = self.frame_sequence, None
+        sequence.close()
+        if not self.quiet:
+            log.info(f"{sequence.frames} frames written to {sequence.path}")
+
     def write_frame(self, camera: Camera) -> None:
+        if self.frame_sequence is not None:
+            self.frame_sequence.write_frame(camera)
+            self.frames_written += 1
         if self.write_to_movie:
             raw_bytes = camera.get_raw_fbo_data()
             process = self.writing_process
@@ -336,6 +390,7 @@ class SceneFileWriter(object):
                 raise FFmpegError(
                     f"ffmpeg exited early with status {process.returncode}"
                 ) from exc
+            self.frames_written += 1
             if self.progress_display is not None:
                 self.progress_display.update()
 
@@ -409,6 +464,10 @@ class SceneFileWriter(object):
                 self.progress_display.close()
                 self.progress_display = None
             self._cleanup_movie_staging()
+            if self.frame_sequence is not None:
+                # Keep what was written; a partial sequence is still frames
+                self.frame_sequence, sequence = None, self.frame_sequence
+                sequence.close()
 
     def _cleanup_movie_staging(self) -> None:
         staging_dir = self._movie_staging_dir
@@ -19,15 +19,39 @@ if TYPE_CHECKING:
     from maniml.typing import ManimColor, Vect3, Vect4, Vect3Array, Vect4Array, NDArray
 
 
+# Hex codes and color names already parsed, to their rgb, since styling
+# a large family would otherwise parse the same few strings per member
+_parsed_colors: dict[str, tuple[float, float, float]] = dict()
+MAX_PARSED_COLORS = 4096
+
+
 def color_to_rgb(color: ManimColor) -> Vect3:
     if isinstance(color, str):
-        return hex_to_rgb(color)
+        rgb = _parsed_colors.get(color)
+        if rgb is None:
+            if len(_parsed_colors) >= MAX_PARSED_COLORS:
+                _parsed_colors.clear()
+            if color.startswith("#"):
+                rgb = tuple(hex_to_rgb(color))
+            else:
+                rgb = Color(color).get_rgb()
+            _parsed_colors[color] = rgb
+        return np.array(rgb)
     elif isinstance(color, Color):
         return np.array(color.get_rgb())
     else:
         raise Exception("Invalid color type")
 
 
+def colors_to_rgbs(colors: ManimColor | Iterable[ManimColor]) -> Vect3Array:
+    """
+    The rgb of each of `colors`, or of a lone color, as a (k, 3) array
+    """
+    if isinstance(colors, (str, Color)):
+        return color_to_rgb(colors)[np.newaxis]
+    return np.array([color_to_rgb(color) for color in colors]).reshape((-1, 3))
+
+
 def color_to_rgba(color: ManimColor, alpha: float = 1.0) -> Vect4:
     return np.array([*color_to_rgb(color), alpha])
 
@@ -76,22 +100,34 @@ def int_to_hex(rgb_int: int) -> str:
     return f"#{rgb_int:06x}".upper()
 
 
-def color_gradient(
+def rgb_gradient(
     reference_colors: Iterable[ManimColor],
     length_of_output: int
-) -> list[Color]:
+) -> Vect3Array:
+    """
+    The rgbs of color_gradient, as one (length_of_output, 3) array
+    """
     if length_of_output == 0:
-        return []
-    rgbs = list(map(color_to_rgb, reference_colors))
+        return np.zeros((0, 3))
+    rgbs = colors_to_rgbs(list(reference_colors))
     alphas = np.linspace(0, (len(rgbs) - 1), length_of_output)
     floors = alphas.astype('int')
     alphas_mod1 = alphas % 1
     # End edge case
     alphas_mod1[-1] = 1
     floors[-1] = len(rgbs) - 2
+    return np.sqrt(interpolate(
+        rgbs[floors]**2, rgbs[floors + 1]**2, alphas_mod1[:, np.newaxis]
+    ))
+
+
+def color_gradient(
+    reference_colors: Iterable[ManimColor],
+    length_of_output: int
+) -> list[Color]:
     return [
-        rgb_to_color(np.sqrt(interpolate(rgbs[i]**2, rgbs[i + 1]**2, alpha)))
-        for i, alpha in zip(floors, alphas_mod1)
+        rgb_to_color(rgb)
+        for rgb in rgb_gradient(reference_colors, length_of_output)
     ]
 
 
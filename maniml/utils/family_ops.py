@@ -20,6 +20,17 @@ def extract_mobject_family_members(
     ]
 
 
+def family_member_indices(family: Iterable[Mobject]) -> dict[int, int]:
+    """
+    Maps id(member) to the member's first index in `family`, so a copy of
+    the family can be indexed in its place without a search per member
+    """
+    indices = dict()
+    for index, mob in enumerate(family):
+        indices.setdefault(id(mob), index)
+    return indices
+
+
 def recursive_mobject_remove(mobjects: List[Mobject], to_remove: Set[Mobject]) -> Tuple[List[Mobject], bool]:
     """
     Takes in a list of mobjects, together with a set of mobjects to remove.
@@ -45,4 +56,53 @@ def recursive_mobject_remove(mobjects: List[Mobject], to_remove: Set[Mobject]) -
             found_in_list = True
         else:
             result.append(mob)
-    return result, found_in_list
\ No newline at end of file
+    return result, found_in_list
+
+
+class FamilyIndex:
+    """
+    Which mobjects of a list hold each mobject in their families, so a
+    scene can ask "is this on screen?" or "what holds this?" without
+    searching every family.
+
+    The index is checked against the list on each query rather than told
+    of changes. Any structural change below a mobject gives it a new
+    family list (see Mobject.note_changed_family), so comparing each
+    listed mobject's family to the one indexed, by identity, catches
+    `Mobject.add` as well as scene `add` and `remove`. Mobjects appended
+    to an unchanged list are indexed on their own; anything else rebuilds.
+    """
+
+    def __init__(self):
+        # Holding the families (not just their ids) keeps every indexed
+        # member alive, so no id in the map can be reused unnoticed
+        self._mobjects: list[Mobject] = []
+        self._families: list[list[Mobject]] = []
+        self._holders: dict[int, list[Mobject]] = dict()
+
+    def holders(self, mobjects: List[Mobject]) -> dict[int, list[Mobject]]:
+        """
+        Maps id(member) to the mobjects of `mobjects` whose family holds
+        the member, once per appearance in the list. A member not held
+        by any of them has no entry.
+        """
+        families = [mob.get_family() for mob in mobjects]
+        known = len(self._mobjects)
+        if known > len(mobjects) or any(
+            new is not old
+            for new, old in zip(mobjects, self._mobjects)
+        ) or any(
+            new is not old
+            for new, old in zip(families, self._families)
+        ):
+            self._holders = dict()
+            known = 0
+        for mob, family in zip(mobjects[known:], families[known:]):
+            seen = set()
+            for member in family:
+                if id(member) not in seen:
+                    seen.add(id(member))
+                    self._holders.setdefault(id(member), []).append(mob)
+        self._mobjects = list(mobjects)
+        self._families = families
+        return self._holders
@@ -0,0 +1,96 @@
+"""Point hit testing over many mobjects, and naming them for the user.
+
+`BoundingBoxIndex` keeps the bounding boxes of a list of mobjects stacked
+in one array, so a point is tested against all of them in one NumPy
+operation rather than one `is_point_touching` call each. A box is re-read
+only for a mobject whose data changed since the last query: any change
+below a mobject takes a new `_data_version` all the way up (see
+`Mobject.note_changed_data`), so the version of the mobject in the list
+says whether its box can still be trusted.
+
+`NameIndex` answers "which variable is this?" for click-to-inspect from a
+reverse map of the scene's namespace, rebuilt only when a name is rebound
+or a named mobject's family changes.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Sequence
+
+    from maniml.mobject.mobject import Mobject
+    from maniml.typing import Vect3
+
+
+class BoundingBoxIndex:
+    """The (min, max) corners of each mobject in the last list queried."""
+
+    def __init__(self):
+        self._mobjects: list[Mobject] = []
+        self._versions: list[int | None] = []
+        self._boxes = np.zeros((0, 2, 3))
+
+    def _refresh(self, mobjects: Sequence[Mobject]) -> None:
+        if len(mobjects) != len(self._mobjects) or any(
+            new is not old for new, old in zip(mobjects, self._mobjects)
+        ):
+            self._mobjects = list(mobjects)
+            self._versions = [None] * len(mobjects)
+            self._boxes = np.zeros((len(mobjects), 2, 3))
+        for index, mob in enumerate(self._mobjects):
+            if mob._data_version != self._versions[index] or mob._needs_new_bounding_box:
+                box = mob.get_bounding_box()
+                self._boxes[index, 0] = box[0]
+                self._boxes[index, 1] = box[2]
+                self._versions[index] = mob._data_version
+
+    def touching(self, mobjects: Sequence[Mobject], point: Vect3, buff: float = 0) -> np.ndarray:
+        """Which of `mobjects` have `point` within `buff` of their bounding
+        box, as `Mobject.is_point_touching` would say for each."""
+        self._refresh(mobjects)
+        point = np.asarray(point)
+        return (
+            (self._boxes[:, 0] - buff <= point) & (point <= self._boxes[:, 1] + buff)
+        ).all(1)
+
+    def topmost(self, mobjects: Sequence[Mobject], point: Vect3, buff: float = 0) -> Mobject | None:
+        """The last of `mobjects` touching `point`, or None."""
+        hits = np.flatnonzero(self.touching(mobjects, point, buff))
+        return self._mobjects[hits[-1]] if len(hits) else None
+
+
+class NameIndex:
+    """Names of mobjects in a namespace: the first name bound to the
+    mobject itself, else the first name bound to a mobject whose family
+    holds it."""
+
+    def __init__(self):
+        self._bindings: list[tuple] = []
+        self._names: dict[int, str] = {}
+
+    def name_of(self, namespace: dict, mobject: Mobject) -> str | None:
+        from maniml.mobject.mobject import Mobject
+
+        # Holding each named value and its family list (not their ids)
+        # keeps either from being freed and its id reused unnoticed
+        bindings = [
+            (name, value, value.get_family() if isinstance(value, Mobject) else None)
+            for name, value in namespace.items()
+            if not name.startswith('_') and name != 'self'
+        ]
+        if len(bindings) != len(self._bindings) or any(
+            new[0] != old[0] or new[1] is not old[1] or new[2] is not old[2]
+            for new, old in zip(bindings, self._bindings)
+        ):
+            self._bindings = bindings
+            self._names = {}
+            for name, _, family in bindings:
+                for member in family or ():
+                    self._names.setdefault(id(member), name)
+            for name, value, _ in reversed(bindings):
+                self._names[id(value)] = name
+        return self._names.get(id(mobject))
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from PIL import Image
 
@@ -10,7 +14,7 @@ from maniml.utils.file_ops import find_file
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Iterable
+    from typing import Callable, Iterable
 
 
 def get_full_raster_image_path(image_file_name: str) -> str:
@@ -33,3 +37,38 @@ def invert_image(image: Iterable) -> Image.Image:
     arr = np.array(image)
     arr = (255 * np.ones(arr.shape)).astype(arr.dtype) - arr
     return Image.fromarray(arr)
+
+
+def write_png(path: str, size: tuple[int, int], raw: bytes) -> None:
+    """Save raw RGBA8 framebuffer bytes, rows bottom-up as OpenGL reads
+    them, as a PNG."""
+    Image.frombytes("RGBA", size, raw, "raw", "RGBA", 0, -1).save(path)
+
+
+class ImageEncoder:
+    """Encodes images on a small thread pool, off the render thread.
+
+    The render thread only reads the framebuffer back and submits the
+    bytes; the encode, most of an image's cost, runs on the pool (Pillow
+    releases the GIL while it compresses). At most two raw images per
+    worker wait at once, so a slow encoder throttles the render instead
+    of piling up uncompressed frames in memory."""
+
+    def __init__(self, workers: int | None = None, name: str = "maniml-images"):
+        workers = workers or min(4, os.cpu_count() or 1)
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix=name)
+        self._pending = deque()
+        self._limit = 2 * workers
+
+    def submit(self, encode: Callable[..., None], *args) -> None:
+        while len(self._pending) >= self._limit:
+            self._pending.popleft().result()
+        self._pending.append(self._pool.submit(encode, *args))
+
+    def close(self) -> None:
+        """Wait for every queued image; re-raises the first encode error."""
+        try:
+            while self._pending:
+                self._pending.popleft().result()
+        finally:
+            self._pool.shutdown()
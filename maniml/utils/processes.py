@@ -1,4 +1,5 @@
-"""Cross-platform subprocess-group creation and bounded tree cleanup."""
+"""Cross-platform subprocess-group creation, bounded tree cleanup, and
+resident-memory readings."""
 
 from __future__ import annotations
 
@@ -147,3 +148,23 @@ def terminate_process_tree(
         _terminate_windows_process_tree(process, terminate_timeout, kill_timeout)
     else:
         _terminate_posix_process_tree(process, terminate_timeout, kill_timeout)
+
+
+def resident_memory(process_id: int) -> int | None:
+    """A process's resident set size in bytes, None where it cannot be
+    read (it has exited, or Windows)."""
+    try:
+        with open(f"/proc/{process_id}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if os.name == "nt":
+        return None
+    # macOS has no /proc; ps reports kilobytes
+    try:
+        result = subprocess.run(
+            ["ps", "-o", "rss=", "-p", str(process_id)],
+            capture_output=True, text=True, timeout=2)
+        return int(result.stdout.strip()) * 1024
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
@@ -5,7 +5,9 @@ launch directory (plus recently opened files); clicking a scene spawns
 that scene as its own subprocess — exactly `maniml file.py Scene --web`
 — and navigates to its viewer. Scene files are arbitrary user code, so
 subprocess-per-scene keeps a crashing scene from taking the app down
-(the same isolation argument as Knuth's kernel).
+(the same isolation argument as Knuth's kernel). The subprocess is
+usually a warm worker (web/workers.py) that imported maniml before it
+was needed, so opening a scene costs about what the scene itself does.
 
 One port serves everything: plain GETs return the landing page and the
 static assets, and the same port accepts the control WebSocket the page
@@ -20,7 +22,6 @@ import atexit
 import json
 import os
 import re
-import subprocess
 import sys
 import threading
 import time
@@ -28,22 +29,26 @@ from collections import deque
 from pathlib import Path
 from urllib.parse import urlencode, urlsplit
 
-from maniml.utils.processes import (
-    process_group_popen_kwargs,
-    terminate_process_tree,
-)
+from maniml.utils.processes import resident_memory, terminate_process_tree
 from maniml.desktop import choose_python_file
 from maniml.web.assets import (
     is_websocket_upgrade,
     static_response,
 )
 from maniml.web.library import find_scene_classes, load_recents, remember_recent
+from maniml.web.local import (
+    LOCAL_SOCKET_ENV,
+    LocalConnection,
+    remove_socket,
+    socket_path,
+)
 from maniml.web.security import (
     MAX_CONTROL_MESSAGE,
     parse_json_object,
     resolve_authorized_file,
 )
 from maniml.web.server import bind_loopback
+from maniml.web.workers import DEFAULT_WARM_WORKERS, WorkerPool, spawn
 
 VIEWER_LAUNCH_PATTERN = re.compile(
     r"^maniml web viewer: (?P<url>http://localhost:\d+/)\s*$"
@@ -52,6 +57,15 @@ VIEWER_LAUNCH_PATTERN = re.compile(
 # requirement: a background agent holds it for the login session, and a
 # foreground `maniml app` started alongside falls back to an OS-assigned one.
 DEFAULT_APP_PORT = 8685
+# Scene engines are stopped once idle -- no page attached -- for longer than
+# this, and the least recently used idle ones past the count or the combined
+# memory below. An idle engine still holds a GL context and its checkpoint
+# history. A page that comes back to a stopped engine restarts it under the
+# same id; one that is attached is never stopped.
+MAX_LIVE_SCENES = 4
+SCENE_IDLE_TIMEOUT = 20 * 60.0
+SCENE_MEMORY_CEILING = 4 * 1024**3
+REAP_INTERVAL = 30.0
 
 
 def missing_module_hint(log: str) -> str | None:
@@ -86,37 +100,45 @@ def parse_viewer_launch_line(line: str) -> str | None:
 
 
 class SceneProcess:
-    """One running `maniml <file> <Scene> --web` subprocess."""
+    """One running `maniml <file> <Scene> --web` subprocess: a warm worker
+    from `pool` when it has one ready, else a cold start."""
 
     def __init__(
         self,
         path: str,
         scene: str | None,
         identifier: str = "",
+        pool: WorkerPool | None = None,
     ):
         self.path = path
         self.scene = scene
         # How the browser names this scene when it asks the app to relay to
         # it. The scene's own port never reaches the page.
         self.id = identifier
-        command = [sys.executable, "-m", "maniml", path]
+        argv = [path]
         if scene:
-            command.append(scene)
-        command += ["--web", "--no-browser"]
+            argv.append(scene)
+        argv += ["--web", "--no-browser"]
+        cwd = os.path.dirname(path) or None
         # The scene serves its own page on its own port, so it needs to know
-        # nothing about the app that spawned it.
-        child_env = {**os.environ, "PYTHONUNBUFFERED": "1"}
-        self.proc = subprocess.Popen(
-            command,
-            cwd=os.path.dirname(path) or None,
-            env=child_env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            **process_group_popen_kwargs(),
-        )
+        # nothing about the app that spawned it -- except, where there are
+        # Unix sockets, the one it also serves the app's relay on.
+        scene_env = {"PYTHONUNBUFFERED": "1"}
+        self.local_socket = socket_path()
+        if self.local_socket:
+            scene_env[LOCAL_SOCKET_ENV] = self.local_socket
+        try:
+            self.proc = pool.run(argv, cwd, scene_env) if pool is not None else None
+            if self.proc is None:
+                self.proc = spawn(
+                    [sys.executable, "-m", "maniml", *argv], cwd,
+                    {**os.environ, **scene_env})
+        except BaseException:
+            remove_socket(self.local_socket)
+            raise
+        # Pages attached through the relay, and when one last sent anything
+        self.clients = 0
+        self.last_active = time.monotonic()
         self.lines: deque[str] = deque(maxlen=200)
         self.url: str | None = None
         self._stop_lock = threading.Lock()
@@ -125,10 +147,15 @@ class SceneProcess:
         self._reader.start()
 
     def _read(self):
-        for line in self.proc.stdout:
-            self.lines.append(line)
-            if self.url is None:
-                self.url = parse_viewer_launch_line(line)
+        try:
+            for line in self.proc.stdout:
+                self.lines.append(line)
+                if self.url is None:
+                    self.url = parse_viewer_launch_line(line)
+        finally:
+            # The process is gone (its pipe closed): nothing serves the
+            # socket any more
+            remove_socket(self.local_socket)
 
     @property
     def ws_url(self) -> str | None:
@@ -176,6 +203,10 @@ class AppServer:
         root: str,
         port: int | None = None,
         allow_outside_root: bool = False,
+        warm_workers: int = DEFAULT_WARM_WORKERS,
+        max_scenes: int = MAX_LIVE_SCENES,
+        idle_timeout: float = SCENE_IDLE_TIMEOUT,
+        memory_ceiling: int | None = SCENE_MEMORY_CEILING,
     ):
         self.root = str(Path(root).resolve())
         self._root_path = Path(self.root)
@@ -193,6 +224,12 @@ class AppServer:
         self.processes: dict[tuple, SceneProcess] = {}
         self._scenes_by_id: dict[str, SceneProcess] = {}
         self._next_scene_id = 0
+        # Stopped by `reap`, by the id their page still knows them as
+        self._evicted: dict[tuple, str] = {}
+        self.max_scenes = max_scenes
+        self.idle_timeout = idle_timeout
+        self.memory_ceiling = memory_ceiling
+        self._pool: WorkerPool | None = None
         self._lock = threading.Lock()
         self._shutdown_lock = threading.Lock()
         self._shutdown_complete = False
@@ -213,6 +250,12 @@ class AppServer:
         # origin this server serves its own page on.
         self.allowed_origins = {self.origin}
         self._start_server()
+        # Warming starts now, so the first scene opened is already warm
+        if warm_workers:
+            self._pool = WorkerPool(warm_workers)
+        threading.Thread(
+            target=self._reap_periodically, name="maniml-reaper", daemon=True,
+        ).start()
 
     def open_scene(self, path: str, scene: str | None) -> str | None:
         key = (path, scene or "")
@@ -226,18 +269,105 @@ class AppServer:
                 # than leave the relay a dead name to refuse.
                 self._scenes_by_id.pop(process.id, None)
                 process = None
-            if process is None:
-                self._next_scene_id += 1
+            started = process is None
+            if started:
+                # A scene the reaper stopped comes back as itself, so a
+                # page still holding its id reconnects to it
+                identifier = self._evicted.pop(key, None)
+                if identifier is None:
+                    self._next_scene_id += 1
+                    identifier = str(self._next_scene_id)
                 process = SceneProcess(
-                    path, scene, identifier=str(self._next_scene_id),
+                    path, scene, identifier=identifier, pool=self._pool,
                 )
                 self.processes[key] = process
                 self._scenes_by_id[process.id] = process
+        if started:
+            self.reap(keep=process)
         url = process.wait_for_url()
         if url:
             remember_recent(path)
         return url
 
+    def reopen_scene(self, scene_id: str) -> SceneProcess | None:
+        """Restart a scene the reaper stopped, for a page that still has
+        it open."""
+        with self._lock:
+            key = next(
+                (key for key, evicted in self._evicted.items() if evicted == scene_id),
+                None)
+        if key is None or self.open_scene(key[0], key[1] or None) is None:
+            return None
+        return self._scenes_by_id.get(scene_id)
+
+    def attach(self, scene_id: str) -> SceneProcess | None:
+        """The live scene process `scene_id` names, counted as having a
+        page attached, or None. One step under the lock, so the reaper
+        cannot stop it between the lookup and the count."""
+        with self._lock:
+            process = self._scenes_by_id.get(scene_id)
+            if process is None or process.ws_url is None or not process.alive():
+                return None
+            process.clients += 1
+            return process
+
+    def detach(self, process: SceneProcess) -> None:
+        """A page left: the scene is idle from now if it was the last."""
+        with self._lock:
+            process.clients -= 1
+            process.last_active = time.monotonic()
+
+    def reap(
+        self, now: float | None = None, keep: SceneProcess | None = None
+    ) -> list[SceneProcess]:
+        """Stop the idle scene engines past the limits above, least
+        recently used first, and return them. `keep` is exempt: the scene
+        being opened has no page attached yet."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self._shutdown_complete:
+                return []
+            live = [(key, process) for key, process in self.processes.items()
+                    if process.alive()]
+        idle = sorted(
+            ((key, process) for key, process in live
+             if process.clients == 0 and process is not keep),
+            key=lambda item: item[1].last_active)
+        doomed = [item for item in idle
+                  if now - item[1].last_active > self.idle_timeout]
+        idle = [item for item in idle if item not in doomed]
+        while idle and len(live) - len(doomed) > self.max_scenes:
+            doomed.append(idle.pop(0))
+        if self.memory_ceiling and idle:
+            memory = {
+                process: resident_memory(process.proc.pid) or 0
+                for _, process in live}
+            total = sum(memory[process] for _, process in live
+                        if (_, process) not in doomed)
+            while idle and total > self.memory_ceiling:
+                doomed.append(idle.pop(0))
+                total -= memory[doomed[-1][1]]
+
+        stopped = []
+        with self._lock:
+            for key, process in doomed:
+                # A page may have attached since the snapshot
+                if self.processes.get(key) is process and process.clients == 0:
+                    del self.processes[key]
+                    self._scenes_by_id.pop(process.id, None)
+                    self._evicted[key] = process.id
+                    stopped.append(process)
+        for process in stopped:
+            process.stop()
+        return stopped
+
+    def _reap_periodically(self) -> None:
+        while not self._stopped.wait(REAP_INTERVAL):
+            try:
+                self.reap()
+            except Exception as exc:  # noqa: BLE001 - keep reaping
+                print(f"warning: reaping scene processes failed: {exc}")
+
     def recents_payload(self) -> dict:
         """Files the user has opened before, newest first.
 
@@ -406,44 +536,62 @@ class AppServer:
             file.py Scene --web` on its own is unchanged — but a scene opened
             through the app must not move the browser to another port, because
             the port is the installed app's identity. So the app connects to
-            it as a client and copies frames both ways.
+            it as a client and copies frames both ways: over the scene's Unix
+            socket (web/local.py) where it has one, else as a WebSocket
+            client over loopback.
             """
-            process = self._scenes_by_id.get(scene_id)
-            target = process.ws_url if process is not None else None
-            if target is None or not process.alive():
+            # Attached for as long as this relay runs, so the reaper leaves
+            # the scene alone; idle from when the page last said anything
+            process = self.attach(scene_id)
+            if process is None:
+                # Reaped, possibly just now: bring it back under its id
+                await asyncio.to_thread(self.reopen_scene, scene_id)
+                process = self.attach(scene_id)
+            if process is None:
                 await ws.close(code=1011, reason="no such scene")
                 return
+            target = process.ws_url
             import websockets.asyncio.client as ws_client
 
+            upstream = None
+            if process.local_socket:
+                try:
+                    upstream = await LocalConnection.connect(process.local_socket)
+                except OSError:
+                    pass  # the scene could not bind it; TCP still works
             try:
-                async with ws_client.connect(
-                    target,
-                    # The scene checks Origin like every server here; the app
-                    # is not a browser, so it states the scene's own origin.
-                    origin=urlsplit(process.url).scheme
-                    + f"://localhost:{urlsplit(process.url).port}",
-                    max_size=None,
-                    # No buffer of its own. With a queue here the relay
-                    # accepts frames from the scene far faster than it can
-                    # hand them to the browser, so the scene sees a fast
-                    # client, never applies its own send policy, and the
-                    # backlog comes out the far side in clumps: frames
-                    # arriving 5ms apart separated by 100ms stalls, which
-                    # is judder even though not one frame was lost. At 1
-                    # the relay is transparent and the scene's flow control
-                    # measures the browser, which is what it is for.
-                    max_queue=1,
-                    compression=None,
-                    open_timeout=10,
-                ) as upstream:
-
-                    async def pump(source, sink):
+                if upstream is None:
+                    upstream = await ws_client.connect(
+                        target,
+                        # The scene checks Origin like every server here; the app
+                        # is not a browser, so it states the scene's own origin.
+                        origin=urlsplit(process.url).scheme
+                        + f"://localhost:{urlsplit(process.url).port}",
+                        max_size=None,
+                        # No buffer of its own. With a queue here the relay
+                        # accepts frames from the scene far faster than it can
+                        # hand them to the browser, so the scene sees a fast
+                        # client, never applies its own send policy, and the
+                        # backlog comes out the far side in clumps: frames
+                        # arriving 5ms apart separated by 100ms stalls, which
+                        # is judder even though not one frame was lost. At 1
+                        # the relay is transparent and the scene's flow control
+                        # measures the browser, which is what it is for.
+                        max_queue=1,
+                        compression=None,
+                        open_timeout=10,
+                    )
+                async with upstream:
+
+                    async def pump(source, sink, active=False):
                         async for message in source:
+                            if active:
+                                process.last_active = time.monotonic()
                             await sink.send(message)
 
                     done, pending = await asyncio.wait(
                         [
-                            asyncio.create_task(pump(ws, upstream)),
+                            asyncio.create_task(pump(ws, upstream, active=True)),
                             asyncio.create_task(pump(upstream, ws)),
                         ],
                         return_when=asyncio.FIRST_COMPLETED,
@@ -453,6 +601,7 @@ class AppServer:
             except Exception:
                 pass  # the scene died or the tab went away; both just close
             finally:
+                self.detach(process)
                 await ws.close()
 
         async def handler(ws):
@@ -531,3 +680,5 @@ class AppServer:
                 processes = list(self.processes.values())
             for process in processes:
                 process.stop()
+            if self._pool is not None:
+                self._pool.close()
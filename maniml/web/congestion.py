@@ -0,0 +1,134 @@
+"""Per-client congestion control for the --web viewer's pixel stream.
+
+A page acknowledges the pixel frames it has put on screen (`ack` events:
+how many frames, and the milliseconds it spent decoding and drawing
+them). The time from handing a frame to the socket to its ack is the
+latency the viewer actually shows, so each client's `FrameController`
+steers by it toward TARGET_LATENCY:
+
+- over target, it first lowers JPEG quality when most of the delay is
+  on the wire, then stretches the interval between frames (the only
+  thing that helps when the page itself is slow to decode);
+- well under target, it gives the frame rate back first, then quality;
+- still over target with both at their floor, it asks the page, once,
+  to move to a client renderer, whose geometry stream is a fraction of
+  the size.
+
+The viewer produces frames at the fastest client's interval, and each
+client's controller skips the whole frames, which are droppable, that
+fall inside its own interval or arrive while it has WINDOW frames
+unacknowledged. A client is held to the window only once it has
+acknowledged a frame, so one that never does (a script, an older page)
+is paced as before. JPEG frames are encoded once per QUALITY_TIERS tier
+that some client is at, and each client gets its own tier, so a
+congested page costs one more encode instead of a worse picture for
+every page. Tile frames build on each other and every client takes all
+of them, so in tile mode the viewer paces to the slowest client and
+encodes at the lowest quality.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+from maniml.web.pixels import JPEG_QUALITY
+
+TARGET_LATENCY = 0.1  # seconds from send to on screen
+WINDOW = 3  # unacknowledged frames before a client's droppable frames skip
+MIN_QUALITY = 50
+QUALITY_STEP = 10
+BASE_INTERVAL = 1 / 30  # the rate a scene renders at: pacing starts here
+MAX_INTERVAL = 0.5
+ADJUST_PERIOD = 0.25  # seconds between adjustments, so each one is seen
+# Adjustments at the floor, still over target, before suggesting geometry
+STARVED_ADJUSTMENTS = 4
+SMOOTHING = 0.25  # weight of each new sample in the latency average
+# JPEG qualities frames are encoded at, best first. A client gets the
+# best tier at or under its controller's quality; few tiers keep the
+# extra encodes few however many clients there are
+QUALITY_TIERS = (JPEG_QUALITY, 70, MIN_QUALITY)
+
+
+def quality_tier(quality: int) -> int:
+    """The tier a client paced to `quality` is sent."""
+    return next((tier for tier in QUALITY_TIERS if tier <= quality), MIN_QUALITY)
+
+
+class FrameController:
+    """One client's pacing: the frame interval and JPEG quality it can
+    take, from the latency of the frames it acknowledges.
+
+    Not thread-safe; the server drives it from its event loop."""
+
+    def __init__(self, target: float = TARGET_LATENCY):
+        self.target = target
+        self.interval = 0.0  # 0: unpaced, every frame the viewer sends
+        self.quality = JPEG_QUALITY
+        self.latency: float | None = None
+        self.client_time = 0.0  # decode + draw, smoothed like latency
+        self.suggested_geometry = False
+        self._sent: deque[float] = deque(maxlen=64)
+        self._acking = False
+        self._last_sent = float("-inf")
+        self._last_adjusted = float("-inf")
+        self._starved = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._sent)
+
+    def may_send(self, now: float) -> bool:
+        """Whether a droppable frame should go to this client now."""
+        if self._acking and self.in_flight >= WINDOW:
+            return False
+        return now - self._last_sent >= self.interval
+
+    def sent(self, now: float) -> None:
+        self._sent.append(now)
+        self._last_sent = now
+
+    def acked(self, frames: int, client_seconds: float, now: float) -> bool:
+        """Record an ack for the oldest `frames` frames in flight. True
+        when the client should now be told to switch to geometry."""
+        self._acking = True
+        newest = None
+        for _ in range(min(frames, len(self._sent))):
+            newest = self._sent.popleft()
+        if newest is None:
+            return False
+        self._smooth(now - newest, client_seconds)
+        if now - self._last_adjusted < ADJUST_PERIOD:
+            return False
+        self._last_adjusted = now
+        return self._adjust()
+
+    def _smooth(self, latency: float, client_seconds: float) -> None:
+        if self.latency is None:
+            self.latency, self.client_time = latency, client_seconds
+            return
+        self.latency += SMOOTHING * (latency - self.latency)
+        self.client_time += SMOOTHING * (client_seconds - self.client_time)
+
+    def _adjust(self) -> bool:
+        if self.latency > self.target:
+            wire = self.latency - self.client_time
+            if self.quality > MIN_QUALITY and wire >= self.client_time:
+                self.quality = max(MIN_QUALITY, self.quality - QUALITY_STEP)
+            elif self.interval < MAX_INTERVAL:
+                self.interval = min(
+                    MAX_INTERVAL, max(BASE_INTERVAL, self.interval * 1.5))
+            else:
+                self._starved += 1
+                if self._starved >= STARVED_ADJUSTMENTS and not self.suggested_geometry:
+                    self.suggested_geometry = True
+                    return True
+            return False
+        self._starved = 0
+        if self.latency < self.target / 2:
+            if self.interval:
+                self.interval *= 0.75
+                if self.interval < BASE_INTERVAL:
+                    self.interval = 0.0
+            elif self.quality < JPEG_QUALITY:
+                self.quality = min(JPEG_QUALITY, self.quality + QUALITY_STEP // 2)
+        return False
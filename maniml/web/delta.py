@@ -0,0 +1,204 @@
+"""Temporal delta coding for the geometry stream.
+
+The content-hash cache in `geometry.py` makes a hold free, but it never
+hits while something moves: inside a Transform every frame's animating
+batches are new content, so each one ships its full vertex data again.
+Consecutive frames of an animation are nonetheless almost the same
+bytes — colors, widths, normals and most coordinates do not change, and
+the ones that do keep their sign and exponent. XOR against the batch
+that drew at the same position one frame earlier turns all of that into
+zeros, which deflate removes.
+
+A delta message wraps an ordinary geometry message (0x03, or 0x06 with
+its binary header):
+
+    [0x04][u8 flags][u32le meta_len][JSON meta][payload]
+
+where the payload is that message, zlib-compressed when flag bit 0
+is set, with each batch named in `meta["delta"]` (draw index -> content
+hash of the reference batch) XORed against that reference's bytes. The
+decoder undoes the XOR and hands back the original message byte for
+byte, so both client renderers and the reference renderer consume
+exactly what they always have; the codec is an envelope, not a second
+payload format.
+
+Every `keyframe_interval` frames — and after any reset — a frame is a
+keyframe: it references no earlier frame, so a decoder can start there.
+That is what lets the baked player seek without decoding from the first
+frame. Keyframes still carry `"cached"` batch references, which resolve
+against the renderer's buffer cache exactly as before.
+
+Encoder and decoder keep the same residency rule, so neither ever has to
+tell the other what it holds: after each frame the resident set is the
+bytes of every batch in that frame whose bytes the decoder has — shipped
+in the frame, or cached and already resident. A keyframe starts the set
+over.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+
+import numpy as np
+
+from maniml.web.geometry import (
+    GEOMETRY_BINARY_MESSAGE_TYPE,
+    GEOMETRY_MESSAGE_TYPE,
+    split_geometry_message,
+)
+
+DELTA_MESSAGE_TYPE = 0x04
+FLAG_DEFLATE = 0x01
+# 3s at the default 30fps: a seek decodes at most this many frames.
+KEYFRAME_INTERVAL = 90
+# Live frames are compressed on the scene thread, so the cheap end of
+# zlib: level 1 costs half of level 6's time for ~25% more bytes.
+LIVE_LEVEL = 1
+
+
+def _batch_nbytes(batch: dict) -> int:
+    """Bytes a shipped batch occupies: vertices, then any triangulated
+    fill vertices and indices, which serialize_scene lays out after them."""
+    nbytes = batch["num_verts"] * batch["stride"]
+    tri = batch.get("tri")
+    if tri is not None:
+        nbytes += tri["vcount"] * 40 + tri["icount"] * 4
+    return nbytes
+
+
+def _xor_into(buffer: bytearray, start: int, reference: bytes) -> None:
+    end = start + len(reference)
+    view = np.frombuffer(buffer, dtype=np.uint8)[start:end]
+    np.bitwise_xor(view, np.frombuffer(reference, dtype=np.uint8), out=view)
+
+
+def is_keyframe(message: bytes) -> bool:
+    """Whether a decoder can start at this message. A plain geometry
+    message references no earlier frame's bytes, so it always can."""
+    if message[0] != DELTA_MESSAGE_TYPE:
+        return True
+    (meta_len,) = struct.unpack_from("<I", message, 2)
+    return bool(json.loads(bytes(message[6:6 + meta_len]).decode())["key"])
+
+
+class DeltaEncoder:
+    """Turns a sequence of geometry messages into 0x04 delta messages.
+
+    `level` is the zlib level applied to each message, or None to store
+    the payload uncompressed — for a container that compresses the whole
+    stream anyway (the export's gzip), which beats per-frame deflate
+    because it also sees the repetition between consecutive headers.
+    """
+
+    def __init__(
+        self,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+        level: int | None = LIVE_LEVEL,
+    ):
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.level = level
+        self.reset()
+
+    def reset(self) -> None:
+        """Make the next message a keyframe (a client joined or lost sync)."""
+        self._resident: dict[str, bytes] = {}
+        self._previous: list[str] = []
+        self._since_keyframe = 0
+
+    def encode(self, message: bytes) -> bytes:
+        header, base = split_geometry_message(message)
+        keyframe = self._since_keyframe % self.keyframe_interval == 0
+        self._since_keyframe += 1
+        resident = {} if keyframe else self._resident
+
+        payload = bytearray(message)
+        refs: dict[str, str] = {}
+        next_resident: dict[str, bytes] = {}
+        for index, batch in enumerate(header["batches"]):
+            content_hash = batch["hash"]
+            if batch.get("cached"):
+                if content_hash in resident:
+                    next_resident[content_hash] = resident[content_hash]
+                continue
+            start = base + batch["offset"]
+            chunk = bytes(message[start:start + _batch_nbytes(batch)])
+            next_resident[content_hash] = chunk
+            if index >= len(self._previous):
+                continue
+            reference = self._previous[index]
+            reference_bytes = resident.get(reference)
+            if (reference_bytes is not None and reference != content_hash
+                    and len(reference_bytes) == len(chunk)):
+                _xor_into(payload, start, reference_bytes)
+                refs[str(index)] = reference
+        self._resident = next_resident
+        self._previous = [batch["hash"] for batch in header["batches"]]
+
+        flags = 0
+        if self.level is not None:
+            payload = zlib.compress(payload, self.level)
+            flags |= FLAG_DEFLATE
+        meta = json.dumps({"key": keyframe, "delta": refs}).encode()
+        return b"".join([
+            bytes([DELTA_MESSAGE_TYPE, flags]),
+            struct.pack("<I", len(meta)),
+            meta,
+            payload,
+        ])
+
+
+class DeltaDecoder:
+    """Inverse of DeltaEncoder: 0x04 messages back to the geometry
+    messages they wrap.
+
+    Plain geometry messages pass through untouched, so a consumer can run
+    every geometry message through one decoder whatever the sender chose.
+    Raises ValueError on a delta whose reference it does not hold — a
+    decoder that joined mid-stream; the live client answers that with a
+    `geometry_reset`, which makes the server's next message a keyframe.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._resident: dict[str, bytes] = {}
+
+    def decode(self, message: bytes) -> bytes:
+        if message[0] in (GEOMETRY_MESSAGE_TYPE, GEOMETRY_BINARY_MESSAGE_TYPE):
+            return message
+        if message[0] != DELTA_MESSAGE_TYPE:
+            raise ValueError(f"not a geometry message: type {message[0]:#x}")
+        flags = message[1]
+        (meta_len,) = struct.unpack_from("<I", message, 2)
+        meta = json.loads(bytes(message[6:6 + meta_len]).decode())
+        payload = message[6 + meta_len:]
+        if flags & FLAG_DEFLATE:
+            payload = zlib.decompress(payload)
+        plain = bytearray(payload)
+
+        header, base = split_geometry_message(plain)
+        resident = {} if meta["key"] else self._resident
+        refs = meta["delta"]
+        next_resident: dict[str, bytes] = {}
+        for index, batch in enumerate(header["batches"]):
+            content_hash = batch["hash"]
+            if batch.get("cached"):
+                if content_hash in resident:
+                    next_resident[content_hash] = resident[content_hash]
+                continue
+            start = base + batch["offset"]
+            reference = refs.get(str(index))
+            if reference is not None:
+                reference_bytes = resident.get(reference)
+                if reference_bytes is None:
+                    raise ValueError(
+                        f"delta against batch {reference}, which this "
+                        "decoder does not hold")
+                _xor_into(plain, start, reference_bytes)
+            next_resident[content_hash] = bytes(
+                plain[start:start + _batch_nbytes(batch)])
+        self._resident = next_resident
+        return bytes(plain)
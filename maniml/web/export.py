@@ -1,11 +1,11 @@
 """The baked-scene web player: `maniml scene.py Scene --export`.
 
 Runs the scene once headlessly, records the geometry stream (the same
-0x03 messages the live viewer streams, delta-encoded), and writes a
-self-contained static folder: the player page, both client renderers
-with their shaders, and the recorded data. Drop the folder on any
-static host (GitHub Pages) and anyone can scrub through the scene's
-animations in the browser — no Python anywhere.
+0x03 messages the live viewer streams, cache- and delta-encoded — see
+`delta.py`), and writes a self-contained static folder: the player
+page, both client renderers with their shaders, and the recorded data.
+Drop the folder on any static host (GitHub Pages) and anyone can scrub
+through the scene's animations in the browser — no Python anywhere.
 
 The recorder plugs into the same `_web_viewer` hook the live viewer
 uses (`on_frame_rendered` after every capture, begin/end_animation
@@ -23,24 +23,32 @@ import tempfile
 import time
 from pathlib import Path
 
+from maniml.web.delta import DeltaEncoder, is_keyframe
 from maniml.web.geometry import GeometryCache, serialize_scene
 
 STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
 
-PLAYER_ASSETS = ["player.html", "player.js", "gl.js", "webgpu.js"]
+PLAYER_ASSETS = [
+    "player.html", "player.js", "geometry.js", "delta.js", "gl.js", "webgpu.js",
+]
 PLAYER_ASSET_DIRS = ["glsl", "wgsl"]
 
 
 class GeometryRecorder:
     """Duck-typed for Scene's `_web_viewer` hooks; collects one
     geometry message per rendered frame, tagged with its segment (one
-    segment per play()/wait() span)."""
+    segment per play()/wait() span).
+
+    Frames are stored delta-coded but uncompressed: the export gzips the
+    whole stream, which also folds the near-identical headers of
+    consecutive frames together — something per-frame deflate cannot."""
 
     is_web_viewer = True
 
     def __init__(self, scene):
         self.scene = scene
         self.cache = GeometryCache()
+        self.encoder = DeltaEncoder(level=None)
         self.frames: list[tuple[bytes, int]] = []
         self.segment = -1
         self._counter = -1
@@ -52,9 +60,12 @@ class GeometryRecorder:
     def end_animation(self):
         pass  # tail frames stay with the finished segment
 
+    def needs_capture(self):
+        return True
+
     def on_frame_rendered(self):
         message = serialize_scene(self.scene, self.cache)
-        self.frames.append((message, self.segment))
+        self.frames.append((self.encoder.encode(message), self.segment))
 
 
 def record_scene(scene) -> GeometryRecorder:
@@ -86,12 +97,43 @@ def record_scene(scene) -> GeometryRecorder:
     return recorder
 
 
-def export_scene(scene, out_dir: str) -> str:
+def write_player_assets(directory: str) -> Path:
+    """Write the player's static files once, as a bundle that several
+    exports can hard-link from instead of each copying them.
+
+    Files are replaced, never rewritten in place: an export linked to the
+    previous bundle keeps the assets it was published with."""
+    bundle = Path(directory).absolute()
+    bundle.mkdir(parents=True, exist_ok=True)
+    for name in PLAYER_ASSETS:
+        _replace_file(Path(STATIC_DIR, name), bundle / _asset_target(name))
+    for dirname in PLAYER_ASSET_DIRS:
+        (bundle / dirname).mkdir(exist_ok=True)
+        for source in sorted(Path(STATIC_DIR, dirname).iterdir()):
+            _replace_file(source, bundle / dirname / source.name)
+    return bundle
+
+
+def _asset_target(name: str) -> str:
+    return "index.html" if name == "player.html" else name
+
+
+def _replace_file(source: Path, target: Path) -> None:
+    temporary = target.with_name(f".{target.name}.tmp")
+    shutil.copy(source, temporary)
+    os.replace(temporary, target)
+
+
+def export_scene(scene, out_dir: str, assets: str | None = None) -> str:
     """Record ``scene`` and atomically publish its player folder.
 
     The previous export remains untouched until a complete replacement is
     ready. Existing unrelated files are carried forward for compatibility
     with users who keep deployment metadata alongside the player assets.
+
+    With ``assets`` (a bundle from write_player_assets), the player files
+    are hard-linked from it rather than copied — the folder is still
+    self-contained, but N exports share one copy on disk.
     """
     destination = Path(out_dir).absolute()
     _validate_export_destination(destination)
@@ -114,7 +156,8 @@ def export_scene(scene, out_dir: str) -> str:
             shutil.copytree(destination, staging, symlinks=True)
         else:
             staging.mkdir(mode=0o755)
-        _write_export(scene, recorder, staging)
+        _write_export(scene, recorder, staging,
+                      Path(assets) if assets is not None else None)
         _publish_export(staging, destination, backup)
     finally:
         shutil.rmtree(transaction, ignore_errors=True)
@@ -145,16 +188,31 @@ def _remove_staged_path(path: Path) -> None:
         path.unlink()
 
 
-def _write_export(scene, recorder: GeometryRecorder, staging: Path) -> None:
+def _link_or_copy(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except OSError:  # another filesystem, or links unsupported
+        shutil.copy(source, target)
+
+
+def _write_export(
+    scene, recorder: GeometryRecorder, staging: Path, assets: Path | None = None
+) -> None:
     for name in PLAYER_ASSETS:
-        target_name = "index.html" if name == "player.html" else name
-        target_path = staging / target_name
+        target_path = staging / _asset_target(name)
         _remove_staged_path(target_path)
-        shutil.copy(Path(STATIC_DIR, name), target_path)
+        if assets is None:
+            shutil.copy(Path(STATIC_DIR, name), target_path)
+        else:
+            _link_or_copy(assets / _asset_target(name), target_path)
     for dirname in PLAYER_ASSET_DIRS:
         target_directory = staging / dirname
         _remove_staged_path(target_directory)
-        shutil.copytree(Path(STATIC_DIR, dirname), target_directory)
+        if assets is None:
+            shutil.copytree(Path(STATIC_DIR, dirname), target_directory)
+        else:
+            shutil.copytree(assets / dirname, target_directory,
+                            copy_function=_link_or_copy)
 
     scene_data = staging / "scene.bin.gz"
     _remove_staged_path(scene_data)
@@ -167,7 +225,9 @@ def _write_export(scene, recorder: GeometryRecorder, staging: Path) -> None:
         "scene": type(scene).__name__,
         "fps": int(scene.camera.fps),
         "frames": [
-            {"len": len(message), "segment": segment}
+            # `key` marks the frames a seek may start decoding from
+            {"len": len(message), "segment": segment,
+             "key": is_keyframe(message)}
             for message, segment in recorder.frames
         ],
         "segments": recorder._counter + 1,
@@ -27,6 +27,35 @@ stroke shader applies, evaluated at the current frame_scale), so the
 client can draw that many vertices per instance instead of the
 worst-case 64.
 
+Serializing is change-tracked. A GeometryCache remembers, per mobject,
+the shader data it last produced, and per batch, the joined bytes and
+hash. Both are keyed by the mobjects' `_data_version`, which
+`note_changed_data` bumps. A frame re-reads, re-joins and re-hashes only
+the batches whose mobjects changed since the frame before. A static
+slide costs a walk of its draw list and nothing more.
+
+A client that advertised it can take the header in binary instead
+(`header: "binary"` in its mode message, offered as the server's
+`binary-geometry` capability) — a 0x06 message with the same framing
+and the same vertex data:
+
+    [0x06][u32le header_len][binary header][vertex data]
+
+The binary header is a fixed-size camera block, a table of the uniform
+schemas the message uses (one per distinct batch kind and uniform
+layout, so hundreds of batches name their uniforms once) and a varint
+batch table; see `encode_binary_header`. It decodes to exactly the dict
+the JSON header would have been, numbers as float32, so everything past
+the parse is shared. A header the layout cannot express falls back to
+JSON; exports and Python consumers always get JSON.
+
+When nothing but the camera moved since the last message — a pan, a
+zoom, a 3D orbit — and the clients hold every batch, a client that
+asked for them (`camera: true` in its mode message) gets a 0x07 camera
+update instead: the binary header's camera block and each batch's
+`stroke_verts` (which follows the zoom), applied to the header it
+rendered last. See `apply_camera_message`.
+
 Not expressible here (client falls back to the pixel stream, declared
 in `unsupported`): images, surfaces, depth-tested winding fills, clip
 planes — see the parity ledger in TODO.md.
@@ -36,6 +65,7 @@ from __future__ import annotations
 
 import json
 import struct
+from collections import OrderedDict
 
 import numpy as np
 
@@ -45,19 +75,82 @@ if TYPE_CHECKING:
     from maniml.scene.scene import Scene
 
 GEOMETRY_MESSAGE_TYPE = 0x03
+GEOMETRY_BINARY_MESSAGE_TYPE = 0x06
+CAMERA_MESSAGE_TYPE = 0x07
+
+
+# Bytes of batch data a live client is asked to keep. Past it, the least
+# recently drawn batches are evicted, on both sides at once.
+GEOMETRY_CACHE_BUDGET = 64 << 20
 
 
 class GeometryCache:
     """Delta-encoding state: the batch content hashes every connected
     client is known to hold. Owned by the viewer; reset whenever a
     client connects (or asks for a reset), so the next message ships
-    every batch in full."""
-
-    def __init__(self):
-        self.sent: set[str] = set()
+    every batch in full.
+
+    With a `budget` (bytes), the cache is an LRU that decides what the
+    clients hold as well as tracking it: each message lists in `evict`
+    the batches the client must drop, the least recently drawn first,
+    until what is left fits. A batch is only ever sent as `cached` while
+    it is still resident, and both sides' memory stays flat however long
+    a session runs. Without a budget (--export, whose player keeps every
+    batch to seek with) nothing is evicted and the header has no
+    `evict` list.
+
+    Also the change tracking, which is about the scene rather than the
+    clients and so survives a reset: the previous frame's shader data per
+    mobject and serialized bytes per batch, keyed by the (id, data
+    version) of the mobjects they came from. Only entries the last frame
+    used are kept.
+
+    `shapes` is what the last message drew, minus the camera; a frame
+    that matches it is a camera update. None after a reset, so the
+    next message is always a full one."""
+
+    def __init__(self, budget: int | None = None):
+        self.budget = budget
+        # content hash -> bytes, least recently drawn first
+        self.sent: OrderedDict[str, int] = OrderedDict()
+        self.resident = 0  # bytes the clients hold, per `sent`
+        self.textures: set[str] = set()
+        # id(mobject) -> (data version, triangulated, shader data, tri)
+        self.mobjects: dict[int, tuple] = {}
+        # stamps of a batch's mobjects -> its serialized bytes and hash
+        self.batches: dict[tuple, dict] = {}
+        self.shapes: tuple | None = None
 
     def reset(self):
         self.sent.clear()
+        self.resident = 0
+        self.textures.clear()
+        self.shapes = None
+
+    def holds(self, content_hash: str) -> bool:
+        """Whether the clients hold this batch; counts as a use."""
+        if content_hash in self.sent:
+            self.sent.move_to_end(content_hash)
+            return True
+        return False
+
+    def add(self, content_hash: str, nbytes: int) -> None:
+        self.sent[content_hash] = nbytes
+        self.resident += nbytes
+
+    def evict(self, drawn: set[str]) -> list[str]:
+        """Drop least recently drawn batches until the budget holds,
+        never one `drawn` in the current message; returns their hashes."""
+        evicted = []
+        if self.budget is None:
+            return evicted
+        while self.resident > self.budget and self.sent:
+            oldest = next(iter(self.sent))
+            if oldest in drawn:
+                break  # everything left is on screen now
+            self.resident -= self.sent.pop(oldest)
+            evicted.append(oldest)
+        return evicted
 
 # Constants from quadratic_bezier/stroke/geom.glsl
 POLYLINE_FACTOR = 100.0
@@ -71,7 +164,12 @@ SURFACE_DTYPE = np.dtype([
 
 
 def _jsonable(value):
-    if isinstance(value, np.ndarray):
+    # Called for every uniform of every mobject each frame: the common
+    # types first, by exact type
+    kind = type(value)
+    if kind is float or kind is int:
+        return value
+    if kind is np.ndarray or isinstance(value, np.ndarray):
         return value.tolist()
     if isinstance(value, (np.floating, np.integer)):
         return value.item()
@@ -138,21 +236,54 @@ def _texture_file(path: str) -> tuple[str, bytes]:
     return cached
 
 
-def _collect_records(scene, unsupported):
+def _stamp(sm):
+    """(id, data version) of a mobject whose data is up to date, or None
+    when its data still has a lazy refresh pending (or it predates data
+    versions, e.g. unpickled from an old checkpoint)."""
+    version = getattr(sm, "_data_version", None)
+    if version is None or getattr(sm, "needs_new_joint_angles", False):
+        return None
+    return (id(sm), version)
+
+
+def _collect_records(scene, unsupported, cache: GeometryCache | None = None):
     """One record per drawable submobject, in draw order, carrying the
-    numpy data and the draw state that decides merge compatibility."""
+    numpy data and the draw state that decides merge compatibility.
+
+    With a cache, a mobject unchanged since the last frame reuses the
+    shader data (and fill triangulation) read then."""
     from maniml.mobject.types.vectorized_mobject import VMobject
     from maniml.mobject.types.dot_cloud import DotCloud
     from maniml.mobject.types.image_mobject import ImageMobject
     from maniml.mobject.types.surface import Surface, TexturedSurface
     from maniml.camera.camera_frame import CameraFrame
 
+    known = cache.mobjects if cache is not None else {}
+    seen = {}
+
+    def shader_data(sm, triangulated=False):
+        """(stamp, shader data, fill triangles) for `sm`, from the last
+        frame when its data has not changed since."""
+        stamp = _stamp(sm)
+        entry = known.get(id(sm))
+        if stamp is not None and entry is not None and entry[:2] == (stamp[1], triangulated):
+            data, tri = entry[2], entry[3]
+        else:
+            data = sm.get_shader_data()
+            tri = (_triangulated_fill_data(sm)
+                   if triangulated and len(data) else None)
+            # get_shader_data refreshes lazy data, so stamp after it
+            stamp = _stamp(sm)
+        if stamp is not None:
+            seen[id(sm)] = (stamp[1], triangulated, data, tri)
+        return stamp, data, tri
+
     def plain_record(sm, kind, stride, textures=None):
-        data = sm.get_shader_data()
+        stamp, data, _ = shader_data(sm)
         if len(data) == 0:
             return None
         return {
-            "kind": kind, "stride": stride, "data": data,
+            "kind": kind, "stride": stride, "data": data, "stamp": stamp,
             "uniforms": {k: _jsonable(v) for k, v in sm.uniforms.items()},
             "depth_test": bool(sm.depth_test),
             "stroke_behind": False, "fill_mode": None,
@@ -193,19 +324,20 @@ def _collect_records(scene, unsupported):
                 if name not in unsupported:
                     unsupported.append(name)
                 continue
-            data = sm.get_shader_data()
+            stamp, data, tri = shader_data(sm, triangulated and has_fill)
             if len(data) == 0:
                 continue
             records.append({
-                "kind": "vmobject", "stride": 68, "data": data,
+                "kind": "vmobject", "stride": 68, "data": data, "stamp": stamp,
                 "uniforms": {k: _jsonable(v) for k, v in sm.uniforms.items()},
                 "stroke_behind": bool(sm.stroke_behind),
                 "depth_test": bool(sm.depth_test),
                 "fill_mode": "triangulated" if triangulated else "winding",
-                "tri": (_triangulated_fill_data(sm)
-                        if triangulated and has_fill else None),
+                "tri": tri,
                 "textures": None,
             })
+    if cache is not None:
+        cache.mobjects = seen
     return records
 
 
@@ -213,11 +345,15 @@ _MERGE_KEYS = ("kind", "uniforms", "stroke_behind", "depth_test",
                "fill_mode", "textures")
 
 
-def _merge_records(records):
+def _merge_records(records, known=()):
     """Merge consecutive records with identical draw state — the
     native renderer's batching (batch_by_property over shader-wrapper
     id). Triangulated fill chunks concatenate with re-based indices.
 
+    Each batch carries `stamps`, its records' stamps in order (None if
+    any record has none). A batch whose stamps are in `known` is left
+    unjoined (`data` None): its bytes are already serialized.
+
     Chunks are gathered and joined once per batch rather than folded in
     one at a time. Concatenating on each step reallocates and recopies
     everything accumulated so far, which makes merging n records copy
@@ -228,6 +364,7 @@ def _merge_records(records):
     merged = []
     chunks = []      # per merged batch: the data arrays still to be joined
     tri_chunks = []  # per merged batch: (verts, indices) still to be joined
+    stamps = []      # per merged batch: its records' stamps
     for record in records:
         prev = merged[-1] if merged else None
         if prev is not None and all(
@@ -235,12 +372,20 @@ def _merge_records(records):
             chunks[-1].append(record["data"])
             if record["tri"] is not None:
                 tri_chunks[-1].append(record["tri"])
+            stamps[-1].append(record.get("stamp"))
         else:
             merged.append(dict(record))
             chunks.append([record["data"]])
             tri_chunks.append([record["tri"]] if record["tri"] is not None else [])
-
-    for batch, data_parts, tri_parts in zip(merged, chunks, tri_chunks):
+            stamps.append([record.get("stamp")])
+
+    for batch, data_parts, tri_parts, batch_stamps in zip(
+            merged, chunks, tri_chunks, stamps):
+        batch.pop("stamp", None)
+        batch["stamps"] = None if None in batch_stamps else tuple(batch_stamps)
+        if batch["stamps"] is not None and batch["stamps"] in known:
+            batch["data"] = batch["tri"] = None
+            continue
         if len(data_parts) > 1:
             batch["data"] = np.concatenate(data_parts)
         if not tri_parts:
@@ -260,13 +405,47 @@ def _merge_records(records):
     return merged
 
 
-def serialize_scene(scene: Scene, cache: GeometryCache | None = None) -> bytes:
+def _shape(record, content_hash: str) -> tuple:
+    """A batch's draw state apart from the camera and the zoom."""
+    return (record["kind"], content_hash, record["uniforms"],
+            record["depth_test"], record["stroke_behind"],
+            record["fill_mode"], record["textures"])
+
+
+def only_camera_changed(scene: Scene, cache: GeometryCache) -> bool:
+    """Whether the scene still draws exactly what the cache's last
+    message described, so that only the camera can have moved. Reads
+    and joins nothing for unchanged mobjects, and changes nothing about
+    what the cache says the clients hold."""
+    if cache.shapes is None:
+        return False
+    unsupported = []
+    shapes = []
+    for record in _merge_records(_collect_records(scene, unsupported, cache), cache.batches):
+        if record["data"] is not None:
+            return False
+        shapes.append(_shape(record, cache.batches[record["stamps"]]["hash"]))
+    return (shapes, unsupported) == cache.shapes
+
+
+def serialize_scene(
+    scene: Scene,
+    cache: GeometryCache | None = None,
+    binary: bool = False,
+    camera_only: bool = False,
+) -> bytes:
     """Snapshot the scene's current visual state as a geometry message.
 
     With a GeometryCache, batches whose content the clients already
     hold ship as `"cached": true` + hash only — metadata (uniforms,
     stroke_verts) is still sent fresh, since it can change (e.g. with
-    zoom) without the vertex bytes changing."""
+    zoom) without the vertex bytes changing. A budgeted cache adds the
+    `evict` list its LRU decided on. The cache's change tracking
+    skips re-reading, joining and hashing every batch whose mobjects
+    have not changed since the previous call. `binary` asks for a 0x06
+    message, when the header fits the binary layout; `camera_only`
+    allows a 0x07 camera update, when the camera is all that changed
+    since the cache's last message."""
     import hashlib
 
     camera = scene.camera
@@ -279,21 +458,39 @@ def serialize_scene(scene: Scene, cache: GeometryCache | None = None) -> bytes:
     offset = 0
     needed_textures: dict[str, bytes] = {}
 
-    for record in _merge_records(_collect_records(scene, unsupported)):
-        data = record["data"]
-        raw = np.ascontiguousarray(data).tobytes()
-        tri_bytes = index_bytes = b""
-        if record["kind"] == "vmobject" and record["tri"] is not None:
-            tri_data, tri_indices = record["tri"]
-            tri_bytes = tri_data.tobytes()
-            index_bytes = np.ascontiguousarray(tri_indices).tobytes()
-
-        content_hash = hashlib.blake2b(
-            raw + tri_bytes, digest_size=8).hexdigest()
+    known = cache.batches if cache is not None else {}
+    serialized = {}
+    drawn: set[str] = set()
+    shapes = []
+    held = True  # every batch is one the clients already have
+    records = _collect_records(scene, unsupported, cache)
+    for record in _merge_records(records, known):
+        stamps = record["stamps"]
+        if record["data"] is None:
+            # Unchanged since the last frame: nothing to join or hash
+            body = known[stamps]
+        else:
+            data = record["data"]
+            tri_bytes = index_bytes = b""
+            if record["kind"] == "vmobject" and record["tri"] is not None:
+                tri_data, tri_indices = record["tri"]
+                tri_bytes = tri_data.tobytes()
+                index_bytes = np.ascontiguousarray(tri_indices).tobytes()
+            raw = np.ascontiguousarray(data).tobytes()
+            body = {
+                "raw": raw, "tri_bytes": tri_bytes, "index_bytes": index_bytes,
+                "hash": hashlib.blake2b(raw + tri_bytes, digest_size=8).hexdigest(),
+                "dtype": data.dtype, "num_verts": len(data),
+                "stroke_verts": None,
+            }
+        if stamps is not None:
+            serialized[stamps] = body
+        raw, tri_bytes, index_bytes = body["raw"], body["tri_bytes"], body["index_bytes"]
+        content_hash = body["hash"]
         batch = {
             "kind": record["kind"],
             "hash": content_hash,
-            "num_verts": len(data),
+            "num_verts": body["num_verts"],
             "stride": record["stride"],
             "uniforms": record["uniforms"],
             "depth_test": record["depth_test"],
@@ -301,16 +498,23 @@ def serialize_scene(scene: Scene, cache: GeometryCache | None = None) -> bytes:
         if record["kind"] == "vmobject":
             batch["stroke_behind"] = record["stroke_behind"]
             batch["fill_mode"] = record["fill_mode"]
-            batch["stroke_verts"] = _stroke_verts(data, frame_scale)
+            # Depends on the zoom as well as the curves
+            if body["stroke_verts"] is None or body["stroke_verts"][0] != frame_scale:
+                data = np.frombuffer(raw, dtype=body["dtype"])
+                body["stroke_verts"] = (frame_scale, _stroke_verts(data, frame_scale))
+            batch["stroke_verts"] = body["stroke_verts"][1]
         if record["textures"]:
             batch["textures"] = record["textures"]
             for tex_hash in record["textures"].values():
-                if cache is None or f"tex:{tex_hash}" not in cache.sent:
+                if cache is None or tex_hash not in cache.textures:
                     needed_textures[tex_hash] = _TEXTURE_BY_HASH[tex_hash]
 
-        if cache is not None and content_hash in cache.sent:
+        drawn.add(content_hash)
+        shapes.append(_shape(record, content_hash))
+        if cache is not None and cache.holds(content_hash):
             batch["cached"] = True
         else:
+            held = False
             batch["offset"] = offset
             blobs.append(raw)
             offset += len(raw)
@@ -324,16 +528,19 @@ def serialize_scene(scene: Scene, cache: GeometryCache | None = None) -> bytes:
                 blobs.append(index_bytes)
                 offset += len(tri_bytes) + len(index_bytes)
             if cache is not None:
-                cache.sent.add(content_hash)
+                cache.add(content_hash, len(raw) + len(tri_bytes) + len(index_bytes))
         batches.append(batch)
 
+    if cache is not None:
+        cache.batches = serialized
+
     texture_data = {}
     for tex_hash, raw_tex in needed_textures.items():
         texture_data[tex_hash] = {"offset": offset, "nbytes": len(raw_tex)}
         blobs.append(raw_tex)
         offset += len(raw_tex)
         if cache is not None:
-            cache.sent.add(f"tex:{tex_hash}")
+            cache.textures.add(tex_hash)
 
     header = {
         "camera": {k: _jsonable(v) for k, v in camera.uniforms.items()},
@@ -345,19 +552,363 @@ def serialize_scene(scene: Scene, cache: GeometryCache | None = None) -> bytes:
         "texture_data": texture_data,
         "unsupported": unsupported,
     }
-    header_bytes = json.dumps(header).encode()
+    if cache is not None and cache.budget is not None:
+        header["evict"] = cache.evict(drawn)
+    if cache is not None:
+        unchanged = (
+            held and not needed_textures and not header.get("evict")
+            and cache.shapes == (shapes, unsupported))
+        cache.shapes = (shapes, unsupported)
+        if camera_only and unchanged:
+            message = encode_camera_message(header)
+            if message is not None:
+                return message
+    message_type = GEOMETRY_MESSAGE_TYPE
+    header_bytes = encode_binary_header(header) if binary else None
+    if header_bytes is not None:
+        message_type = GEOMETRY_BINARY_MESSAGE_TYPE
+    else:
+        header_bytes = json.dumps(header).encode()
     return b"".join([
-        bytes([GEOMETRY_MESSAGE_TYPE]),
+        bytes([message_type]),
         struct.pack("<I", len(header_bytes)),
         header_bytes,
         *blobs,
     ])
 
 
+# -- The binary header (0x06) --
+#
+# Camera block, fixed size:
+#     f32 view[16], frame_scale, frame_rescale_factors[3], pixel_size,
+#     camera_position[3], light_position[3], background[4];
+#     u32 width, height; u8 samples, vertex_stride
+# Schemas: varint count, then per schema a u8 kind and a varint field
+#     count, then per field a string name and a u8 size (0: a scalar)
+# Batches: varint count, then per batch
+#     varint schema, u8 flags (BATCH_*), 8-byte hash, varint num_verts,
+#     varint stride, f32 uniform values in schema order;
+#     vmobject: varint stroke_verts; not cached: varint offset;
+#     tri: varint voffset, vcount, ioffset, icount;
+#     textures: varint count, then (string sampler, 8-byte hash) each
+# Textures: varint count, then (8-byte hash, varint offset, varint nbytes)
+# Unsupported: varint count, then strings
+# Evict: u8 present, then varint count, then 8-byte hashes
+# Strings are a varint byte length and UTF-8; varints are unsigned LEB128.
+
+CAMERA_LAYOUT = (
+    ("view", 16), ("frame_scale", 0), ("frame_rescale_factors", 3),
+    ("pixel_size", 0), ("camera_position", 3), ("light_position", 3),
+)
+CAMERA_BLOCK = struct.Struct("<31f2I2B")
+BATCH_KINDS = ("vmobject", "dotcloud", "image", "surface", "texsurface")
+BATCH_CACHED = 0x01
+BATCH_DEPTH_TEST = 0x02
+BATCH_STROKE_BEHIND = 0x04
+BATCH_TRIANGULATED = 0x08  # fill_mode; winding otherwise
+BATCH_TRI = 0x10
+BATCH_TEXTURES = 0x20
+
+_SCHEMA_STRUCTS: dict[int, struct.Struct] = {}
+
+
+class _Unencodable(Exception):
+    """A header the binary layout cannot express; it goes as JSON."""
+
+
+def _varint(out: bytearray, value: int) -> None:
+    if value < 0:
+        raise _Unencodable(f"negative varint {value}")
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _string(out: bytearray, value: str) -> None:
+    raw = value.encode()
+    _varint(out, len(raw))
+    out += raw
+
+
+def _hash_bytes(content_hash: str) -> bytes:
+    if len(content_hash) != 16:
+        raise _Unencodable(f"hash {content_hash!r}")
+    return bytes.fromhex(content_hash)
+
+
+def _size(value) -> int:
+    """A uniform's schema size: 0 for a scalar, else its length."""
+    if type(value) is list:
+        if not value:
+            raise _Unencodable("empty uniform")
+        return len(value)
+    return 0
+
+
+def encode_binary_header(header: dict) -> bytes | None:
+    """The binary form of a geometry header, or None when the header
+    holds something the layout has no room for (an unknown batch kind,
+    a camera uniform it does not list, a non-numeric uniform)."""
+    try:
+        return _encode_binary_header(header)
+    except (_Unencodable, struct.error, KeyError, ValueError):
+        return None
+
+
+def _camera_block(header: dict) -> bytes:
+    camera = header["camera"]
+    if len(camera) != len(CAMERA_LAYOUT):
+        raise _Unencodable("camera uniforms")
+    floats = []
+    for name, size in CAMERA_LAYOUT:
+        value = camera[name]
+        if _size(value) != size:
+            raise _Unencodable(f"camera uniform {name}")
+        if size:
+            floats.extend(value)
+        else:
+            floats.append(value)
+    floats.extend(header["background"])
+    width, height = header["resolution"]
+    return CAMERA_BLOCK.pack(
+        *floats, width, height, header["samples"], header["vertex_stride"])
+
+
+def encode_camera_message(header: dict) -> bytes | None:
+    """A 0x07 camera update carrying this header's camera: [0x07], the
+    camera block, then a varint count and each batch's stroke_verts as
+    a varint (0 for batches other than vmobjects). None when the camera
+    does not fit the block."""
+    try:
+        out = bytearray([CAMERA_MESSAGE_TYPE])
+        out += _camera_block(header)
+    except (_Unencodable, struct.error, KeyError, ValueError):
+        return None
+    _varint(out, len(header["batches"]))
+    for batch in header["batches"]:
+        _varint(out, batch.get("stroke_verts", 0))
+    return bytes(out)
+
+
+def _encode_binary_header(header: dict) -> bytes:
+    out = bytearray(_camera_block(header))
+
+    # Interning: schema key -> index, in first-use order
+    schemas: dict[tuple, int] = {}
+    table = bytearray()
+    _varint(table, len(header["batches"]))
+    for batch in header["batches"]:
+        kind = batch["kind"]
+        if kind not in BATCH_KINDS:
+            raise _Unencodable(f"batch kind {kind!r}")
+        # struct.pack below rejects anything that is not a number
+        key = [kind]
+        values = []
+        for name, value in batch["uniforms"].items():
+            if type(value) is list:
+                key.append((name, _size(value)))
+                values.extend(value)
+            else:
+                key.append((name, 0))
+                values.append(value)
+        index = schemas.setdefault(tuple(key), len(schemas))
+        flags = BATCH_DEPTH_TEST if batch["depth_test"] else 0
+        cached = batch.get("cached", False)
+        if cached:
+            flags |= BATCH_CACHED
+        if kind == "vmobject":
+            if batch["stroke_behind"]:
+                flags |= BATCH_STROKE_BEHIND
+            if batch["fill_mode"] == "triangulated":
+                flags |= BATCH_TRIANGULATED
+        tri = batch.get("tri")
+        if tri is not None:
+            flags |= BATCH_TRI
+        textures = batch.get("textures")
+        if textures:
+            flags |= BATCH_TEXTURES
+        _varint(table, index)
+        table.append(flags)
+        table += _hash_bytes(batch["hash"])
+        _varint(table, batch["num_verts"])
+        _varint(table, batch["stride"])
+        packer = _SCHEMA_STRUCTS.get(len(values))
+        if packer is None:
+            packer = _SCHEMA_STRUCTS[len(values)] = struct.Struct(f"<{len(values)}f")
+        table += packer.pack(*values)
+        if kind == "vmobject":
+            _varint(table, batch["stroke_verts"])
+        if not cached:
+            _varint(table, batch["offset"])
+        if tri is not None:
+            for field in ("voffset", "vcount", "ioffset", "icount"):
+                _varint(table, tri[field])
+        if textures:
+            _varint(table, len(textures))
+            for sampler, tex_hash in textures.items():
+                _string(table, sampler)
+                table += _hash_bytes(tex_hash)
+
+    _varint(out, len(schemas))
+    for kind, *fields in schemas:
+        out.append(BATCH_KINDS.index(kind))
+        _varint(out, len(fields))
+        for name, size in fields:
+            _string(out, name)
+            out.append(size)
+    out += table
+
+    _varint(out, len(header["texture_data"]))
+    for tex_hash, ref in header["texture_data"].items():
+        out += _hash_bytes(tex_hash)
+        _varint(out, ref["offset"])
+        _varint(out, ref["nbytes"])
+    _varint(out, len(header["unsupported"]))
+    for name in header["unsupported"]:
+        _string(out, name)
+    evict = header.get("evict")
+    out.append(evict is not None)
+    if evict is not None:
+        _varint(out, len(evict))
+        for content_hash in evict:
+            out += _hash_bytes(content_hash)
+    return bytes(out)
+
+
+class _Reader:
+    def __init__(self, data: bytes, pos: int = 0):
+        self.data = data
+        self.pos = pos
+
+    def byte(self) -> int:
+        self.pos += 1
+        return self.data[self.pos - 1]
+
+    def varint(self) -> int:
+        value = shift = 0
+        while True:
+            b = self.byte()
+            value |= (b & 0x7F) << shift
+            if b < 0x80:
+                return value
+            shift += 7
+
+    def string(self) -> str:
+        n = self.varint()
+        self.pos += n
+        return bytes(self.data[self.pos - n:self.pos]).decode()
+
+    def hash(self) -> str:
+        self.pos += 8
+        return bytes(self.data[self.pos - 8:self.pos]).hex()
+
+    def floats(self, n: int) -> tuple:
+        values = struct.unpack_from(f"<{n}f", self.data, self.pos)
+        self.pos += 4 * n
+        return values
+
+
+def _read_camera_block(data: bytes, offset: int = 0) -> dict:
+    values = CAMERA_BLOCK.unpack_from(data, offset)
+    camera, at = {}, 0
+    for name, size in CAMERA_LAYOUT:
+        camera[name] = list(values[at:at + size]) if size else values[at]
+        at += size or 1
+    return {
+        "camera": camera,
+        "background": list(values[at:at + 4]),
+        "resolution": list(values[at + 4:at + 6]),
+        "samples": values[at + 6],
+        "vertex_stride": values[at + 7],
+    }
+
+
+def decode_binary_header(data: bytes) -> dict:
+    """Inverse of encode_binary_header."""
+    header = _read_camera_block(data)
+    r = _Reader(data, CAMERA_BLOCK.size)
+    schemas = []
+    for _ in range(r.varint()):
+        kind = BATCH_KINDS[r.byte()]
+        schemas.append((kind, [(r.string(), r.byte()) for _ in range(r.varint())]))
+
+    batches = header["batches"] = []
+    for _ in range(r.varint()):
+        kind, fields = schemas[r.varint()]
+        flags = r.byte()
+        batch = {"kind": kind, "hash": r.hash(), "num_verts": r.varint(),
+                 "stride": r.varint()}
+        flat = r.floats(sum(size or 1 for _, size in fields))
+        uniforms, at = {}, 0
+        for name, size in fields:
+            uniforms[name] = list(flat[at:at + size]) if size else flat[at]
+            at += size or 1
+        batch["uniforms"] = uniforms
+        batch["depth_test"] = bool(flags & BATCH_DEPTH_TEST)
+        if kind == "vmobject":
+            batch["stroke_behind"] = bool(flags & BATCH_STROKE_BEHIND)
+            batch["fill_mode"] = (
+                "triangulated" if flags & BATCH_TRIANGULATED else "winding")
+            batch["stroke_verts"] = r.varint()
+        if flags & BATCH_CACHED:
+            batch["cached"] = True
+        else:
+            batch["offset"] = r.varint()
+        if flags & BATCH_TRI:
+            batch["tri"] = {field: r.varint()
+                            for field in ("voffset", "vcount", "ioffset", "icount")}
+        if flags & BATCH_TEXTURES:
+            batch["textures"] = {r.string(): r.hash() for _ in range(r.varint())}
+        batches.append(batch)
+
+    header["texture_data"] = {
+        r.hash(): {"offset": r.varint(), "nbytes": r.varint()}
+        for _ in range(r.varint())}
+    header["unsupported"] = [r.string() for _ in range(r.varint())]
+    if r.byte():
+        header["evict"] = [r.hash() for _ in range(r.varint())]
+    return header
+
+
+def split_geometry_message(message) -> tuple[dict, int]:
+    """(header dict, offset of the vertex section) of a 0x03 or 0x06
+    message."""
+    (header_len,) = struct.unpack_from("<I", message, 1)
+    raw = bytes(message[5:5 + header_len])
+    if message[0] == GEOMETRY_BINARY_MESSAGE_TYPE:
+        return decode_binary_header(raw), 5 + header_len
+    if message[0] != GEOMETRY_MESSAGE_TYPE:
+        raise ValueError(f"not a geometry message: type {message[0]:#x}")
+    return json.loads(raw.decode()), 5 + header_len
+
+
+def apply_camera_message(header: dict, message: bytes) -> dict:
+    """The header a 0x07 camera update stands for: `header`, the last
+    one rendered, with the update's camera and stroke_verts, and every
+    batch now cached."""
+    if message[0] != CAMERA_MESSAGE_TYPE:
+        raise ValueError(f"not a camera message: type {message[0]:#x}")
+    updated = dict(header, **_read_camera_block(message, 1))
+    r = _Reader(message, 1 + CAMERA_BLOCK.size)
+    if r.varint() != len(header["batches"]):
+        raise ValueError("camera message for a different batch list")
+    updated["batches"] = []
+    for batch in header["batches"]:
+        batch = {k: v for k, v in batch.items() if k not in ("offset", "tri")}
+        batch["cached"] = True
+        stroke_verts = r.varint()
+        if batch["kind"] == "vmobject":
+            batch["stroke_verts"] = stroke_verts
+        updated["batches"].append(batch)
+    updated["texture_data"] = {}
+    if "evict" in header:
+        updated["evict"] = []
+    return updated
+
+
 def parse_geometry_message(message: bytes):
     """Inverse of serialize_scene, for tests and tooling: returns
     (header dict, vertex bytes)."""
-    assert message[0] == GEOMETRY_MESSAGE_TYPE
-    (header_len,) = struct.unpack_from("<I", message, 1)
-    header = json.loads(message[5:5 + header_len].decode())
-    return header, message[5 + header_len:]
+    header, base = split_geometry_message(message)
+    return header, message[base:]
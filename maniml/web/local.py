@@ -0,0 +1,110 @@
+"""The local transport between the app and the scene processes it runs.
+
+A scene opened through `maniml app` serves its viewer socket as usual,
+but the app's relay no longer reaches it as a WebSocket client over
+loopback TCP. The app names a Unix domain socket in the child's
+environment (LOCAL_SOCKET_ENV), the scene's `WebServer` listens on it
+as well, and each message crosses with a 5-byte header: an opcode and a
+length. The relay reads a payload whole and hands that same bytes
+object to the browser's WebSocket, so a frame is framed once, for the
+browser, instead of being framed, parsed and reassembled by a second
+WebSocket hop on the way.
+
+The socket lives in a private (0700) directory, which is the boundary:
+only this user can connect, which is the same trust line the Origin
+check draws for the loopback port (see security.py). Where there are no
+Unix sockets, `socket_path` returns None and the relay keeps using TCP.
+
+The kernel holds a few frames in the socket that the old relay's
+`max_queue=1` client would not have taken. The scene's pacing is not
+fooled by that: the page's frame acks (congestion.py) time the browser
+end to end, through the relay.
+
+`LocalConnection` exposes the part of a websockets connection that the
+server and the relay use (`send`, async iteration, `close`), so neither
+side cares which transport a message came in on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import socket
+import struct
+import tempfile
+
+LOCAL_SOCKET_ENV = "MANIML_LOCAL_SOCKET"
+# [u8 opcode][u32 length], then the payload
+FRAME_HEADER = struct.Struct("<BI")
+TEXT, BINARY = 1, 2
+
+
+def socket_path() -> str | None:
+    """A fresh socket path in a private directory, or None where Unix
+    sockets are unavailable."""
+    if not hasattr(socket, "AF_UNIX") or os.name == "nt":
+        return None
+    return os.path.join(tempfile.mkdtemp(prefix="maniml-"), "scene.sock")
+
+
+def remove_socket(path: str | None) -> None:
+    """Remove a socket made by `socket_path`, and its directory."""
+    if path:
+        shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
+
+class LocalConnection:
+    """One message stream over a Unix socket, shaped like a websockets
+    connection. `max_size` bounds inbound messages (None: unbounded)."""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        max_size: int | None = None,
+    ):
+        self._reader = reader
+        self._writer = writer
+        self._max_size = max_size
+        # Wait on each send until it is with the kernel, as a websockets
+        # send does, so the sender's flow control sees a slow reader
+        writer.transport.set_write_buffer_limits(high=0)
+
+    @classmethod
+    async def connect(cls, path: str, max_size: int | None = None) -> "LocalConnection":
+        reader, writer = await asyncio.open_unix_connection(path)
+        return cls(reader, writer, max_size)
+
+    async def send(self, message: str | bytes) -> None:
+        if isinstance(message, str):
+            opcode, message = TEXT, message.encode()
+        else:
+            opcode = BINARY
+        self._writer.writelines((FRAME_HEADER.pack(opcode, len(message)), message))
+        await self._writer.drain()
+
+    async def __aiter__(self):
+        while True:
+            try:
+                opcode, size = FRAME_HEADER.unpack(
+                    await self._reader.readexactly(FRAME_HEADER.size))
+                if self._max_size is not None and size > self._max_size:
+                    return
+                payload = await self._reader.readexactly(size)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            yield payload.decode() if opcode == TEXT else payload
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+    async def __aenter__(self) -> "LocalConnection":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -139,6 +139,14 @@ class ReferenceRenderer:
             self.batch_cache[batch["hash"]] = resources
         return resources
 
+    def _evict(self, hashes):
+        """Drop the batches the server's LRU evicted."""
+        for content_hash in hashes:
+            resources = self.batch_cache.pop(content_hash, None) or {}
+            for resource in resources.values():
+                if hasattr(resource, "release"):
+                    resource.release()
+
     def _ensure_targets(self, size, samples):
         if self._size == (size, samples):
             return
@@ -181,6 +189,7 @@ class ReferenceRenderer:
             elif batch["kind"] in PLAIN_KINDS:
                 self._render_plain(header, batch, vertex_bytes)
         self.ctx.disable(moderngl.DEPTH_TEST)
+        self._evict(header.get("evict", ()))
 
         read_fbo = self.out_fbo
         if self.resolve_fbo is not None:
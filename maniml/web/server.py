@@ -7,25 +7,60 @@ frames/state and queues inbound input events, so the page and its socket are
 the same origin and the page needs to be told nothing about where to connect.
 
 Threading contract: the scene thread talks to this module only through
-`broadcast()` (thread-safe, hands off to the asyncio loop) and
-`pop_events()` (drains a thread-safe deque). WebSocket handlers never
-touch the scene directly.
+`broadcast()`/`send_frame()` (thread-safe, hand off to the asyncio loop),
+`pop_events()` (drains a thread-safe deque) and the pacing reads
+`frame_interval()`/`jpeg_qualities()`. WebSocket handlers never touch the
+scene directly.
+
+Pixel frames go through `send_frame` and are paced per client by a
+`congestion.FrameController`, which the page's `ack` events steer; acks
+are consumed here on the event loop and never reach the scene. A frame
+encoded at several JPEG quality tiers goes to each client at its own.
+
+Geometry state (the batch cache, the delta codec) is one per session, not
+per client. A client that joins is held back from geometry until the viewer
+has handled its `_connect` event and called `admit()`; by then the next
+payload is a full one, so the joiner never sees a delta against a frame it
+did not receive.
+
+Given `local_path`, the same clients are also served over a Unix socket
+(`web.local`), which is how the app's relay reaches a scene it runs.
 """
 
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
+import math
 import socket
 import threading
+import time
 from collections import deque
 
 from maniml.logger import log
 from maniml.web.assets import is_websocket_upgrade, static_response
+from maniml.web.congestion import FrameController, quality_tier
+from maniml.web.delta import DELTA_MESSAGE_TYPE
+from maniml.web.geometry import (
+    CAMERA_MESSAGE_TYPE,
+    GEOMETRY_BINARY_MESSAGE_TYPE,
+    GEOMETRY_MESSAGE_TYPE,
+)
+from maniml.web.local import LocalConnection
+from maniml.web.pixels import JPEG_QUALITY
 from maniml.web.security import MAX_CONTROL_MESSAGE, parse_json_object
 
 DEFAULT_PORT = 8687
 MAX_EVENT_QUEUE = 1024
+MAX_ACKED_FRAMES = 1024
+# Messages that build on what a client already holds (cached batches,
+# delta references, the last full scene), so a client that just joined
+# cannot use them until the viewer has reset that state for it
+GEOMETRY_TYPES = frozenset((
+    GEOMETRY_MESSAGE_TYPE, DELTA_MESSAGE_TYPE,
+    GEOMETRY_BINARY_MESSAGE_TYPE, CAMERA_MESSAGE_TYPE,
+))
 
 
 class ClientLease:
@@ -79,6 +114,7 @@ class WebServer:
         self,
         port: int | None = None,
         capabilities: tuple[str, ...] = (),
+        local_path: str | None = None,
     ):
         self._socket = bind_loopback(DEFAULT_PORT if port is None else port, scan=40)
         self.port = self._socket.getsockname()[1]
@@ -87,10 +123,19 @@ class WebServer:
         # server serves its own page on.
         self.allowed_origins = {f"http://localhost:{self.port}"}
         self.capabilities = list(capabilities)
+        self.local_path = local_path
 
         self._events: deque[dict] = deque()
         self._clients: set = set()
         self._busy: set = set()  # clients with an unfinished frame send
+        # Joined clients the viewer has not admitted to geometry yet, by
+        # the id their `_connect` event carries
+        self._joining: dict = {}
+        self._client_ids = itertools.count()
+        # Each client's pacing, written on the event loop and read from
+        # the scene thread
+        self._controllers: dict = {}
+        self._controllers_lock = threading.Lock()
         self._client_lease = ClientLease()
         self._loop: asyncio.AbstractEventLoop | None = None
         self._closing: asyncio.Event | None = None
@@ -121,6 +166,12 @@ class WebServer:
                     origins=sorted(self.allowed_origins),
                     max_size=MAX_CONTROL_MESSAGE, max_queue=32,
                     compression=None):
+                if self.local_path:
+                    try:
+                        await asyncio.start_unix_server(
+                            self._handle_local, path=self.local_path)
+                    except OSError as e:  # the relay falls back to TCP
+                        log.warning(f"local socket unavailable: {e}")
                 self._started.set()
                 await self._closing.wait()  # released by stop()
 
@@ -129,15 +180,25 @@ class WebServer:
         except Exception as e:  # daemon thread: report, don't kill the scene
             log.error(f"web viewer server died: {e}")
 
+    async def _handle_local(self, reader, writer):
+        # Only this user can reach the socket's directory: that is this
+        # transport's Origin check
+        await self._handle_client(
+            LocalConnection(reader, writer, max_size=MAX_CONTROL_MESSAGE))
+
     async def _handle_client(self, ws):
         registered = False
+        client = next(self._client_ids)
         try:
             # The Origin check in the handshake already decided this; a
             # connection that gets here is the page we served.
+            self._joining[client] = ws
             self._clients.add(ws)
+            with self._controllers_lock:
+                self._controllers[ws] = FrameController()
             self._client_lease.connected()
             registered = True
-            self._events.append({"type": "_connect"})
+            self._events.append({"type": "_connect", "client": client})
             await ws.send(json.dumps({
                 "type": "ready",
                 "capabilities": self.capabilities,
@@ -146,6 +207,9 @@ class WebServer:
                 event = parse_json_object(message)
                 if event is None:
                     continue
+                if event.get("type") == "ack":
+                    await self._acked(ws, event)
+                    continue
                 if len(self._events) >= MAX_EVENT_QUEUE:
                     await ws.close(code=1013, reason="event queue full")
                     return
@@ -155,18 +219,55 @@ class WebServer:
         finally:
             self._clients.discard(ws)
             self._busy.discard(ws)
+            self._joining.pop(client, None)
+            with self._controllers_lock:
+                self._controllers.pop(ws, None)
             if registered:
                 self._client_lease.disconnected()
 
-    def _send_to_all(self, data, droppable: bool):
+    async def _acked(self, ws, event: dict) -> None:
+        """A page put `frames` more pixel frames on screen, having spent
+        `decode` + `render` milliseconds on them."""
+        frames, decode, render = (
+            event.get("frames"), event.get("decode", 0), event.get("render", 0))
+        if (not isinstance(frames, int) or not 0 < frames <= MAX_ACKED_FRAMES
+                or not all(isinstance(v, (int, float)) and math.isfinite(v)
+                           and v >= 0 for v in (decode, render))):
+            return
+        controller = self._controllers.get(ws)
+        if controller is None:
+            return
+        if controller.acked(frames, (decode + render) / 1000, time.monotonic()):
+            # Pixels cannot keep up even at the lowest quality and rate
+            await ws.send(json.dumps({"type": "congestion", "suggest": "geometry"}))
+
+    def _send_to_all(self, data, droppable: bool, frame: bool = False):
+        now = time.monotonic()
+        joining = ()
+        if (self._joining and isinstance(data, bytes)
+                and data[:1] and data[0] in GEOMETRY_TYPES):
+            joining = set(self._joining.values())
         for ws in list(self._clients):
+            if ws in joining:
+                continue  # it holds none of what this payload builds on
             if droppable and ws in self._busy:
                 continue  # slow client: skip this frame rather than queue it
+            controller = self._controllers.get(ws) if frame else None
+            if controller is not None:
+                if droppable and not controller.may_send(now):
+                    continue  # over its window or inside its interval
+                controller.sent(now)
+            payload = data
+            if isinstance(data, dict):
+                # Its own tier, or the lowest when its tier moved since
+                # the frame was encoded
+                tier = quality_tier(controller.quality) if controller else None
+                payload = data.get(tier) or data[min(data)]
             self._busy.add(ws)
 
-            async def send(ws=ws):
+            async def send(ws=ws, payload=payload):
                 try:
-                    await ws.send(data)
+                    await ws.send(payload)
                 except Exception:
                     self._clients.discard(ws)
                 finally:
@@ -185,6 +286,40 @@ class WebServer:
         if self._loop is not None:
             self._loop.call_soon_threadsafe(self._send_to_all, data, droppable)
 
+    def send_frame(self, data: bytes | dict[int, bytes], droppable: bool = False) -> None:
+        """Broadcast a pixel frame, which the page acknowledges: a
+        droppable one skips each client its controller is holding back.
+        `data` may map quality tiers to the frame encoded at each; every
+        client is sent its own tier's."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._send_to_all, data, droppable, True)
+
+    def admit(self, client: int | None) -> None:
+        """Let a joined client receive geometry. The viewer calls this once
+        it has reset its geometry state for the client's `_connect`, so
+        the next payload it sends is a full one."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._joining.pop, client, None)
+
+    def frame_interval(self, shared: bool = False) -> float:
+        """How often to produce frames, 0 for unpaced: the shortest
+        interval any client is paced to, since each controller skips the
+        droppable frames its client cannot take. `shared` frames go to
+        every client (tile frames build on each other), so those are
+        paced to the longest."""
+        with self._controllers_lock:
+            intervals = [c.interval for c in self._controllers.values()]
+        if not intervals:
+            return 0.0
+        return max(intervals) if shared else min(intervals)
+
+    def jpeg_qualities(self) -> tuple[int, ...]:
+        """The quality tiers clients are paced to, best first: a JPEG
+        frame is encoded once at each."""
+        with self._controllers_lock:
+            tiers = {quality_tier(c.quality) for c in self._controllers.values()}
+        return tuple(sorted(tiers, reverse=True)) or (JPEG_QUALITY,)
+
     def broadcast_json(self, obj: dict) -> None:
         self.broadcast(json.dumps(obj))
 
@@ -0,0 +1,76 @@
+// Temporal delta decoding for the geometry stream (message type 0x04).
+// This file mirrors maniml/web/delta.py's DeltaDecoder — same envelope,
+// same residency rule; keep the two in sync. The output is the original
+// geometry message (0x03 or 0x06), so gl.js and webgpu.js never see a
+// delta. Headers are read with geometry.js.
+"use strict";
+
+const ManimlDelta = (() => {
+  const DELTA_MESSAGE_TYPE = 4;
+  const FLAG_DEFLATE = 1;
+  const utf8 = new TextDecoder();
+
+  function batchBytes(batch) {
+    let n = batch.num_verts * batch.stride;
+    if (batch.tri) n += batch.tri.vcount * 40 + batch.tri.icount * 4;
+    return n;
+  }
+
+  async function inflate(bytes) {
+    const stream = new Blob([bytes]).stream()
+      .pipeThrough(new DecompressionStream("deflate"));
+    return new Uint8Array(await new Response(stream).arrayBuffer());
+  }
+
+  class Decoder {
+    constructor() { this.reset(); }
+
+    reset() { this.resident = new Map(); }
+
+    // ArrayBuffer in (0x03, 0x06, 0x07 or 0x04), ArrayBuffer of a
+    // geometry message out.
+    // Throws on a delta against a batch this decoder does not hold.
+    async decode(buffer) {
+      const bytes = new Uint8Array(buffer);
+      if (ManimlGeometry.isGeometry(bytes[0])) return buffer;
+      if (bytes[0] !== DELTA_MESSAGE_TYPE) {
+        throw new Error("not a geometry message: type " + bytes[0]);
+      }
+      const flags = bytes[1];
+      const metaLen = new DataView(buffer).getUint32(2, true);
+      const meta = JSON.parse(utf8.decode(bytes.subarray(6, 6 + metaLen)));
+      let plain = bytes.slice(6 + metaLen);
+      if (flags & FLAG_DEFLATE) plain = await inflate(plain);
+
+      const { header, base } = ManimlGeometry.parse(plain.buffer);
+      const resident = meta.key ? new Map() : this.resident;
+      const next = new Map();
+      header.batches.forEach((batch, index) => {
+        if (batch.cached) {
+          if (resident.has(batch.hash)) {
+            next.set(batch.hash, resident.get(batch.hash));
+          }
+          return;
+        }
+        const start = base + batch.offset;
+        const end = start + batchBytes(batch);
+        const ref = meta.delta[String(index)];
+        if (ref !== undefined) {
+          const refBytes = resident.get(ref);
+          if (!refBytes) {
+            throw new Error("delta against batch " + ref
+                            + ", which this decoder does not hold");
+          }
+          for (let i = 0; i < refBytes.length; i++) {
+            plain[start + i] ^= refBytes[i];
+          }
+        }
+        next.set(batch.hash, plain.slice(start, end));
+      });
+      this.resident = next;
+      return plain.buffer;
+    }
+  }
+
+  return { DELTA_MESSAGE_TYPE, Decoder };
+})();
@@ -0,0 +1,180 @@
+// Geometry message headers: 0x03 carries JSON, 0x06 the binary layout,
+// and 0x07 is a camera update to the header rendered before it. This file
+// mirrors maniml/web/geometry.py's decode_binary_header and
+// apply_camera_message — same layout; keep them in sync. Every kind parses
+// to the same header object, so gl.js, webgpu.js and delta.js never care
+// which one arrived.
+"use strict";
+
+const ManimlGeometry = (() => {
+  const GEOMETRY_MESSAGE_TYPE = 3;
+  const BINARY_MESSAGE_TYPE = 6;
+  const CAMERA_MESSAGE_TYPE = 7;
+  const CAMERA_LAYOUT = [
+    ["view", 16], ["frame_scale", 0], ["frame_rescale_factors", 3],
+    ["pixel_size", 0], ["camera_position", 3], ["light_position", 3],
+  ];
+  const BATCH_KINDS = ["vmobject", "dotcloud", "image", "surface", "texsurface"];
+  const BATCH_CACHED = 0x01;
+  const BATCH_DEPTH_TEST = 0x02;
+  const BATCH_STROKE_BEHIND = 0x04;
+  const BATCH_TRIANGULATED = 0x08;
+  const BATCH_TRI = 0x10;
+  const BATCH_TEXTURES = 0x20;
+  const HEX = Array.from({ length: 256 }, (_, i) => i.toString(16).padStart(2, "0"));
+  const utf8 = new TextDecoder();
+
+  function isGeometry(type) {
+    return type === GEOMETRY_MESSAGE_TYPE || type === BINARY_MESSAGE_TYPE
+      || type === CAMERA_MESSAGE_TYPE;
+  }
+
+  class Reader {
+    constructor(bytes, pos = 0) {
+      this.bytes = bytes;
+      this.view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+      this.pos = pos;
+    }
+
+    byte() { return this.bytes[this.pos++]; }
+
+    varint() {
+      let value = 0, scale = 1, b;
+      do {
+        b = this.bytes[this.pos++];
+        value += (b & 0x7f) * scale;
+        scale *= 128;
+      } while (b & 0x80);
+      return value;
+    }
+
+    string() {
+      const n = this.varint();
+      this.pos += n;
+      return utf8.decode(this.bytes.subarray(this.pos - n, this.pos));
+    }
+
+    hash() {
+      let s = "";
+      for (let i = 0; i < 8; i++) s += HEX[this.bytes[this.pos++]];
+      return s;
+    }
+
+    float() {
+      this.pos += 4;
+      return this.view.getFloat32(this.pos - 4, true);
+    }
+
+    u32() {
+      this.pos += 4;
+      return this.view.getUint32(this.pos - 4, true);
+    }
+
+    // [name, size] pairs, size 0 for a scalar, read into `into`
+    fields(layout, into) {
+      for (const [name, size] of layout) {
+        if (size === 0) { into[name] = this.float(); continue; }
+        const values = new Array(size);
+        for (let i = 0; i < size; i++) values[i] = this.float();
+        into[name] = values;
+      }
+      return into;
+    }
+
+    camera() {
+      const camera = this.fields(CAMERA_LAYOUT, {});
+      const background = [this.float(), this.float(), this.float(), this.float()];
+      const resolution = [this.u32(), this.u32()];
+      return { camera, background, resolution,
+               samples: this.byte(), vertex_stride: this.byte() };
+    }
+  }
+
+  function decodeBinary(bytes) {
+    const r = new Reader(bytes);
+    const header = r.camera();
+    const schemas = [];
+    for (let n = r.varint(); n > 0; n--) {
+      const kind = BATCH_KINDS[r.byte()];
+      const layout = [];
+      for (let f = r.varint(); f > 0; f--) layout.push([r.string(), r.byte()]);
+      schemas.push({ kind, layout });
+    }
+    const batches = header.batches = [];
+    for (let n = r.varint(); n > 0; n--) {
+      const { kind, layout } = schemas[r.varint()];
+      const flags = r.byte();
+      const batch = { kind, hash: r.hash(), num_verts: r.varint(), stride: r.varint() };
+      batch.uniforms = r.fields(layout, {});
+      batch.depth_test = !!(flags & BATCH_DEPTH_TEST);
+      if (kind === "vmobject") {
+        batch.stroke_behind = !!(flags & BATCH_STROKE_BEHIND);
+        batch.fill_mode = flags & BATCH_TRIANGULATED ? "triangulated" : "winding";
+        batch.stroke_verts = r.varint();
+      }
+      if (flags & BATCH_CACHED) batch.cached = true;
+      else batch.offset = r.varint();
+      if (flags & BATCH_TRI) {
+        batch.tri = { voffset: r.varint(), vcount: r.varint(),
+                      ioffset: r.varint(), icount: r.varint() };
+      }
+      if (flags & BATCH_TEXTURES) {
+        batch.textures = {};
+        for (let t = r.varint(); t > 0; t--) batch.textures[r.string()] = r.hash();
+      }
+      batches.push(batch);
+    }
+
+    header.texture_data = {};
+    for (let n = r.varint(); n > 0; n--) {
+      header.texture_data[r.hash()] = { offset: r.varint(), nbytes: r.varint() };
+    }
+    header.unsupported = [];
+    for (let n = r.varint(); n > 0; n--) header.unsupported.push(r.string());
+    if (r.byte()) {
+      header.evict = [];
+      for (let n = r.varint(); n > 0; n--) header.evict.push(r.hash());
+    }
+    return header;
+  }
+
+  // `previous` with a camera update's camera and stroke_verts applied, and
+  // every batch cached: the client already holds them all.
+  function applyCamera(bytes, previous) {
+    if (!previous) throw new Error("camera update before any geometry");
+    const r = new Reader(bytes, 1);
+    const header = { ...previous, ...r.camera() };
+    if (r.varint() !== previous.batches.length) {
+      throw new Error("camera update for a different batch list");
+    }
+    header.batches = previous.batches.map((batch) => {
+      const { offset, tri, ...rest } = batch;
+      const strokeVerts = r.varint();
+      if (rest.kind === "vmobject") rest.stroke_verts = strokeVerts;
+      rest.cached = true;
+      return rest;
+    });
+    header.texture_data = {};
+    if (previous.evict) header.evict = [];
+    return header;
+  }
+
+  // ArrayBuffer of a geometry message in; its header and the offset of its
+  // vertex section out. A camera update needs the header rendered last.
+  function parse(buffer, previous = null) {
+    const bytes = new Uint8Array(buffer);
+    if (bytes[0] === CAMERA_MESSAGE_TYPE) {
+      return { header: applyCamera(bytes, previous), base: bytes.length };
+    }
+    const headerLen = new DataView(buffer).getUint32(1, true);
+    const raw = bytes.subarray(5, 5 + headerLen);
+    let header;
+    if (bytes[0] === BINARY_MESSAGE_TYPE) header = decodeBinary(raw);
+    else if (bytes[0] === GEOMETRY_MESSAGE_TYPE) header = JSON.parse(utf8.decode(raw));
+    else throw new Error("not a geometry message: type " + bytes[0]);
+    return { header, base: 5 + headerLen };
+  }
+
+  return { GEOMETRY_MESSAGE_TYPE, BINARY_MESSAGE_TYPE, CAMERA_MESSAGE_TYPE,
+           isGeometry, parse };
+})();
@@ -211,20 +211,24 @@ const ManimlGL = (() => {
     return vao;
   }
 
+  // The header rendered last, which a camera update (0x07) applies to
+  let lastHeader = null;
+
   function parseMessage(arrayBuffer) {
-    const bytes = new Uint8Array(arrayBuffer);
-    const headerLen = new DataView(arrayBuffer, 1, 4).getUint32(0, true);
-    const header = JSON.parse(
-      new TextDecoder().decode(bytes.subarray(5, 5 + headerLen)));
-    return { header, vertexBytes: bytes.subarray(5 + headerLen) };
+    const { header, base } = ManimlGeometry.parse(arrayBuffer, lastHeader);
+    lastHeader = header;
+    return { header, vertexBytes: new Uint8Array(arrayBuffer, base) };
   }
 
   // Delta-encoding cache: batch content hash -> GPU resources.
-  // LRU-capped; a "cached" batch we no longer hold triggers onCacheMiss
-  // (index.html wires it to a geometry_reset request) and is skipped
-  // for one frame.
+  // The live server decides what stays resident: each message's `evict`
+  // lists the batches to drop, so its LRU and this one never disagree.
+  // Messages without one (exports) fall back to a local LRU cap. A
+  // "cached" batch we no longer hold triggers onCacheMiss (index.html
+  // wires it to a geometry_reset request) and is skipped for one frame.
   const batchCache = new Map();
   const CACHE_MAX = 512;
+  let serverEvicts = false;
   let cacheMissed = false;
 
   function freeResources(res) {
@@ -242,7 +246,7 @@ const ManimlGL = (() => {
     if (batch.cached) { cacheMissed = true; return null; }
     res = builder();
     batchCache.set(batch.hash, res);
-    while (batchCache.size > CACHE_MAX) {
+    while (!serverEvicts && batchCache.size > CACHE_MAX) {
       const [oldHash, old] = batchCache.entries().next().value;
       batchCache.delete(oldHash);
       freeResources(old);
@@ -250,11 +254,21 @@ const ManimlGL = (() => {
     return res;
   }
 
+  function evict(hashes) {
+    for (const hash of hashes) {
+      const res = batchCache.get(hash);
+      if (!res) continue;
+      batchCache.delete(hash);
+      freeResources(res);
+    }
+  }
+
   async function render(arrayBuffer) {
     const { header, vertexBytes } = parseMessage(arrayBuffer);
     const [width, height] = header.resolution;
     ensureTargets(width, height, header.samples || 0);
     cacheMissed = false;
+    serverEvicts = Array.isArray(header.evict);
 
     // Decode any texture bytes shipped with this message (raw file
     // bytes — the browser's own decoder handles PNG/JPEG)
@@ -299,6 +313,7 @@ const ManimlGL = (() => {
     gl.blitFramebuffer(0, 0, width, height, 0, 0, width, height,
       gl.COLOR_BUFFER_BIT, gl.NEAREST);
     gl.bindFramebuffer(gl.FRAMEBUFFER, null);
+    if (serverEvicts) evict(header.evict);
     if (cacheMissed && ManimlGL.onCacheMiss) ManimlGL.onCacheMiss();
     return header;
   }
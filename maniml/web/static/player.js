@@ -50,16 +50,43 @@
   }
   statusEl.textContent = backendName;
 
-  // Delta encoding means messages must be processed in order once so
+  // Frames are delta-coded against the frame before them (delta.js), so
+  // reaching frame i means decoding forward from the keyframe at or
+  // before it. Stepping forward is the common case and costs one decode;
+  // a seek or a reverse step re-decodes its group of frames once and
+  // keeps it, so playing backward through the group hits the cache.
+  const decoder = new ManimlDelta.Decoder();
+  let decodedUpTo = -1;           // last frame the decoder consumed
+  let group = new Map();          // frame index -> decoded 0x03 message
+  async function decode(i) {
+    if (group.has(i)) return group.get(i);
+    if (i !== decodedUpTo + 1) {
+      let start = i;
+      while (start > 0 && !meta.frames[start].key) start--;
+      decoder.reset();
+      group = new Map();
+      for (let j = start; j < i; j++) {
+        group.set(j, await decoder.decode(frames[j].bytes));
+      }
+    } else if (meta.frames[i].key) {
+      group = new Map();
+    }
+    const message = await decoder.decode(frames[i].bytes);
+    group.set(i, message);
+    decodedUpTo = i;
+    return message;
+  }
+
+  // Cached batches mean messages must be rendered in order once so
   // every batch's buffers are cached; afterwards any frame renders
   // directly. Process everything up front (buffer uploads, fast).
   let processed = -1;
   async function show(i) {
     while (processed < i) {
       processed += 1;
-      await renderer.render(frames[processed].bytes);
+      await renderer.render(await decode(processed));
     }
-    if (processed > i) await renderer.render(frames[i].bytes);
+    if (processed > i) await renderer.render(await decode(i));
   }
 
   let current = 0;
@@ -145,8 +145,11 @@ const ManimlWGPU = (() => {
   let outView, resolveView, depthView, fillView;
   let targetKey = null;
   const textureCache = new Map();
+  // Batch content hash -> GPU buffers. As in gl.js, a live server's
+  // `evict` lists decide what stays; exports fall back to an LRU cap.
   const batchCache = new Map();
   const CACHE_MAX = 512;
+  let serverEvicts = false;
   let cacheMissed = false;
   let frameBuffers = [];  // per-frame uniform buffers, destroyed post-submit
 
@@ -323,7 +326,7 @@ const ManimlWGPU = (() => {
     if (batch.cached) { cacheMissed = true; return null; }
     res = builder();
     batchCache.set(batch.hash, res);
-    while (batchCache.size > CACHE_MAX) {
+    while (!serverEvicts && batchCache.size > CACHE_MAX) {
       const [oldHash, old] = batchCache.entries().next().value;
       batchCache.delete(oldHash);
       for (const b of old.buffers) b.destroy();
@@ -331,23 +334,34 @@ const ManimlWGPU = (() => {
     return res;
   }
 
+  function evict(hashes) {
+    for (const hash of hashes) {
+      const res = batchCache.get(hash);
+      if (!res) continue;
+      batchCache.delete(hash);
+      for (const b of res.buffers) b.destroy();
+    }
+  }
+
   function batchPipelineName(batch) {
     const base = { dotcloud: "dot", image: "image", surface: "surface",
                    texsurface: "texsurface" }[batch.kind];
     return base + (batch.depth_test ? "_depth" : "");
   }
 
+  // The header rendered last, which a camera update (0x07) applies to
+  let lastHeader = null;
+
   async function render(arrayBuffer) {
-    const bytes = new Uint8Array(arrayBuffer);
-    const headerLen = new DataView(arrayBuffer, 1, 4).getUint32(0, true);
-    const header = JSON.parse(
-      new TextDecoder().decode(bytes.subarray(5, 5 + headerLen)));
-    const vertexBytes = bytes.subarray(5 + headerLen);
+    const { header, base } = ManimlGeometry.parse(arrayBuffer, lastHeader);
+    lastHeader = header;
+    const vertexBytes = new Uint8Array(arrayBuffer, base);
 
     const [width, height] = header.resolution;
     const samples = header.samples ? 4 : 1;
     ensureTargets(width, height, samples);
     cacheMissed = false;
+    serverEvicts = Array.isArray(header.evict);
 
     for (const [texHash, ref] of Object.entries(header.texture_data || {})) {
       if (textureCache.has(texHash)) continue;
@@ -395,6 +409,7 @@ const ManimlWGPU = (() => {
     device.queue.submit([encoder.finish()]);
     for (const b of frameBuffers) b.destroy();
     frameBuffers = [];
+    if (serverEvicts) evict(header.evict);
     if (cacheMissed && ManimlWGPU.onCacheMiss) ManimlWGPU.onCacheMiss();
     return header;
   }
@@ -10,7 +10,13 @@ finished FBO back and streams it to the browser.
 
 Streaming policy: JPEG frames while an animation plays or input events
 are arriving, then a single lossless PNG once things go quiet. Nothing
-is read back or sent while idle with no clients.
+is read back or sent while idle with no clients. The scene thread only
+reads each frame back; encoding runs on `web.pixels.PixelEncoder`'s
+threads, which drop frames that go stale before they are encoded and,
+for clients that ask, send only the tiles that changed. Pages acknowledge
+the frames they show; while one falls behind, the server's congestion
+controllers (`web.congestion`) lower the JPEG quality and the frame rate
+the viewer produces at.
 
 Event flow: the browser sends key/pointer events over the WebSocket as
 JSON; `_dispatch_events` (called from `on_frame_rendered`, i.e. from
@@ -22,7 +28,6 @@ frame ([0,1], y-up), so no window-size bookkeeping is needed.
 
 from __future__ import annotations
 
-import io
 import os
 import subprocess
 import sys
@@ -33,13 +38,14 @@ from collections import deque
 from pathlib import Path
 
 import numpy as np
-from PIL import Image
 
 from maniml.constants import FRAME_SHAPE
 from maniml.event_constants import MouseButtons as PygletMouseButtons
 from maniml.event_constants import WindowKeys as PygletWindowKeys
 from maniml.logger import log
 from maniml.web.library import find_scene_classes
+from maniml.web.local import LOCAL_SOCKET_ENV
+from maniml.web.pixels import PixelEncoder
 from maniml.web.server import WebServer
 
 from typing import TYPE_CHECKING
@@ -65,16 +71,6 @@ JS_BUTTON_TO_PYGLET = {
     2: PygletMouseButtons.RIGHT,
 }
 
-# Scenes are flat colour with hard edges, which is the worst case for the
-# 4:2:0 chroma subsampling a JPEG encoder reaches for by default: colour is
-# stored at half resolution, so the boundary between two saturated blocks
-# smears across several pixels and an animation reads as colours melting into
-# each other rather than switching. Measured on a 1920x1080 frame of colour
-# blocks, worst-case channel error against the source: 147 at 4:2:0, 28 at
-# 4:4:4/90. The cost is 49 KB/frame against 84, i.e. 1.5 MB/s against 2.5 at
-# the 30/s cap — over loopback, to a client on the same machine.
-JPEG_QUALITY = 90
-JPEG_SUBSAMPLING = 0  # 4:4:4, full-resolution colour
 # Bounds the stream when frames are produced faster than a viewer can use
 # them — fast-forwards, updater loops. It must stay clear of the rate a scene
 # actually renders at (30fps, i.e. one frame every 33.3ms): a throttle of the
@@ -154,10 +150,16 @@ class LogBuffer:
 
 class WebViewer:
     is_web_viewer = True
+    _pixels: Optional[PixelEncoder] = None
 
     def __init__(self, open_browser: bool = True):
         self.scene: Optional[Scene] = None
-        self.server = WebServer(capabilities=("export", "restart"))
+        # Launched by the app: also serve its relay on a Unix socket. Taken
+        # out of the environment so no process this scene starts inherits it
+        self.server = WebServer(
+            capabilities=("export", "restart", "binary-geometry"),
+            local_path=os.environ.pop(LOCAL_SOCKET_ENV, None))
+        self._pixels = PixelEncoder(self.server.send_frame)
         self.pressed_keys: set[int] = set()
         self._has_undrawn_event = True
         self._dirty = False  # input arrived since the last sent frame
@@ -178,8 +180,17 @@ class WebViewer:
         self._pixel_mode = True  # off in solo-GL: geometry is the only stream
         self._export_lock = threading.Lock()
         self._export_process: subprocess.Popen | None = None
-        from maniml.web.geometry import GeometryCache
-        self._geometry_cache = GeometryCache()  # delta-encoding state
+        from maniml.web.geometry import GEOMETRY_CACHE_BUDGET, GeometryCache
+        # Delta-encoding state, and the LRU that bounds what clients hold
+        self._geometry_cache = GeometryCache(budget=GEOMETRY_CACHE_BUDGET)
+        # Temporal delta coding of geometry frames (web/delta.py), when a
+        # client asks for it in its `mode` message. One encoder for the
+        # session: every client gets the same frames, and a join resets it
+        self._geometry_delta = None
+        # Binary geometry headers (0x06), when the client asks for them
+        self._geometry_binary = False
+        # Camera updates (0x07) for frames where only the camera moved
+        self._geometry_camera = False
         self.logs = LogBuffer()
         sys.stdout = OutputTap(sys.stdout, "out", self.logs)
         sys.stderr = OutputTap(sys.stderr, "err", self.logs)
@@ -202,6 +213,8 @@ class WebViewer:
         # never has to reconnect or re-authenticate.
         if self._pending_scene is not None:
             return
+        if self._pixels is not None:
+            self._pixels.close()
         self.server.stop()
 
     @property
@@ -306,9 +319,13 @@ class WebViewer:
             # Throttling there smooths nothing; it deletes a third of the
             # animation, which reads as a two-step stutter. The throttle is
             # here to keep the idle loop (~105 fps) off the socket, so it
-            # applies only outside a play.
+            # applies only outside a play -- unless even the fastest client
+            # is paced, when frames no client can show are better never
+            # produced. Slower clients' controllers skip frames for them.
             playing = bool(getattr(self.scene, "_is_playing", False))
-            if playing or now - self._last_send_time >= MIN_SEND_INTERVAL:
+            paced = self.server.frame_interval(shared=self._pixels.tiles)
+            if ((playing and not paced)
+                    or now - self._last_send_time >= max(MIN_SEND_INTERVAL, paced)):
                 kind = "jpeg"
         elif self._last_send_lossy and now - self._last_send_time >= PNG_AFTER_QUIET:
             kind = "png"
@@ -316,21 +333,12 @@ class WebViewer:
             return
 
         if self._pixel_mode:
+            # Only the readback is paid for here; the encode and send run
+            # on the encoder's threads
             camera = self.scene.camera
-            raw = camera.get_raw_fbo_data()
-            w, h = camera.draw_fbo.size
-            channels = len(raw) // (w * h)
-            image = Image.frombytes(
-                "RGBA" if channels == 4 else "RGB", (w, h), raw)
-            buf = io.BytesIO()
-            if kind == "jpeg":
-                image.convert("RGB").save(
-                    buf, "JPEG", quality=JPEG_QUALITY,
-                    subsampling=JPEG_SUBSAMPLING)
-                self.server.broadcast(b"\x01" + buf.getvalue(), droppable=True)
-            else:
-                image.convert("RGB").save(buf, "PNG")
-                self.server.broadcast(b"\x02" + buf.getvalue())
+            self._pixels.submit(
+                kind, camera.draw_fbo.size, camera.get_raw_fbo_data(),
+                full=self._needs_refresh, qualities=self.server.jpeg_qualities())
         self._last_send_time = now
         self._last_send_lossy = (kind == "jpeg")
         self._dirty = False
@@ -341,11 +349,39 @@ class WebViewer:
             # client's GL panel animates in lockstep with the stream.
             # Not droppable: it would always collide with the pixel send
             # queued a moment earlier, and the payload is small anyway.
-            from maniml.web.geometry import serialize_scene
-            self.server.broadcast(
-                serialize_scene(self.scene, self._geometry_cache))
+            self.server.broadcast(self._geometry_message())
         self._broadcast_state()
 
+    def _geometry_message(self) -> bytes:
+        """The scene's current geometry, with a binary header and
+        delta-coded if the client asked, or just the camera when that is
+        all that moved."""
+        from maniml.web.geometry import CAMERA_MESSAGE_TYPE, serialize_scene
+        message = serialize_scene(
+            self.scene, self._geometry_cache, binary=self._geometry_binary,
+            camera_only=self._geometry_camera)
+        # A camera update changes no batch, so the delta coder never sees it
+        if self._geometry_delta is not None and message[0] != CAMERA_MESSAGE_TYPE:
+            message = self._geometry_delta.encode(message)
+        return message
+
+    def needs_capture(self) -> bool:
+        """Whether the scene should render this frame natively. In solo-GL
+        nothing reads the framebuffer back, so a frame in which only the
+        camera moved (it goes out as a camera update) is not rendered."""
+        if (self._pixel_mode or not self._geometry_mode
+                or not self._geometry_camera or not self.server.has_clients()):
+            return True
+        from maniml.web.geometry import only_camera_changed
+        return not only_camera_changed(self.scene, self._geometry_cache)
+
+    def _reset_geometry(self) -> None:
+        """Forget what clients hold: the next payload ships every batch in
+        full and, delta-coded, is a keyframe."""
+        self._geometry_cache.reset()
+        if self._geometry_delta is not None:
+            self._geometry_delta.reset()
+
     def _broadcast_logs(self, replace: bool = False) -> None:
         """Send whatever the scene has printed since the last frame.
 
@@ -375,7 +411,10 @@ class WebViewer:
         if kind == "_connect":
             self._needs_refresh = True
             self._last_state = None
-            self._geometry_cache.reset()  # new client holds no batches
+            self._reset_geometry()  # new client holds no batches
+            # The next geometry payload is full (a keyframe, delta-coded),
+            # so the server can start sending the new client geometry
+            self.server.admit(event.get("client"))
             # Hand the new client the whole backlog: output from before it
             # connected is usually the output that explains something.
             self._broadcast_logs(replace=True)
@@ -460,27 +499,47 @@ class WebViewer:
 
         elif kind == "geometry_request":
             # One-shot snapshot (sent on toggle-on, before any frame flows)
-            from maniml.web.geometry import serialize_scene
-            self.server.broadcast(
-                serialize_scene(self.scene, self._geometry_cache))
+            self.server.broadcast(self._geometry_message())
             self._dirty = False  # the request itself needs no pixel frame
 
         elif kind == "geometry_reset":
             # A client hit a cache miss (e.g. evicted a batch we still
-            # reference): resend everything on the next payload
-            self._geometry_cache.reset()
+            # reference) or a delta it cannot resolve: resend everything
+            # on the next payload
+            self._reset_geometry()
             self._dirty = True
 
+        elif kind == "pixel_reset":
+            # A tile frame the client could not composite: its picture is
+            # no longer the one we diff against, so send a whole frame
+            self._needs_refresh = True
+
         elif kind == "mode":
             # Stage-2 streaming opt-in: while on, every pixel frame is
             # mirrored with a geometry payload; with pixels off (solo-GL)
             # the geometry stream is the only one and the per-frame
             # readback+encode is skipped entirely. Reset deltas on enable
             # so a rejoining toggle always starts from a full payload.
+            # These settings are the session's, not the sender's: every
+            # connected client receives the same stream.
+            # `codec: "delta"` opts into temporal delta frames (0x04),
+            # `tiles` into dirty-tile pixel frames (0x05), `header:
+            # "binary"` into binary geometry headers (0x06) for a client
+            # that saw the `binary-geometry` capability, `camera` into
+            # camera updates (0x07).
             self._geometry_mode = bool(event.get("geometry"))
             self._pixel_mode = bool(event.get("pixels", True))
+            self._pixels.set_tiles(bool(event.get("tiles")))
+            self._geometry_binary = event.get("header") == "binary"
+            self._geometry_camera = bool(event.get("camera"))
+            if event.get("codec") == "delta":
+                if self._geometry_delta is None:
+                    from maniml.web.delta import DeltaEncoder
+                    self._geometry_delta = DeltaEncoder()
+            else:
+                self._geometry_delta = None
             if self._geometry_mode:
-                self._geometry_cache.reset()
+                self._reset_geometry()
             # Leaving solo: the canvas needs a fresh pixel frame
             self._needs_refresh = self._pixel_mode
             self._dirty = False
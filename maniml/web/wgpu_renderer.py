@@ -239,6 +239,14 @@ class WgpuRenderer:
             self.batch_cache[batch["hash"]] = resources
         return resources
 
+    def _evict(self, hashes):
+        """Drop the batches the server's LRU evicted."""
+        for content_hash in hashes:
+            resources = self.batch_cache.pop(content_hash, None) or {}
+            for resource in resources.values():
+                if hasattr(resource, "destroy"):
+                    resource.destroy()
+
     def _pipeline(self, name, samples):
         key = (name, samples)
         if key in self._pipelines:
@@ -380,6 +388,7 @@ class WgpuRenderer:
                                    samples)
 
         device.queue.submit([encoder.finish()])
+        self._evict(header.get("evict", ()))
         read_texture = self.resolve_texture or self.out_texture
         raw = device.queue.read_texture(
             {"texture": read_texture, "mip_level": 0, "origin": (0, 0, 0)},
@@ -0,0 +1,162 @@
+"""Warm scene workers for the app.
+
+A scene opened from the landing page used to start cold: a fresh
+interpreter, then `import maniml` (moderngl, numpy, scipy, PIL,
+svgelements... about two seconds), then the GL driver's first context,
+all before the scene's own code ran. `WorkerPool` keeps spare processes
+that have already paid for that, started with `python -m
+maniml.web.workers`. Opening a scene takes a spare and hands it the
+command line it would have been started with, and a new spare starts
+warming at once, so the next open is warm too.
+
+A worker runs one scene and exits, exactly like the cold process it
+stands in for: the isolation argument in app.py holds unchanged. Spares
+are spawned, not forked, since forking a process that has loaded a GL
+driver or started threads is not safe on macOS. The command is one JSON
+line on the worker's stdin; a spare whose stdin closes before it gets
+one (the app went away) simply exits.
+
+A spare builds maniml's config while importing it, before it knows the
+scene, and constants.py fixes frame size and buffs from that config at
+import. Spares therefore start in an empty directory of their own, so
+they read no `custom_config.yml` at all. A scene whose directory has one,
+which only applies from that working directory, is started cold.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from collections import deque
+
+from maniml.utils.processes import (
+    process_group_popen_kwargs,
+    terminate_process_tree,
+)
+
+DEFAULT_WARM_WORKERS = 1
+# Read from the working directory by maniml.config at import
+CUSTOM_CONFIG_FILE = "custom_config.yml"
+
+
+def spawn(command: list[str], cwd: str | None, env: dict, stdin=None) -> subprocess.Popen:
+    """A scene process: output merged into one text pipe the app reads,
+    in its own process group so it can be stopped as a tree."""
+    return subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=env,
+        stdin=stdin,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        **process_group_popen_kwargs(),
+    )
+
+
+class WorkerPool:
+    """Spare, pre-imported scene processes, `size` of them at a time."""
+
+    def __init__(self, size: int = DEFAULT_WARM_WORKERS):
+        self.size = size
+        # Not the app's working directory, whose custom_config.yml a cold
+        # scene started in its own directory would never see
+        self._directory = tempfile.mkdtemp(prefix="maniml-workers-")
+        self._spares: deque[subprocess.Popen] = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._fill()
+
+    def _fill(self) -> None:
+        with self._lock:
+            while not self._closed and len(self._spares) < self.size:
+                self._spares.append(spawn(
+                    [sys.executable, "-m", "maniml.web.workers"], self._directory,
+                    {**os.environ, "PYTHONUNBUFFERED": "1"},
+                    stdin=subprocess.PIPE,
+                ))
+
+    def run(self, argv: list[str], cwd: str | None, env: dict) -> subprocess.Popen | None:
+        """Start `maniml <argv>` in a spare, with `env` added to its
+        environment. None when no live spare is left, or when `cwd` has a
+        custom config the spare was imported without."""
+        cwd = cwd or os.getcwd()
+        if os.path.exists(os.path.join(cwd, CUSTOM_CONFIG_FILE)):
+            return None
+        process = None
+        with self._lock:
+            while self._spares and process is None:
+                spare = self._spares.popleft()
+                if spare.poll() is None:
+                    process = spare
+        if process is None:
+            return None
+        try:
+            process.stdin.write(json.dumps(
+                {"argv": argv, "cwd": cwd, "env": env}) + "\n")
+            process.stdin.close()
+        except OSError:
+            # It died between the check and the write
+            terminate_process_tree(process)
+            process = None
+        self._fill()
+        return process
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            spares, self._spares = list(self._spares), deque()
+        for spare in spares:
+            terminate_process_tree(spare)
+            if spare.stdout is not None:
+                spare.stdout.close()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+
+def warm() -> None:
+    """What every scene process pays before its scene runs."""
+    import maniml  # noqa: F401 -- the bulk of a cold start
+    import maniml.__main__  # noqa: F401
+    import maniml.web.delta  # noqa: F401
+    import maniml.web.geometry  # noqa: F401
+    import maniml.web.viewer  # noqa: F401
+
+    try:
+        # The first context loads and initializes the GL driver; the
+        # scene's camera creates its own, from a warm driver
+        import moderngl
+        moderngl.create_standalone_context().release()
+    except Exception:
+        pass  # the scene will report it, if it matters
+
+
+def serve() -> None:
+    """A worker's life: warm up, wait for one command, run it."""
+    warm()
+    line = sys.stdin.readline()
+    if not line:
+        return
+    command = json.loads(line)
+    # What `cd <dir> && python -m maniml ...` would have set up: the
+    # scene's directory is the working directory and is importable
+    os.chdir(command["cwd"])
+    sys.path[0] = command["cwd"]
+    os.environ.update(command["env"])
+    sys.stdin = open(os.devnull)
+    sys.argv = ["maniml", *command["argv"]]
+    # The config's run section came from this worker's own command line
+    from maniml.config import manim_config, parse_cli, update_run_config
+    update_run_config(manim_config, parse_cli())
+    from maniml.__main__ import main
+    main()
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,61 @@
+"""Measure Mobject.copy, which every Transform pays in begin().
+
+Copies a few family shapes and reports milliseconds per copy:
+
+    python tests/bench_copy.py [--size=N] [--repeat=N]
+
+- flat: one VGroup of N squares;
+- nested: N/4 groups of four squares each;
+- matrix: a Matrix of about N entries, whose copy also remaps its
+  `elements` list (stand-in entries without LaTeX, as bench_layout.py);
+- named: a group with an attribute naming each of its N members, the
+  case where remapping attributes onto the copy used to go quadratic.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def families(size: int) -> dict:
+    from maniml import Square, VGroup
+    from bench_layout import entries, matrix_class
+
+    named = VGroup(*(Square() for _ in range(size)))
+    for index, member in enumerate(named):
+        setattr(named, f"member_{index}", member)
+    side = max(1, round(math.sqrt(size)))
+    return {
+        "flat": VGroup(*(Square() for _ in range(size))),
+        "nested": VGroup(*(
+            VGroup(*(Square() for _ in range(4))) for _ in range(size // 4))),
+        "matrix": matrix_class()(entries(side)[0]),
+        "named": named,
+    }
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+    sys.argv = sys.argv[:1]  # scene config parses the command line
+
+    print(f"{'':8}{'members':>10}{'ms/copy':>10}")
+    for name, mobject in families(args.size).items():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            mobject.copy()
+        elapsed = (time.perf_counter() - start) / args.repeat * 1000
+        print(f"{name:8}{len(mobject.get_family()):10}{elapsed:10.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
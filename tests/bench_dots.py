@@ -0,0 +1,72 @@
+"""Measure many dots as mobjects of their own against one DotArray.
+
+Builds N dots both ways and reports the memory each holds and the time
+to build, move, and deepcopy them, as a checkpoint does:
+
+    python tests/bench_dots.py [--size=N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def measure(build, size: int) -> dict[str, float]:
+    from maniml import UP
+
+    start = time.perf_counter()
+    dots = build()
+    built = time.perf_counter() - start
+
+    # Memory is read from a second build, as tracing slows building
+    tracemalloc.start()
+    build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    dots.shift(UP)
+    shifted = time.perf_counter() - start
+    start = time.perf_counter()
+    copy.deepcopy(dots)
+    copied = time.perf_counter() - start
+    return {
+        "bytes/dot": memory / size,
+        "build ms": built * 1000,
+        "shift ms": shifted * 1000,
+        "deepcopy ms": copied * 1000,
+    }
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=10000)
+    args = parser.parse_args(argv)
+    sys.argv = sys.argv[:1]  # scene config parses the command line
+
+    from maniml import Dot, DotArray, VGroup
+
+    points = np.random.default_rng(0).uniform(-6, 6, (args.size, 3))
+    rows = {
+        "Dots": measure(lambda: VGroup(*(Dot(point) for point in points)), args.size),
+        "DotArray": measure(lambda: DotArray(points), args.size),
+    }
+    columns = list(rows["Dots"])
+    print(f"{args.size} dots")
+    print(f"{'':10}" + "".join(f"{name:>13}" for name in columns))
+    for name, results in rows.items():
+        print(f"{name:10}" + "".join(f"{results[col]:13.1f}" for col in columns))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
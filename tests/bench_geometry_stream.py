@@ -0,0 +1,84 @@
+"""Measure the geometry stream's bytes per second of animation.
+
+Records every scene found in the given files (default: example_scenes/)
+exactly as --export does and reports, per scene, what the live viewer
+and the baked player carry with and without temporal delta coding:
+
+    python tests/bench_geometry_stream.py [scene files or directories]
+
+A scene that fails to record (LaTeX, missing fonts, ...) is skipped with
+its error, so the run always finishes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import io
+import os
+import sys
+import zlib
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def scene_files(paths: list[str]) -> list[Path]:
+    files = []
+    for path in map(Path, paths or [str(REPO_ROOT / "example_scenes")]):
+        files.extend(sorted(path.rglob("*.py")) if path.is_dir() else [path])
+    return files
+
+
+def measure(messages: list[bytes], fps: int) -> dict[str, float]:
+    """KB per second of animation for each way of carrying the frames."""
+    from maniml.web.delta import DeltaDecoder, DeltaEncoder
+
+    decoder = DeltaDecoder()
+    plain = [decoder.decode(message) for message in messages]
+    live = DeltaEncoder()
+    stored = DeltaEncoder(level=None)
+    sizes = {
+        "live": sum(map(len, plain)),
+        "live+delta": sum(len(live.encode(m)) for m in plain),
+        "live+zlib": sum(len(zlib.compress(m, 1)) for m in plain),
+        "export": len(gzip.compress(b"".join(plain), 6)),
+        "export+delta": len(gzip.compress(
+            b"".join(stored.encode(m) for m in plain), 6)),
+    }
+    seconds = max(len(plain), 1) / fps
+    return {name: size / 1024 / seconds for name, size in sizes.items()}
+
+
+def main(argv: list[str]) -> None:
+    sys.argv = sys.argv[:1]  # scene config parses the command line
+    from maniml.__main__ import load_scene_module
+    from maniml.web.export import record_scene
+    from maniml.web.library import find_scene_classes
+
+    columns = ["live", "live+delta", "live+zlib", "export", "export+delta"]
+    print(f"{'scene':<32}" + "".join(f"{c:>14}" for c in columns)
+          + "   (KB/s)")
+    for path in scene_files(argv):
+        for name in find_scene_classes(str(path)):
+            label = f"{path.stem}.{name}"[:31]
+            try:
+                # Scenes narrate their progress; keep the table readable
+                with contextlib.redirect_stdout(io.StringIO()):
+                    module = load_scene_module(str(path))
+                    scene = getattr(module, name)(window=None)
+                    scene._scene_filepath = os.path.abspath(path)
+                    recorder = record_scene(scene)
+                rates = measure([m for m, _ in recorder.frames],
+                                int(scene.camera.fps))
+            except Exception as error:
+                print(f"{label:<32}skipped: {type(error).__name__}: {error}"
+                      .splitlines()[0][:110])
+                continue
+            print(f"{label:<32}"
+                  + "".join(f"{rates[c]:>14.1f}" for c in columns))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,118 @@
+"""Measure bounding-box-heavy layout on Table and Matrix.
+
+Builds a Table and a Matrix of the given size and times building them
+and what a slide then does with them: move one entry and measure the
+whole again, place the whole next to something, and re-measure after
+every box has been invalidated:
+
+    python tests/bench_layout.py [--size=N] [--repeat=N]
+
+Entries are typeset when LaTeX and Pango are available. Otherwise each
+entry is a stand-in of the same shape, a group of glyph-sized paths, and
+the Matrix gets stand-in brackets, so the run always finishes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+GLYPHS_PER_ENTRY = 3
+
+
+def entries(size: int) -> tuple[list[list], str]:
+    """A size x size grid of entry mobjects, and what they are."""
+    from maniml import RIGHT, Rectangle, Tex, VGroup
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return [[Tex(str(row * size + col)) for col in range(size)]
+                    for row in range(size)], "Tex"
+    except Exception:
+        def stand_in():
+            return VGroup(*(
+                Rectangle(0.12, 0.2).shift(index * 0.15 * RIGHT)
+                for index in range(GLYPHS_PER_ENTRY)))
+        return [[stand_in() for _ in range(size)] for _ in range(size)], "stand-in"
+
+
+def matrix_class():
+    from maniml import Matrix, Rectangle, Tex, VGroup
+    from maniml.constants import LEFT, RIGHT
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            Tex("[")
+        return Matrix
+    except Exception:
+        class StandInMatrix(Matrix):
+            def create_brackets(self, rows, v_buff, h_buff):
+                height = rows.get_height() + 2 * v_buff
+                return VGroup(
+                    Rectangle(0.1, height).next_to(rows, LEFT, h_buff),
+                    Rectangle(0.1, height).next_to(rows, RIGHT, h_buff),
+                )
+        return StandInMatrix
+
+
+def timed(action, repeat: int) -> float:
+    """Milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def measure(build, repeat: int) -> dict[str, float]:
+    from maniml import DOWN, UP, Dot
+
+    results = {"build": timed(build, 1)}
+    mobject = build()
+    anchor = Dot()
+    entry = mobject.get_entries()[len(mobject.get_entries()) // 2]
+
+    def move_entry():
+        entry.shift(0.01 * UP)
+        mobject.get_bounding_box()
+
+    def remeasure():
+        mobject.refresh_bounding_box(recurse_down=True)
+        mobject.get_bounding_box()
+
+    results["move entry"] = timed(move_entry, repeat)
+    results["next_to"] = timed(lambda: mobject.next_to(anchor, DOWN), repeat)
+    results["remeasure"] = timed(remeasure, repeat)
+    return results
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+    sys.argv = sys.argv[:1]  # scene config parses the command line
+
+    from maniml import Table
+
+    kind = entries(1)[1]
+    matrix = matrix_class()
+    print(f"{args.size}x{args.size}, {kind} entries, ms per call")
+    rows = {
+        "Table": measure(lambda: Table(entries(args.size)[0]), args.repeat),
+        "Matrix": measure(lambda: matrix(entries(args.size)[0]), args.repeat),
+    }
+    columns = list(rows["Table"])
+    print(f"{'':8}" + "".join(f"{name:>12}" for name in columns))
+    for name, results in rows.items():
+        print(f"{name:8}" + "".join(f"{results[col]:12.2f}" for col in columns))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -16,6 +16,8 @@ REQUIRED_ASSETS = {
     "maniml/web/static/viewer.html",
     "maniml/web/static/player.html",
     "maniml/web/static/player.js",
+    "maniml/web/static/geometry.js",
+    "maniml/web/static/delta.js",
     "maniml/web/static/gl.js",
     "maniml/web/static/webgpu.js",
     # The installed app's identity: without these the engine serves a page
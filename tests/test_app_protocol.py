@@ -77,12 +77,16 @@ class SceneProcessLifecycleTests(unittest.TestCase):
         server.processes = {}
         server._scenes_by_id = {}
         server._next_scene_id = 0
+        server._evicted = {}
+        server._pool = MagicMock()
+        server.reap = MagicMock()
 
         self.assertEqual(server.open_scene("/tmp/scene.py", "Demo"), URL)
 
         scene_process.assert_called_once_with(
-            "/tmp/scene.py", "Demo", identifier="1"
+            "/tmp/scene.py", "Demo", identifier="1", pool=server._pool
         )
+        server.reap.assert_called_once_with(keep=process)
 
     def test_process_group_options_are_cross_platform(self):
         self.assertEqual(
@@ -316,6 +320,97 @@ while True:
                     process.stdout.close()
 
 
+class SceneReaperTests(unittest.TestCase):
+    def setUp(self):
+        self.server = AppServer.__new__(AppServer)
+        self.server._lock = threading.Lock()
+        self.server._shutdown_complete = False
+        self.server.processes = {}
+        self.server._scenes_by_id = {}
+        self.server._next_scene_id = 0
+        self.server._evicted = {}
+        self.server._pool = None
+        self.server.max_scenes = 3
+        self.server.idle_timeout = 600
+        self.server.memory_ceiling = None
+
+    def scene(self, name, last_active, clients=0, pid=None):
+        process = MagicMock()
+        process.id = name
+        process.clients = clients
+        process.last_active = last_active
+        process.alive.return_value = True
+        process.proc.pid = pid
+        self.server.processes[(f"/{name}.py", name)] = process
+        self.server._scenes_by_id[name] = process
+        return process
+
+    def test_only_scenes_idle_past_the_timeout_are_stopped(self):
+        stale = self.scene("stale", last_active=0)
+        watched = self.scene("watched", last_active=0, clients=1)
+        recent = self.scene("recent", last_active=500)
+
+        self.assertEqual(self.server.reap(now=700), [stale])
+
+        stale.stop.assert_called_once_with()
+        watched.stop.assert_not_called()
+        recent.stop.assert_not_called()
+        self.assertEqual(set(self.server._scenes_by_id), {"watched", "recent"})
+        self.assertEqual(self.server._evicted, {("/stale.py", "stale"): "stale"})
+
+    def test_the_least_recently_used_idle_scenes_go_past_the_cap(self):
+        scenes = [self.scene(f"s{index}", last_active=index) for index in range(5)]
+        scenes[0].clients = 1
+
+        self.assertEqual(self.server.reap(now=10), [scenes[1], scenes[2]])
+
+    def test_the_scene_being_opened_is_kept(self):
+        scenes = [self.scene(f"s{index}", last_active=index) for index in range(4)]
+
+        self.assertEqual(self.server.reap(now=10, keep=scenes[0]), [scenes[1]])
+
+    @patch("maniml.web.app.resident_memory")
+    def test_idle_scenes_go_until_the_rest_fit_the_memory_ceiling(self, resident):
+        self.server.memory_ceiling = 250
+        resident.side_effect = lambda pid: pid
+        self.scene("watched", last_active=0, clients=1, pid=100)
+        oldest = self.scene("oldest", last_active=1, pid=100)
+        self.scene("newest", last_active=2, pid=100)
+
+        self.assertEqual(self.server.reap(now=10), [oldest])
+
+    @patch("maniml.web.app.SceneProcess")
+    def test_a_stopped_scene_reopens_under_its_old_id(self, scene_process):
+        stale = self.scene("7", last_active=0)
+        self.server.reap(now=700)
+        self.server.reap = MagicMock()
+        reopened = scene_process.return_value
+        reopened.id = "7"
+        reopened.wait_for_url.return_value = URL
+
+        self.assertIs(self.server.reopen_scene("7"), reopened)
+
+        scene_process.assert_called_once_with(
+            "/7.py", "7", identifier="7", pool=None)
+        self.assertEqual(self.server._evicted, {})
+        self.assertIsNot(reopened, stale)
+
+
+    def test_an_attached_scene_is_not_reaped_and_a_reaped_one_not_attached(self):
+        watched = self.scene("watched", last_active=0)
+        stale = self.scene("stale", last_active=0)
+
+        self.assertIs(self.server.attach("watched"), watched)
+        self.assertEqual(self.server.reap(now=700), [stale])
+        # A page arriving after the reaper took the scene gets nothing to
+        # relay to, so the relay reopens it instead
+        self.assertIsNone(self.server.attach("stale"))
+
+        self.server.detach(watched)
+        self.assertEqual(watched.clients, 0)
+        self.assertEqual(self.server.reap(now=watched.last_active + 700), [watched])
+
+
 class OutputTapTests(unittest.TestCase):
     """Teeing the scene's own streams is what makes its output visible: in app
     mode stdout is a pipe into the app process, where nothing reads it once
@@ -369,6 +464,7 @@ class AppShutdownTests(unittest.TestCase):
         server._stopped = threading.Event()
         server._loop = None
         server._lock = threading.Lock()
+        server._pool = MagicMock()
         process = MagicMock()
         server.processes = {("scene.py", "Demo"): process}
 
@@ -376,6 +472,7 @@ class AppShutdownTests(unittest.TestCase):
         server.shutdown()
 
         process.stop.assert_called_once_with()
+        server._pool.close.assert_called_once_with()
 
     @patch("maniml.web.cli.AppServer")
     def test_sigterm_runs_app_cleanup_and_restores_handler(self, app_server):
@@ -397,6 +494,191 @@ class AppShutdownTests(unittest.TestCase):
         self.assertEqual(signal.getsignal(signal.SIGTERM), previous_handler)
 
 
+class WorkerPoolTests(unittest.TestCase):
+    def test_a_warm_worker_runs_the_command_where_a_cold_one_would(self):
+        """The scene's directory is the working directory and importable,
+        the scene's environment is applied, and a new spare replaces the
+        one taken."""
+        from maniml.web.workers import WorkerPool
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "helper.py").write_text("VALUE = 42\n")
+            Path(tmpdir, "warm_scene.py").write_text(
+                "import os\nimport helper\n"
+                "print('ran', os.getcwd(), os.environ['MANIML_TEST_MARK'], helper.VALUE)\n")
+            pool = WorkerPool(1)
+            try:
+                spare = pool._spares[0]
+                process = pool.run(
+                    ["warm_scene.py", "Nope"], tmpdir, {"MANIML_TEST_MARK": "mark"})
+                self.assertIs(process, spare)
+                self.assertEqual(len(pool._spares), 1)
+                output = process.stdout.read()  # its stdin is already closed
+                process.wait(timeout=60)
+            finally:
+                pool.close()
+        self.assertIn(f"ran {os.path.realpath(tmpdir)} mark 42", output)
+        self.assertIn("Scene 'Nope' not found", output)
+        self.assertEqual(process.returncode, 1)
+
+    def test_a_warm_worker_reads_the_scene_command_line_into_the_config(self):
+        from maniml.web.workers import WorkerPool
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "warm_scene.py").write_text(
+                "from maniml.config import manim_config\n"
+                "print('run', manim_config.run.file_name, manim_config.run.scene_names)\n")
+            pool = WorkerPool(1)
+            try:
+                process = pool.run(["warm_scene.py", "Nope"], tmpdir, {})
+                output = process.stdout.read()
+                process.wait(timeout=60)
+            finally:
+                pool.close()
+        self.assertIn("run warm_scene.py ['Nope']", output)
+
+    def test_a_warm_worker_ignores_the_apps_own_custom_config(self):
+        """A cold scene starts in its own directory, so the config in the
+        directory the app was started from never reaches it."""
+        from maniml.web.workers import WorkerPool
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as app_dir, \
+                tempfile.TemporaryDirectory() as scene_dir:
+            Path(app_dir, "custom_config.yml").write_text("camera:\n  fps: 7\n")
+            Path(scene_dir, "warm_scene.py").write_text(
+                "from maniml.config import manim_config\n"
+                "print('fps', manim_config.camera.fps)\n")
+            os.chdir(app_dir)
+            try:
+                pool = WorkerPool(1)
+            finally:
+                os.chdir(cwd)
+            try:
+                process = pool.run(["warm_scene.py", "Nope"], scene_dir, {})
+                self.assertIsNotNone(process)
+                output = process.stdout.read()
+                process.wait(timeout=60)
+            finally:
+                pool.close()
+        self.assertIn("fps ", output)
+        self.assertNotIn("fps 7", output)
+
+    def test_a_scene_directory_with_its_own_config_opens_cold(self):
+        """A spare built its config before it knew the directory, so a
+        directory's custom_config.yml takes a cold start, and is honored."""
+        from maniml.web.workers import WorkerPool
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "custom_config.yml").write_text("camera:\n  fps: 7\n")
+            path = str(Path(tmpdir, "configured_scene.py"))
+            Path(path).write_text(
+                "from maniml.config import manim_config\n"
+                "print('fps', manim_config.camera.fps)\n")
+            pool = WorkerPool(1)
+            try:
+                spare = pool._spares[0]
+                self.assertIsNone(pool.run([path, "Nope"], tmpdir, {}))
+                self.assertEqual(list(pool._spares), [spare])
+                scene = SceneProcess(path, "Nope", pool=pool)
+                try:
+                    self.assertIsNot(scene.proc, spare)
+                    scene.proc.wait(timeout=60)
+                    scene._reader.join(timeout=5)
+                finally:
+                    scene.stop()
+            finally:
+                pool.close()
+        self.assertIn("fps 7\n", list(scene.lines))
+
+
+class LocalTransportTests(unittest.TestCase):
+    """The Unix socket a scene serves the app's relay on carries the same
+    conversation as its WebSocket."""
+
+    def test_a_local_client_is_served_like_a_websocket_one(self):
+        import asyncio
+        import json
+
+        from maniml.web.local import LocalConnection, remove_socket, socket_path
+        from maniml.web.server import WebServer
+
+        path = socket_path()
+        if path is None:
+            self.skipTest("no Unix sockets on this platform")
+        self.assertEqual(os.stat(os.path.dirname(path)).st_mode & 0o077, 0)
+        server = WebServer(port=0, local_path=path)
+        frame = bytes([1]) + os.urandom(300_000)
+
+        async def converse():
+            async with await LocalConnection.connect(path) as connection:
+                messages = connection.__aiter__()
+                ready = json.loads(await messages.__anext__())
+                self.assertEqual(ready["type"], "ready")
+                await connection.send(json.dumps({"type": "key", "key": "x"}))
+                server.send_frame(frame)
+                return await asyncio.wait_for(messages.__anext__(), 5)
+
+        try:
+            self.assertEqual(asyncio.run(converse()), frame)
+            events = []
+            deadline = time.time() + 5
+            while len(events) < 2 and time.time() < deadline:
+                events += server.pop_events()
+                time.sleep(0.01)
+            self.assertEqual([e["type"] for e in events], ["_connect", "key"])
+        finally:
+            server.stop()
+            remove_socket(path)
+        self.assertFalse(os.path.exists(os.path.dirname(path)))
+
+    def test_a_joining_client_gets_no_geometry_until_admitted(self):
+        """Geometry builds on what the session already sent, so a client
+        receives none of it until the viewer has reset for its join."""
+        import asyncio
+        import json
+
+        from maniml.web.local import LocalConnection, remove_socket, socket_path
+        from maniml.web.server import WebServer
+
+        path = socket_path()
+        if path is None:
+            self.skipTest("no Unix sockets on this platform")
+        server = WebServer(port=0, local_path=path)
+        delta = bytes([0x04]) + os.urandom(64)  # references frames it never saw
+        pixels = bytes([0x01]) + os.urandom(64)
+        keyframe = bytes([0x03]) + os.urandom(64)
+
+        def connect_event():
+            deadline = time.time() + 5
+            while time.time() < deadline:
+                for event in server.pop_events():
+                    if event["type"] == "_connect":
+                        return event
+                time.sleep(0.01)
+            self.fail("no _connect event")
+
+        async def converse():
+            async with await LocalConnection.connect(path) as connection:
+                messages = connection.__aiter__()
+                await messages.__anext__()  # ready
+                event = await asyncio.to_thread(connect_event)
+                server.broadcast(delta)
+                server.broadcast(pixels)
+                server.admit(event["client"])
+                server.broadcast(keyframe)
+                return [
+                    await asyncio.wait_for(messages.__anext__(), 5)
+                    for _ in range(2)
+                ]
+
+        try:
+            self.assertEqual(asyncio.run(converse()), [pixels, keyframe])
+        finally:
+            server.stop()
+            remove_socket(path)
+
+
 class WebViewerSessionTests(unittest.TestCase):
     def _viewer(self):
         viewer = WebViewer.__new__(WebViewer)
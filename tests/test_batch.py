@@ -0,0 +1,121 @@
+"""Tests for `maniml batch`: scene discovery, the job cache, and failure
+reporting. Rendering itself is --render's, covered in test_modes."""
+
+import contextlib
+import io
+import os
+import tempfile
+import textwrap
+import unittest
+from unittest.mock import patch
+
+from maniml import batch
+from maniml.__main__ import main
+
+SCENES_SRC = textwrap.dedent('''\
+    from maniml import *
+
+    class First(Scene):
+        def construct(self):
+            self.play(Create(Circle()), run_time=0.05)
+
+    class Second(Scene):
+        def construct(self):
+            raise RuntimeError("broken on purpose")
+''')
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        self.scene_file = os.path.join(self.root, "lecture.py")
+        with open(self.scene_file, "w") as f:
+            f.write(SCENES_SRC)
+        os.makedirs(os.path.join(self.root, "media"))
+        with open(os.path.join(self.root, "media", "stale.py"), "w") as f:
+            f.write("class Old(Scene): pass\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_discover_walks_directories_and_skips_media(self):
+        self.assertEqual(
+            batch.discover([self.root]),
+            [(self.scene_file, "First"), (self.scene_file, "Second")],
+        )
+
+    def test_job_key_follows_source_scene_and_config(self):
+        key = batch.job_key(self.scene_file, "First", "{}")
+        self.assertEqual(key, batch.job_key(self.scene_file, "First", "{}"))
+        self.assertNotEqual(key, batch.job_key(self.scene_file, "Second", "{}"))
+        self.assertNotEqual(key, batch.job_key(self.scene_file, "First", '{"fps": 60}'))
+        with open(self.scene_file, "a") as f:
+            f.write("# edited\n")
+        self.assertNotEqual(key, batch.job_key(self.scene_file, "First", "{}"))
+
+    def test_current_output_is_skipped_without_rendering(self):
+        output = os.path.join(self.root, "media", "First.mp4")
+        open(output, "wb").close()
+        config = batch._render_config()
+        cache = {
+            "First": {"key": batch.job_key(self.scene_file, "First", config),
+                      "output": output, "frames": 12},
+            "Second": {"key": batch.job_key(self.scene_file, "Second", config),
+                       "output": os.path.join(self.root, "media", "gone.mp4")},
+        }
+        batch._save_cache(os.path.join(self.root, "media"), cache)
+        current = [
+            batch.is_current(batch.Job(self.scene_file, name, cache[name]["key"]), cache)
+            for name in ("First", "Second")
+        ]
+        # Second's output was deleted, so its matching key is not enough
+        self.assertEqual(current, [True, False])
+
+        first = batch.run_batch([self.root], jobs=1)[0]
+        self.assertEqual((first.scene, first.status, first.frames), ("First", "cached", 12))
+
+    def test_failed_scene_is_reported_and_not_cached(self):
+        # Exported rather than rendered: the same path, without ffmpeg
+        queue = batch.run_batch([self.scene_file], jobs=2, force=True, export=True)
+        by_name = {job.scene: job for job in queue}
+        self.assertEqual(by_name["Second"].status, "failed")
+        self.assertIn("broken on purpose", by_name["Second"].error)
+        self.assertNotIn(
+            "Second_web", batch._load_cache(os.path.join(self.root, "media")))
+
+        summary = batch.format_summary(queue)
+        self.assertIn("lecture.py:Second failed:", summary)
+        self.assertIn("broken on purpose", summary)
+
+    def test_export_links_every_scene_to_one_player_bundle(self):
+        queue = batch.run_batch([self.scene_file], jobs=2, export=True)
+        self.assertEqual([job.status for job in queue], ["rendered", "failed"])
+        media = os.path.join(self.root, "media")
+        export = os.path.join(media, "First_web")
+        self.assertTrue(os.path.exists(os.path.join(export, "scene.bin.gz")))
+        for name in ("index.html", "gl.js", os.path.join("glsl", "common.glsl")):
+            shared = os.stat(os.path.join(media, batch.PLAYER_BUNDLE, name))
+            linked = os.stat(os.path.join(export, name))
+            self.assertEqual(
+                (linked.st_dev, linked.st_ino), (shared.st_dev, shared.st_ino), name)
+
+        # Exports and renders are cached apart; the export is now current
+        self.assertIn("First_web", batch._load_cache(media))
+        again = batch.run_batch([self.scene_file], jobs=1, export=True)
+        self.assertEqual(again[0].status, "cached")
+
+    def test_jobs_must_be_a_positive_whole_number(self):
+        for value in ("abc", "-1", "0", "2.5"):
+            out = io.StringIO()
+            argv = ["maniml", "batch", self.root, f"--jobs={value}"]
+            with patch("sys.argv", argv), patch.object(batch, "main") as run, \
+                    contextlib.redirect_stdout(out), self.assertRaises(SystemExit) as exit:
+                main()
+            self.assertEqual(exit.exception.code, 1)
+            self.assertIn("--jobs must be a positive whole number", out.getvalue())
+            run.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,7 @@
 Exports a scene via the CLI, checks the static folder is complete, and
 replays the recorded geometry stream through the reference renderer in
 order — exactly what the player page does — verifying the delta chain
-resolves and the frames render.
+resolves and the frames render, and that replay can start at any keyframe.
 """
 
 import json
@@ -43,8 +43,8 @@ class WebExportE2E(unittest.TestCase):
                              result.stdout + result.stderr)
 
             out = os.path.join(tmp, "media", "ExportDemo_web")
-            for name in ["index.html", "player.js", "gl.js", "webgpu.js",
-                         "scene.json", "scene.bin.gz"]:
+            for name in ["index.html", "player.js", "geometry.js", "delta.js", "gl.js",
+                         "webgpu.js", "scene.json", "scene.bin.gz"]:
                 self.assertTrue(os.path.exists(os.path.join(out, name)),
                                 f"missing {name}")
             for dirname in ["glsl", "wgsl"]:
@@ -66,16 +66,31 @@ class WebExportE2E(unittest.TestCase):
 
             # Replay in order through the reference renderer — the
             # player's exact procedure; the delta chain must resolve
+            from maniml.web.delta import DeltaDecoder
             from maniml.web.geometry import parse_geometry_message
             from maniml.web.reference_renderer import ReferenceRenderer
+            self.assertTrue(meta["frames"][0]["key"])
             renderer = ReferenceRenderer()
+            decoder = DeltaDecoder()
             offset = 0
             last = None
+            plain = []
             for frame in meta["frames"]:
                 message = blob[offset:offset + frame["len"]]
                 offset += frame["len"]
-                header, vertex_bytes = parse_geometry_message(message)
+                plain.append(decoder.decode(message))
+                header, vertex_bytes = parse_geometry_message(plain[-1])
                 last = renderer.render(header, vertex_bytes)
+
+            # A seek decodes from the nearest keyframe with a fresh decoder
+            # and must land on the same bytes as the in-order pass
+            offsets = np.cumsum([0] + [fr["len"] for fr in meta["frames"]])
+            keys = [i for i, fr in enumerate(meta["frames"]) if fr["key"]]
+            start = keys[-1]
+            seek = DeltaDecoder()
+            for i in range(start, len(meta["frames"])):
+                message = seek.decode(blob[offsets[i]:offsets[i + 1]])
+                self.assertEqual(message, plain[i])
             image = np.asarray(last.convert("RGB"), dtype=np.float64)
             background = np.array([26.0, 26.0, 26.0])
             frac_content = (
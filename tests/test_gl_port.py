@@ -248,6 +248,206 @@ class GLPortFidelity(unittest.TestCase):
         img3 = np.asarray(renderer.render(h3, b3).convert("RGB"), float)
         self.assertLess(np.abs(native3 - img3).mean(), 1.5)
 
+    def test_temporal_delta_round_trip(self):
+        from maniml.web.delta import DeltaDecoder, DeltaEncoder, is_keyframe
+        from maniml.web.geometry import GeometryCache
+        scene = PortScene(window=None)
+        circle = Circle(color=BLUE, fill_opacity=0.6).shift(LEFT * 3)
+        square = Square(color=RED, fill_opacity=1.0).shift(RIGHT * 3)
+        scene.add(circle, square)
+
+        cache = GeometryCache()
+        messages = []
+        for _ in range(8):  # the circle moves, the square holds
+            circle.shift(RIGHT * 0.1)
+            scene.update_frame(dt=0, force_draw=True)
+            messages.append(serialize_scene(scene, cache))
+
+        for level in (1, None):
+            encoder = DeltaEncoder(keyframe_interval=5, level=level)
+            encoded = [encoder.encode(message) for message in messages]
+            self.assertEqual([is_keyframe(m) for m in encoded],
+                             [True] + [False] * 4 + [True] + [False] * 2)
+            decoder = DeltaDecoder()
+            self.assertEqual([decoder.decode(m) for m in encoded], messages)
+            # A decoder that starts at a keyframe resolves from there on
+            late = DeltaDecoder()
+            self.assertEqual([late.decode(m) for m in encoded[5:]],
+                             messages[5:])
+            # ...but one that starts between keyframes cannot
+            with self.assertRaises(ValueError):
+                DeltaDecoder().decode(encoded[2])
+
+        # The moving circle is XORed against its previous frame, which is
+        # what makes the deflated delta smaller than the plain message
+        encoder = DeltaEncoder()
+        encoder.encode(messages[0])
+        delta = encoder.encode(messages[1])
+        self.assertLess(len(delta), len(messages[1]) // 2)
+
+    def test_unchanged_mobjects_are_not_reserialized(self):
+        from unittest import mock
+        from maniml.mobject.types.vectorized_mobject import VMobject
+        from maniml.web.geometry import GeometryCache
+        scene = PortScene(window=None)
+        circle = Circle(color=BLUE, fill_opacity=0.6).shift(LEFT * 3)
+        square = Square(color=RED, fill_opacity=1.0).shift(RIGHT * 3)
+        scene.add(circle, square)
+        scene.update_frame(dt=0, force_draw=True)
+
+        cache = GeometryCache()
+        serialize_scene(scene, cache)
+        cold = GeometryCache()
+        cold.sent = cache.sent.copy()
+
+        def reads():
+            return mock.patch.object(
+                VMobject, "get_shader_data", autospec=True,
+                side_effect=VMobject.get_shader_data)
+
+        circle.shift(RIGHT * 0.5)
+        with reads() as read:
+            moved = serialize_scene(scene, cache)
+        # Only the circle was read again; the square's bytes were reused
+        self.assertEqual([call.args[0] for call in read.call_args_list], [circle])
+        # ...and the result is exactly what a cold serialize produces
+        self.assertEqual(moved, serialize_scene(scene, cold))
+
+        # A data change of any kind (here, a colour) re-reads the mobject
+        square.set_fill(GREEN)
+        with reads() as read:
+            serialize_scene(scene, cache)
+        self.assertEqual([call.args[0] for call in read.call_args_list], [square])
+
+    def test_budgeted_cache_keeps_both_sides_flat(self):
+        from maniml.web.geometry import GeometryCache
+        from maniml.mobject.types.dot_cloud import DotCloud
+        scene = PortScene(window=None)
+        circle = Circle(color=BLUE, fill_opacity=0.6).shift(LEFT * 3)
+        dots = DotCloud(points=np.array([[2.0, 0.0, 0.0]]), color=YELLOW)
+        scene.add(circle, dots)
+
+        # Room for a few frames' worth of batches, not a whole session
+        h, _ = parse_geometry_message(serialize_scene(scene, GeometryCache()))
+        budget = 4 * sum(b["num_verts"] * b["stride"] for b in h["batches"])
+        cache = GeometryCache(budget=budget)
+        held = {}  # the client: hash -> bytes, dropping what `evict` says
+        sizes, evictions = [], 0
+        for step in range(60):
+            # A long session: the circle keeps producing new batches, and
+            # every 20 frames returns to where it started
+            circle.move_to(LEFT * 3 + RIGHT * 0.1 * (step % 20))
+            header, body = parse_geometry_message(serialize_scene(scene, cache))
+            for batch in header["batches"]:
+                if batch.get("cached"):
+                    self.assertIn(batch["hash"], held, "cached but evicted")
+                else:
+                    held[batch["hash"]] = batch["num_verts"] * batch["stride"]
+            for evicted in header["evict"]:
+                held.pop(evicted)
+            evictions += len(header["evict"])
+            self.assertEqual(set(held), set(cache.sent))
+            sizes.append(sum(held.values()))
+        self.assertLessEqual(max(sizes), budget)
+        self.assertGreater(evictions, 0)
+        # The unmoving dots were drawn every frame, so never evicted
+        self.assertTrue(header["batches"][1].get("cached"))
+        # An unbudgeted cache (--export) never evicts
+        h, _ = parse_geometry_message(serialize_scene(scene, GeometryCache()))
+        self.assertNotIn("evict", h)
+
+    def assertSameHeader(self, binary, plain, path="header"):
+        # Numbers in binary headers travel as float32; the rest exactly
+        if isinstance(plain, dict):
+            self.assertEqual(set(binary), set(plain), path)
+            for key in plain:
+                self.assertSameHeader(binary[key], plain[key], f"{path}.{key}")
+        elif isinstance(plain, list):
+            self.assertEqual(len(binary), len(plain), path)
+            for i, (b, p) in enumerate(zip(binary, plain)):
+                self.assertSameHeader(b, p, f"{path}[{i}]")
+        elif isinstance(plain, float):
+            self.assertAlmostEqual(binary, plain, places=5, msg=path)
+        else:
+            self.assertEqual(binary, plain, path)
+
+    def test_binary_header_round_trip(self):
+        from maniml.web.delta import DeltaDecoder, DeltaEncoder
+        from maniml.web.geometry import (
+            GEOMETRY_BINARY_MESSAGE_TYPE, GeometryCache, encode_binary_header)
+
+        # Textures, triangulated and depth-tested fills, cached batches
+        # and an evict list between them
+        cached = 0
+        for scene in (build_image_scene(), build_3d_scene()):
+            caches = GeometryCache(budget=1), GeometryCache(budget=1)
+            for _ in range(2):
+                plain = serialize_scene(scene, caches[0])
+                binary = serialize_scene(scene, caches[1], binary=True)
+                self.assertEqual(binary[0], GEOMETRY_BINARY_MESSAGE_TYPE)
+                plain_header, plain_bytes = parse_geometry_message(plain)
+                binary_header, binary_bytes = parse_geometry_message(binary)
+                self.assertEqual(binary_bytes, plain_bytes)
+                self.assertSameHeader(binary_header, plain_header)
+                self.assertLess(len(binary) - len(binary_bytes),
+                                (len(plain) - len(plain_bytes)) // 2)
+                cached += sum(b.get("cached", 0) for b in binary_header["batches"])
+                scene.mobjects[-1].shift(RIGHT * 0.1)
+        self.assertGreater(cached, 0)
+
+        # The delta codec wraps either header
+        scene = build_dot_scene()
+        cache, encoder, decoder = GeometryCache(), DeltaEncoder(), DeltaDecoder()
+        for _ in range(3):
+            scene.mobjects[-1].shift(UP * 0.1)
+            message = serialize_scene(scene, cache, binary=True)
+            self.assertEqual(decoder.decode(encoder.encode(message)), message)
+
+        # A header the layout has no room for goes as JSON
+        header, _ = parse_geometry_message(serialize_scene(scene))
+        header["batches"][0]["uniforms"]["label"] = "dots"
+        self.assertIsNone(encode_binary_header(header))
+
+    def test_camera_moves_send_camera_updates(self):
+        from maniml.web.geometry import (
+            CAMERA_MESSAGE_TYPE, GeometryCache, apply_camera_message,
+            only_camera_changed)
+        from maniml.mobject.types.dot_cloud import DotCloud
+        scene = PortScene(window=None)
+        circle = Circle(color=BLUE, fill_opacity=0.6).shift(LEFT * 3)
+        square = Square(color=RED, fill_opacity=1.0).shift(RIGHT * 3)
+        dots = DotCloud(points=np.array([[0.0, 2.0, 0.0]]), color=YELLOW)
+        scene.add(circle, dots, square)
+        cache, plain = GeometryCache(budget=1 << 20), GeometryCache(budget=1 << 20)
+        header, _ = parse_geometry_message(serialize_scene(scene, cache, camera_only=True))
+        serialize_scene(scene, plain)
+
+        frame = scene.camera.frame
+        for move in (lambda: frame.shift(RIGHT), lambda: frame.scale(0.5),
+                     lambda: frame.increment_theta(0.3)):
+            move()
+            self.assertTrue(only_camera_changed(scene, cache))
+            message = serialize_scene(scene, cache, camera_only=True)
+            self.assertEqual(message[0], CAMERA_MESSAGE_TYPE)
+            self.assertLess(len(message), 200)
+            # ...standing for exactly the full message it replaces
+            header = apply_camera_message(header, message)
+            expected, _ = parse_geometry_message(serialize_scene(scene, plain))
+            self.assertSameHeader(header, expected)
+
+        # Anything else that changes sends the whole header again
+        circle.shift(UP)
+        self.assertFalse(only_camera_changed(scene, cache))
+        message = serialize_scene(scene, cache, camera_only=True)
+        self.assertNotEqual(message[0], CAMERA_MESSAGE_TYPE)
+        # ...as does a reset, or a caller that did not ask for updates
+        frame.shift(LEFT)
+        self.assertNotEqual(serialize_scene(scene, cache)[0], CAMERA_MESSAGE_TYPE)
+        cache.reset()
+        self.assertFalse(only_camera_changed(scene, cache))
+        self.assertNotEqual(
+            serialize_scene(scene, cache, camera_only=True)[0], CAMERA_MESSAGE_TYPE)
+
     @staticmethod
     def _test_image_path():
         import tempfile
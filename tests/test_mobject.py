@@ -0,0 +1,510 @@
+"""Unit tests for Mobject data handling (no GL context needed)."""
+
+import unittest
+from functools import partial
+from unittest.mock import patch
+
+import numpy as np
+
+from maniml import Dot, DotArray, DotCloud, Group, Square, VGroup
+from maniml.constants import BLUE, DL, DOWN, LEFT, ORIGIN, OUT, RED, RIGHT, UL, UP
+from maniml.scene.scene import Scene
+from maniml.utils.color import color_gradient, color_to_rgb, rgb_gradient
+from maniml.utils.family_ops import FamilyIndex
+from maniml.utils.hit_testing import BoundingBoxIndex, NameIndex
+
+
+def squares(count=6):
+    group = VGroup(*(Square().shift(index * RIGHT) for index in range(count)))
+    group.add(VGroup(Square(0.5), Square(0.25).shift(UP)))
+    return group
+
+
+def family_points(mobject):
+    return [mob.get_points().copy() for mob in mobject.get_family()]
+
+
+def point_bounds(mobject):
+    points = mobject.get_all_points()
+    return points.min(0), points.max(0)
+
+
+class BoundingBoxTests(unittest.TestCase):
+    def test_a_nested_box_covers_every_descendant(self):
+        group = squares()
+        group[-1][1].shift(5 * UP)
+
+        box = group.get_bounding_box()
+
+        mins, maxs = point_bounds(group)
+        np.testing.assert_allclose(box[0], mins)
+        np.testing.assert_allclose(box[2], maxs)
+
+    def test_a_deep_change_reaches_every_ancestor(self):
+        group = VGroup(squares(), Square())
+        group.get_bounding_box()
+        group[0][-1][0].shift(10 * DOWN)
+
+        for mob in (group, group[0], group[0][-1]):
+            np.testing.assert_allclose(
+                mob.get_bounding_box()[0], point_bounds(mob)[0])
+
+    def test_a_group_without_points_does_not_pull_toward_the_origin(self):
+        group = VGroup(Square().shift(5 * RIGHT), VGroup(VGroup()))
+
+        np.testing.assert_allclose(group.get_bounding_box()[0], [4, -1, 0])
+
+    def test_a_family_change_is_noted_once_up_to_outside_holders(self):
+        group = squares()
+        holder = VGroup(group[0])
+        before = holder._data_version
+
+        group.shift(UP)
+
+        self.assertGreater(holder._data_version, before)
+        self.assertTrue(all(mob._data_has_changed for mob in group.get_family()))
+
+
+class BatchUpdatesTests(unittest.TestCase):
+    def test_ancestors_are_noted_once_when_the_block_exits(self):
+        group = squares()
+        outer = VGroup(group)
+        before = outer._data_version
+
+        with group.batch_updates():
+            for square in group[:-1]:
+                square.set_points(square.get_points() + UP)
+            self.assertEqual(outer._data_version, before)
+            versions = [mob._data_version for mob in group[:-1]]
+            group[0].shift(UP)
+            self.assertEqual(group[0]._data_version, versions[0])
+
+        self.assertGreater(outer._data_version, before)
+        self.assertTrue(outer._data_has_changed)
+        self.assertGreater(group._data_version, max(versions))
+
+    def test_nested_blocks_and_errors_still_reach_the_ancestors(self):
+        square = Square()
+        outer = VGroup(VGroup(square))
+        before = outer._data_version
+
+        with self.assertRaises(ValueError):
+            with square.batch_updates(), outer.batch_updates():
+                square.shift(UP)
+                raise ValueError
+
+        after = outer._data_version
+        self.assertGreater(after, before)
+        square.shift(UP)
+        self.assertGreater(outer._data_version, after)
+
+    def test_arrange_matches_the_unbatched_layout(self):
+        group = squares()
+        group.arrange(DOWN, buff=0.5)
+
+        for upper, lower in zip(group, group[1:]):
+            self.assertAlmostEqual(upper.get_bottom()[1] - lower.get_top()[1], 0.5)
+        np.testing.assert_allclose(group.get_center(), 0, atol=1e-6)
+
+
+def uneven_squares(count=12):
+    rng = np.random.default_rng(1)
+    return VGroup(*(
+        Square(side).stretch(stretch, 1).shift([*offset, 0])
+        for side, stretch, offset in zip(
+            rng.uniform(0.2, 1.5, count), rng.uniform(0.5, 2, count),
+            rng.uniform(-3, 3, (count, 2)))
+    ))
+
+
+class LayoutTests(unittest.TestCase):
+    def assertSameLayout(self, ours, theirs):
+        for mob, expected in zip(ours, theirs):
+            np.testing.assert_allclose(mob.get_points(), expected.get_points(), atol=1e-5)
+
+    def test_arrange_matches_next_to_one_by_one(self):
+        for direction, kwargs in [
+            (RIGHT, {}),
+            (DOWN, dict(buff=0.1, aligned_edge=LEFT)),
+            (UL, dict(buff=0.3)),
+            (RIGHT, dict(coor_mask=np.array([1, 0, 0]))),
+        ]:
+            ours, theirs = uneven_squares(), uneven_squares()
+            ours.arrange(direction, **kwargs)
+            for m1, m2 in zip(theirs, theirs[1:]):
+                m2.next_to(m1, direction, **kwargs)
+            theirs.center()
+
+            self.assertSameLayout(ours, theirs)
+
+    def test_arrange_in_grid_matches_moving_each_submobject(self):
+        for n_rows, n_cols, kwargs in [
+            (3, 4, dict()),
+            (2, 5, dict(n_cols=5, aligned_edge=DL, fill_rows_first=False)),
+        ]:
+            ours, theirs = uneven_squares(), uneven_squares()
+            ours.arrange_in_grid(**kwargs)
+
+            edge = kwargs.get("aligned_edge", ORIGIN)
+            x_unit = 0.5 * theirs[0].get_width() + max(sm.get_width() for sm in theirs)
+            y_unit = 0.5 * theirs[0].get_height() + max(sm.get_height() for sm in theirs)
+            for index, sm in enumerate(theirs):
+                if kwargs.get("fill_rows_first", True):
+                    x, y = index % n_cols, index // n_cols
+                else:
+                    x, y = index // n_rows, index % n_rows
+                sm.move_to(ORIGIN, edge)
+                sm.shift(x * x_unit * RIGHT + y * y_unit * DOWN)
+            theirs.center()
+
+            self.assertSameLayout(ours, theirs)
+
+
+class ColorTests(unittest.TestCase):
+    def test_parsed_colors_are_not_shared_with_callers(self):
+        rgb = color_to_rgb("#FF0000")
+        rgb[0] = 0
+
+        np.testing.assert_allclose(color_to_rgb("#FF0000"), [1, 0, 0])
+        np.testing.assert_allclose(color_to_rgb("red"), [1, 0, 0])
+
+    def test_gradient_interpolates_squared_rgbs(self):
+        rgbs = rgb_gradient([RED, BLUE, "#00FF00"], 7)
+
+        ends = np.array([color_to_rgb(RED), color_to_rgb("#00FF00")])
+        np.testing.assert_allclose(rgbs[[0, -1]], ends)
+        np.testing.assert_allclose(rgbs[1], np.sqrt(
+            (2 / 3) * color_to_rgb(RED)**2 + (1 / 3) * color_to_rgb(BLUE)**2))
+        middle = np.sqrt((color_to_rgb(RED)**2 + color_to_rgb(BLUE)**2) / 2)
+        np.testing.assert_allclose(
+            [color.get_rgb() for color in color_gradient([RED, BLUE], 3)][1], middle)
+
+    def test_a_packed_family_takes_the_same_colors(self):
+        packed, plain = squares().pack_family(), squares()
+        for mob in (packed, plain):
+            mob.set_fill(RED, opacity=0.5)
+            mob.set_stroke(BLUE)
+
+        self.assertIsNotNone(packed.get_point_packs())
+        for ours, theirs in zip(packed.get_family(), plain.get_family()):
+            self.assertEqual(ours.data.tobytes(), theirs.data.tobytes())
+            self.assertEqual(ours._data_defaults.tobytes(), theirs._data_defaults.tobytes())
+
+
+class PackedFamilyTests(unittest.TestCase):
+    def assertSamePoints(self, packed, plain):
+        for ours, theirs in zip(family_points(packed), family_points(plain)):
+            np.testing.assert_allclose(ours, theirs, atol=1e-6)
+        np.testing.assert_allclose(
+            packed.get_bounding_box(), plain.get_bounding_box(), atol=1e-6)
+
+    def test_members_become_views_of_one_buffer(self):
+        group = squares().pack_family()
+        (buffer, keys, members, _), = group.get_point_packs()
+
+        self.assertEqual(keys, ("point",))
+        self.assertEqual(members, group.family_members_with_points())
+        self.assertTrue(all(mob.data.base is buffer for mob in members))
+
+    def test_transforms_match_the_per_member_path(self):
+        packed, plain = squares().pack_family(), squares()
+        for mob in (packed, plain):
+            mob.shift(UP).rotate(0.3, axis=OUT).scale(1.7).stretch(0.5, 1)
+            mob.apply_matrix([[1, 0.2], [0, 1]])
+
+        self.assertIsNotNone(packed.get_point_packs())
+        self.assertSamePoints(packed, plain)
+
+    def test_a_member_changing_size_falls_back_to_per_member(self):
+        packed, plain = squares().pack_family(), squares()
+        for mob in (packed, plain):
+            mob[0].set_points(np.zeros((5, 3)))
+            mob.shift(RIGHT)
+
+        self.assertIsNone(packed.get_point_packs())
+        self.assertSamePoints(packed, plain)
+
+    def test_an_empty_member_gaining_points_falls_back(self):
+        group = squares().pack_family()
+        group.set_points(np.ones((3, 3)))
+
+        self.assertIsNone(group.get_point_packs())
+        group.shift(UP)
+        np.testing.assert_allclose(group.get_points(), np.ones((3, 3)) + UP)
+
+    def test_a_family_change_falls_back(self):
+        group = squares().pack_family()
+        group.add(Square())
+
+        self.assertIsNone(group.get_point_packs())
+
+    def test_a_copy_does_not_share_the_buffer(self):
+        group = squares().pack_family()
+        before = family_points(group)
+        copy = group.copy()
+        copy.shift(UP)
+
+        self.assertIsNone(copy.get_point_packs())
+        for ours, theirs in zip(family_points(group), before):
+            np.testing.assert_array_equal(ours, theirs)
+
+    def test_mixed_layouts_pack_separately_and_keep_padded_bounds(self):
+        def mixed():
+            return Group(Square(), DotCloud([[3, 0, 0], [4, 1, 0]], radius=0.5))
+
+        packed, plain = mixed().pack_family(), mixed()
+        self.assertEqual(len(packed.get_point_packs()), 2)
+        for mob in (packed, plain):
+            mob.shift(UP)
+
+        self.assertSamePoints(packed, plain)
+
+
+class CopyTests(unittest.TestCase):
+    def test_attributes_naming_members_point_into_the_copy(self):
+        group, outsider = squares(), Square()
+        group.inner = group[-1][1]
+        group.outsider = outsider
+        group.itself = group
+
+        copy = group.copy()
+
+        self.assertIs(copy.inner, copy[-1][1])
+        self.assertIs(copy.outsider, outsider)
+        self.assertIs(copy.itself, group)
+        self.assertEqual(len(copy.get_family()), len(group.get_family()))
+        self.assertTrue(all(mob.parents == [copy] for mob in copy.submobjects))
+
+    def test_data_is_equal_but_not_shared(self):
+        group = squares()
+        copy = group.copy()
+
+        for original, copied in zip(group.get_family(), copy.get_family()):
+            self.assertIsNot(copied, original)
+            self.assertIsNot(copied.data, original.data)
+            self.assertEqual(copied.data.tobytes(), original.data.tobytes())
+        copy.shift(UP)
+        np.testing.assert_array_equal(group[0].get_points(), squares()[0].get_points())
+
+    def test_a_class_with_its_own_copy_protocol_keeps_it(self):
+        class Tagged(Square):
+            def __copy__(self):
+                result = Square.__new__(type(self))
+                result.__dict__.update(self.__dict__)
+                result.tag = "copied"
+                return result
+
+        self.assertEqual(Tagged().copy().tag, "copied")
+
+
+class HitTestingTests(unittest.TestCase):
+    def test_agrees_with_is_point_touching(self):
+        rng = np.random.default_rng(0)
+        mobjects = [
+            Square(side).move_to([*center, 0])
+            for side, center in zip(rng.uniform(0.2, 2, 40), rng.uniform(-4, 4, (40, 2)))
+        ]
+        index = BoundingBoxIndex()
+        for point in rng.uniform(-5, 5, (100, 2)):
+            point = np.array([*point, 0])
+            expected = [mob.is_point_touching(point, 0.1) for mob in mobjects]
+            self.assertEqual(list(index.touching(mobjects, point, 0.1)), expected)
+            touching = [mob for mob, hit in zip(mobjects, expected) if hit]
+            self.assertIs(index.topmost(mobjects, point, 0.1),
+                          touching[-1] if touching else None)
+
+    def test_a_moved_descendant_is_seen_on_the_next_query(self):
+        group = squares()
+        index = BoundingBoxIndex()
+        far = np.array([0, 20, 0])
+        self.assertIsNone(index.topmost([group], far))
+
+        group[-1][0].move_to(far)
+
+        self.assertIs(index.topmost([group], far), group)
+
+    def test_names_prefer_the_mobject_itself_then_its_first_holder(self):
+        group = squares()
+        names = NameIndex()
+        namespace = {"group": group, "first": group[0], "_hidden": group[1]}
+
+        self.assertEqual(names.name_of(namespace, group[0]), "first")
+        self.assertEqual(names.name_of(namespace, group[1]), "group")
+        self.assertIsNone(names.name_of(namespace, Square()))
+
+    def test_names_follow_family_changes_and_rebinding(self):
+        group, extra = squares(), Square()
+        names = NameIndex()
+        namespace = {"group": group}
+        self.assertIsNone(names.name_of(namespace, extra))
+
+        group[-1].add(extra)
+        self.assertEqual(names.name_of(namespace, extra), "group")
+
+        namespace["group"] = VGroup()
+        self.assertIsNone(names.name_of(namespace, extra))
+
+
+class DotArrayTests(unittest.TestCase):
+    def test_from_dots_keeps_each_dots_place_size_and_color(self):
+        dots = [Dot(RIGHT, radius=0.2, color=RED), Dot(UP, fill_opacity=0.5)]
+        array = DotArray.from_dots(dots)
+
+        self.assertEqual(array.get_num_points(), 2)
+        for view, dot in zip(array.views(), dots):
+            np.testing.assert_allclose(view.get_center(), dot.get_center(), atol=1e-6)
+            self.assertAlmostEqual(view.get_radius(), dot.get_width() / 2, places=5)
+            self.assertEqual(view.get_color(), dot.get_color())
+            self.assertAlmostEqual(view.get_opacity(), dot.get_opacity())
+
+    def test_views_style_and_move_dots_in_place(self):
+        array = DotArray(np.zeros((6, 3)))
+        before = array._data_version
+
+        note = patch.object(array, "note_changed_data", wraps=array.note_changed_data)
+        with note as noted:
+            array.view(1).set_color(RED, opacity=0.5)
+        noted.assert_called_once_with()
+        array.view(np.s_[::2]).shift(UP)
+        array.view([3, 5]).set_radius(1)
+
+        self.assertGreater(array._data_version, before)
+        self.assertEqual(array.view(1).get_color(), Dot(color=RED).get_color())
+        self.assertAlmostEqual(array.view(1).get_opacity(), 0.5)
+        np.testing.assert_allclose(array.get_points()[:, 1], [1, 0, 1, 0, 1, 0])
+        # A cloud's box is padded by its largest radius
+        np.testing.assert_allclose(array.get_bounding_box()[2], [1, 2, 1])
+        with self.assertRaises(IndexError):
+            array.view(6)
+
+    def test_it_iterates_like_any_mobject_without_submobjects(self):
+        array = DotArray(np.zeros((3, 3)))
+
+        self.assertEqual(list(array), [])
+        self.assertEqual(len(Group(array, *array)), 1)
+
+    def test_a_copy_is_independent(self):
+        array = DotArray(np.zeros((3, 3)), color=BLUE)
+        copy = array.copy()
+        copy.view(0).move_to(RIGHT)
+
+        np.testing.assert_allclose(array.get_points(), 0)
+        np.testing.assert_allclose(copy.view(0).get_center(), RIGHT)
+
+
+def bare_scene():
+    scene = Scene.__new__(Scene)
+    scene.mobjects = []
+    scene.id_to_mobject_map = dict()
+    scene._family_index = FamilyIndex()
+    scene._updating = None
+    scene.assemble_render_groups = lambda: None
+    return scene
+
+
+class FamilyIndexTests(unittest.TestCase):
+    def test_holders_follow_appends_and_family_changes(self):
+        group, extra, loose = squares(), Square(), Square()
+        index = FamilyIndex()
+        mobjects = [group]
+        self.assertEqual(index.holders(mobjects)[id(group[-1][0])], [group])
+
+        mobjects.append(loose)
+        self.assertEqual(index.holders(mobjects)[id(loose)], [loose])
+        self.assertNotIn(id(extra), index.holders(mobjects))
+
+        group[-1].add(extra)
+        self.assertEqual(index.holders(mobjects)[id(extra)], [group])
+
+        mobjects.remove(group)
+        self.assertNotIn(id(extra), index.holders(mobjects))
+
+    def test_top_level_mobjects_skip_those_inside_others(self):
+        scene = bare_scene()
+        group, loose = squares(), Square()
+        scene.add(group, loose, group[0])
+
+        self.assertEqual(scene.get_top_level_mobjects(), [group, loose])
+
+    def test_removing_a_member_ungroups_only_its_holder(self):
+        scene = bare_scene()
+        first, second, loose = Square(), Square(), Square()
+        group = VGroup(first, second)
+        scene.add(group, loose)
+
+        scene.remove(first)
+        self.assertEqual(scene.mobjects, [second, loose])
+
+        scene.remove(Square())
+        self.assertEqual(scene.mobjects, [second, loose])
+
+
+class UpdaterTests(unittest.TestCase):
+    def test_an_interval_runs_every_nth_frame_with_the_time_since(self):
+        calls = []
+        square = Square().add_updater(lambda m, dt: calls.append(dt), every=3)
+        calls.clear()
+
+        for _ in range(7):
+            square.update(0.1)
+
+        np.testing.assert_allclose(calls, [0.3, 0.3])
+        square.update(0)
+        self.assertEqual(len(calls), 3)
+
+    def test_intervals_start_afresh_on_a_copy(self):
+        calls = []
+        square = Square().add_updater(lambda m, dt: calls.append(m), every=2)
+        square.update(0.1)
+        copy = square.copy()
+        calls.clear()
+
+        copy.update(0.1)
+        square.update(0.1)
+
+        self.assertEqual(calls, [square])
+
+    def test_updaters_without_code_are_called_by_their_signature(self):
+        def shift(mob, step, dt):
+            mob.shift(step * dt)
+
+        square = Square().add_updater(partial(shift, step=RIGHT))
+        square.update(2)
+
+        np.testing.assert_allclose(square.get_center(), 2 * RIGHT)
+
+    def test_the_dt_convention_is_read_once_when_an_updater_is_added(self):
+        calls = []
+        square = Square().add_updater(lambda m, dt: calls.append(dt))
+        square.add_updater(lambda m: calls.append(m))
+        copy, other = square.copy(), Square()
+        other.match_updaters(square)
+        calls.clear()
+
+        with patch("maniml.mobject.mobject.updater_takes_dt") as takes_dt:
+            for mob in (square, copy, other):
+                mob.update(0.5)
+
+        takes_dt.assert_not_called()
+        self.assertEqual(calls, [0.5, square, 0.5, copy, 0.5, other])
+        self.assertEqual(list(other._updater_conventions.values()), [True, False])
+
+    def test_a_scene_updates_only_mobjects_with_updaters(self):
+        scene = bare_scene()
+        static, group = Square(), VGroup(Square())
+        mover = Square().add_updater(lambda m, dt: m.shift(dt * RIGHT))
+        scene.add(static, group, mover)
+        self.assertEqual(scene.get_updating_mobjects(), [mover])
+
+        scene.update_mobjects(1)
+        np.testing.assert_allclose(mover.get_center(), RIGHT)
+
+        static.add_updater(lambda m: None)
+        self.assertEqual(scene.get_updating_mobjects(), [static, mover])
+
+        group[0].add(Square().add_updater(lambda m: None))
+        self.assertEqual(scene.get_updating_mobjects(), [static, group, mover])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
-"""Headless tests for present mode, render mode, the presentation
-timeline, and click-to-inspect."""
+"""Headless tests for present mode, render mode (movie and image
+sequences), the presentation timeline, and click-to-inspect."""
 
 import glob
 import os
@@ -100,6 +100,77 @@ class TestRenderMode(ModeSceneTest):
         self.assertTrue(pngs[-1].endswith('004.png'))
         self.assertGreater(os.path.getsize(pngs[-1]), 0)
 
+    def test_render_all_snapshots_loop_checkpoints_without_restoring(self):
+        loop_file = os.path.join(self.tmpdir.name, 'loop_scene.py')
+        with open(loop_file, 'w') as f:
+            f.write(textwrap.dedent('''\
+                from maniml import *
+
+                class LoopScene(Scene):
+                    def construct(self):
+                        dot = Dot(radius=0.5)
+                        for _ in range(3):
+                            self.play(dot.animate.shift(RIGHT), run_time=0.05)
+            '''))
+        module = load_scene_module(loop_file)
+        media = os.path.join(self.tmpdir.name, 'media')
+        scene = module.LoopScene(window=None, file_writer_config=dict(
+            write_to_movie=False, output_directory=media, file_name='LoopScene'))
+        scene._scene_filepath = loop_file
+        scene.skip_animations = True
+        scene.setup()
+        scene._create_checkpoint_zero()
+        scene._render_mode = True
+        from unittest import mock
+        with mock.patch.object(scene, '_restore_checkpoint_for_display') as restore:
+            scene._render_all()
+        restore.assert_not_called()
+        self.assertIsNone(scene._checkpoint_images)
+
+        from PIL import Image
+        pngs = sorted(glob.glob(os.path.join(media, 'LoopScene_checkpoints', '*.png')))
+        self.assertEqual(len(pngs), 4, pngs)
+        # One unit, three checkpoints: each snapshot shows its own step
+        images = [np.asarray(Image.open(p).convert('L'), float) for p in pngs[1:]]
+        self.assertGreater(np.abs(images[0] - images[1]).mean(), 0)
+        self.assertGreater(np.abs(images[1] - images[2]).mean(), 0)
+
+
+class TestImageSequence(ModeSceneTest):
+    def render(self, fmt):
+        media = os.path.join(self.tmpdir.name, 'media')
+        scene = self.module.ModeScene(window=None, file_writer_config=dict(
+            write_to_movie=True, output_directory=media, file_name='ModeScene',
+            image_sequence=fmt))
+        scene._scene_filepath = self.scene_file
+        scene._render_mode = True
+        scene.run()
+        return scene, media
+
+    def test_rgba_frames_land_in_one_mapped_file(self):
+        from maniml.scene.frame_sequence import read_rgba_frames
+        scene, media = self.render('rgba')
+        frames, fps = read_rgba_frames(os.path.join(media, 'ModeScene.rgba'))
+        width, height = scene.camera.get_pixel_shape()
+        self.assertEqual(frames.shape, (scene.file_writer.frames_written, height, width, 4))
+        self.assertGreater(len(frames), 4)
+        self.assertEqual(fps, scene.camera.fps)
+        self.assertFalse(os.path.exists(os.path.join(media, 'ModeScene.mp4')))
+        # Top-down, like the camera's own image of the final frame
+        final = np.asarray(scene.get_image())
+        self.assertLess(np.abs(final.astype(int) - frames[-1].astype(int)).max(), 2)
+
+    def test_png_frames_are_numbered_files(self):
+        scene, media = self.render('png')
+        pngs = sorted(glob.glob(os.path.join(media, 'ModeScene_frames', '*.png')))
+        self.assertEqual(len(pngs), scene.file_writer.frames_written)
+        self.assertTrue(pngs[0].endswith('00000.png'))
+
+    def test_unknown_sequence_format_is_refused(self):
+        with self.assertRaises(ValueError):
+            self.module.ModeScene(window=None, file_writer_config=dict(
+                output_directory=self.tmpdir.name, image_sequence='gif'))
+
 
 class TestInspect(ModeSceneTest):
     def test_find_and_name_mobject(self):
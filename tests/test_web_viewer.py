@@ -147,7 +147,7 @@ class _ViewerHarness:
             self.ws_url, max_size=2**24, origin=self.origin)
         response = json.loads(ws.recv(timeout=5))
         self.assertEqual(response["type"], "ready")
-        self.assertEqual(set(response["capabilities"]), {"export", "restart"})
+        self.assertEqual(set(response["capabilities"]), {"export", "restart", "binary-geometry"})
         return ws
 
 
@@ -267,6 +267,24 @@ class WebViewerE2E(_ViewerHarness, unittest.TestCase):
                                "solo mode should stream geometry")
             self.assertEqual(len(solo_pixels), 0,
                              "solo mode must not stream pixels")
+
+            # Delta codec: the same stream as 0x04 envelopes, starting at
+            # a keyframe and decoding back to well-formed 0x03 messages
+            from maniml.web.delta import DeltaDecoder, is_keyframe
+            ws.send(json.dumps({"type": "mode", "geometry": True,
+                                "pixels": False, "codec": "delta"}))
+            ws.send(json.dumps(
+                {"type": "key", "action": "down", "key": "ArrowLeft"}))
+            ws.send(json.dumps(
+                {"type": "key", "action": "down", "key": "ArrowRight"}))
+            frames, _ = self._collect(ws, 4)
+            deltas = [f for f in frames if f[0] == 0x04]
+            self.assertGreater(len(deltas), 3,
+                               "delta mode should stream 0x04 frames")
+            self.assertTrue(is_keyframe(deltas[0]))
+            decoder = DeltaDecoder()
+            for delta in deltas:
+                parse_geometry_message(decoder.decode(delta))
             ws.send(json.dumps({"type": "mode", "geometry": False}))
 
     def test_future_chips(self):
@@ -330,6 +348,284 @@ class StreamPolicyTests(unittest.TestCase):
             "against it once real timing jitter is involved")
 
 
+class PixelEncoderTests(unittest.TestCase):
+    """Frames are encoded off the scene thread; a frame that goes stale
+    while waiting for an encoder is dropped before it is compressed."""
+
+    def test_stale_frames_are_dropped_and_order_is_kept(self):
+        from maniml.web.pixels import PixelEncoder
+
+        release = threading.Event()
+        sent = []
+
+        def send(message, droppable):
+            # Hold the only worker on the first frame; released, not timed out
+            sent.append((message[0], droppable, release.wait(5)))
+
+        encoder = PixelEncoder(send, workers=1)
+        size = (8, 4)
+        frames = [bytes([i]) * (8 * 4 * 4) for i in range(5)]
+        encoder.submit("png", size, frames[0])
+        time.sleep(0.2)  # the worker takes frame 0 and blocks in send
+        start = time.monotonic()
+        for raw in frames[1:]:
+            encoder.submit("jpeg", size, raw)
+        # Submitting while a send is in flight does not wait for it
+        self.assertLess(time.monotonic() - start, 1)
+        release.set()
+        self.assertTrue(encoder.flush(timeout=5))
+        encoder.close()
+        # Frames 1-3 were replaced in the slot, never encoded
+        self.assertEqual(encoder.dropped, 3)
+        self.assertEqual(sent, [(0x02, False, True), (0x01, True, True)])
+
+    def test_a_frame_is_encoded_once_per_quality_tier(self):
+        from maniml.web.pixels import PixelEncoder
+
+        sent = []
+        encoder = PixelEncoder(lambda message, droppable: sent.append(message))
+        raw = bytes(range(256)) * 32  # 64x32 RGBA, detailed enough to compress
+        encoder.submit("jpeg", (64, 32), raw, qualities=(90, 50))
+        self.assertTrue(encoder.flush(timeout=5))
+        encoder.submit("png", (64, 32), raw, qualities=(90, 50))
+        self.assertTrue(encoder.flush(timeout=5))
+        encoder.close()
+
+        jpegs, png = sent
+        self.assertEqual(sorted(jpegs), [50, 90])
+        self.assertLess(len(jpegs[50]), len(jpegs[90]))
+        self.assertEqual(png[0], 0x02)  # lossless: one frame for everyone
+
+
+class TileDiffTests(unittest.TestCase):
+    """Dirty-tile pixel frames (0x05), composited the way viewer.html
+    does it, reproduce the source frame."""
+
+    SIZE = (200, 130)  # not a multiple of the tile: edge tiles are partial
+
+    def frame(self, boxes=()):
+        import numpy as np
+        w, h = self.SIZE
+        pixels = np.zeros((h, w, 4), np.uint8)
+        pixels[..., 3] = 255
+        for x, y, colour in boxes:
+            pixels[y:y + 10, x:x + 10, :3] = colour
+        return pixels
+
+    def composite(self, picture, message):
+        import io
+        import numpy as np
+        from PIL import Image
+        from maniml.web.pixels import TILE_HEADER, TILE_MESSAGE_TYPE
+
+        if message[0] != TILE_MESSAGE_TYPE:
+            return np.asarray(Image.open(io.BytesIO(message[1:])).convert("RGB"))
+        _, _, tile, w, h, count = TILE_HEADER.unpack_from(message)
+        table = np.frombuffer(
+            message, "<u2", 2 * count, TILE_HEADER.size).reshape(count, 2)
+        atlas = np.asarray(Image.open(io.BytesIO(
+            message[TILE_HEADER.size + 4 * count:])).convert("RGB"))
+        columns = atlas.shape[1] // tile
+        picture = picture.copy()
+        for i, (column, row) in enumerate(table):
+            x, y = column * tile, row * tile
+            cw, ch = min(tile, w - x), min(tile, h - y)
+            ax, ay = (i % columns) * tile, (i // columns) * tile
+            picture[y:y + ch, x:x + cw] = atlas[ay:ay + ch, ax:ax + cw]
+        return picture
+
+    def test_only_changed_tiles_are_sent_and_composite_exactly(self):
+        from maniml.web.pixels import TILE_HEADER, TileDiff
+
+        diff = TileDiff()
+        first = self.frame([(20, 20, (255, 0, 0))])
+        message = diff.encode("png", self.SIZE, first.tobytes())
+        self.assertEqual(message[0], 0x02)  # nothing to diff against yet
+        picture = self.composite(None, message)
+
+        # A counter ticking in a (partial) tile at the right edge
+        second = self.frame([(20, 20, (255, 0, 0)), (194, 66, (0, 255, 0))])
+        message = diff.encode("png", self.SIZE, second.tobytes())
+        self.assertEqual(message[0], 0x05)
+        self.assertEqual(TILE_HEADER.unpack_from(message)[-1], 1)
+        picture = self.composite(picture, message)
+        self.assertTrue((picture == second[..., :3]).all())
+
+        # Nothing changed: nothing to send
+        self.assertIsNone(diff.encode("png", self.SIZE, second.tobytes()))
+        # A requested keyframe is whole regardless
+        self.assertEqual(diff.encode("png", self.SIZE, second.tobytes(), full=True)[0], 0x02)
+
+    def test_idle_png_resends_the_tiles_last_sent_as_jpeg(self):
+        from maniml.web.pixels import TILE_HEADER, TileDiff
+
+        diff = TileDiff()
+        diff.encode("png", self.SIZE, self.frame().tobytes())
+        moving = self.frame([(70, 70, (0, 0, 255))])
+        message = diff.encode("jpeg", self.SIZE, moving.tobytes())
+        self.assertEqual(message[1], 1)  # a JPEG atlas
+        lossy_tiles = TILE_HEADER.unpack_from(message)[-1]
+        # Same picture, now asked for losslessly: the lossy tiles go again
+        message = diff.encode("png", self.SIZE, moving.tobytes())
+        self.assertEqual(message[1], 2)
+        self.assertEqual(TILE_HEADER.unpack_from(message)[-1], lossy_tiles)
+        self.assertIsNone(diff.encode("png", self.SIZE, moving.tobytes()))
+
+    def test_a_mostly_changed_frame_is_sent_whole(self):
+        from maniml.web.pixels import TileDiff
+
+        diff = TileDiff()
+        diff.encode("png", self.SIZE, self.frame().tobytes())
+        changed = self.frame()
+        changed[..., 0] = 9
+        self.assertEqual(diff.encode("jpeg", self.SIZE, changed.tobytes())[0], 0x01)
+
+
+class FrameControllerTests(unittest.TestCase):
+    """Per-client pacing from frame acks, driven by a synthetic clock."""
+
+    now = 0.0
+
+    def run_acks(self, controller, latency, client, adjustments):
+        """Acknowledge frames a constant `latency` after sending them, one
+        per adjustment period; how many times geometry was suggested."""
+        from maniml.web.congestion import ADJUST_PERIOD
+        suggested = 0
+        for _ in range(adjustments):
+            controller.sent(self.now)
+            suggested += controller.acked(1, client, self.now + latency)
+            self.now += ADJUST_PERIOD
+        return suggested
+
+    def test_a_slow_link_costs_quality_then_rate_then_suggests_geometry(self):
+        from maniml.web.congestion import (
+            MAX_INTERVAL, MIN_QUALITY, FrameController)
+        from maniml.web.pixels import JPEG_QUALITY
+
+        controller = FrameController()
+        self.run_acks(controller, latency=0.3, client=0.01, adjustments=2)
+        self.assertLess(controller.quality, JPEG_QUALITY)
+        self.assertEqual(controller.interval, 0)  # quality goes first
+        suggested = self.run_acks(controller, latency=0.3, client=0.01, adjustments=40)
+        self.assertEqual(controller.quality, MIN_QUALITY)
+        self.assertEqual(controller.interval, MAX_INTERVAL)
+        self.assertEqual(suggested, 1)  # once, however long it lasts
+
+    def test_a_slow_page_costs_rate_not_quality(self):
+        from maniml.web.congestion import FrameController
+        from maniml.web.pixels import JPEG_QUALITY
+
+        controller = FrameController()
+        self.run_acks(controller, latency=0.3, client=0.25, adjustments=4)
+        self.assertEqual(controller.quality, JPEG_QUALITY)
+        self.assertGreater(controller.interval, 0)
+
+    def test_recovery_gives_back_rate_before_quality(self):
+        from maniml.web.congestion import FrameController
+        from maniml.web.pixels import JPEG_QUALITY
+
+        controller = FrameController()
+        self.run_acks(controller, latency=0.3, client=0.01, adjustments=8)
+        self.assertGreater(controller.interval, 0)
+        self.run_acks(controller, latency=0.01, client=0.005, adjustments=2)
+        degraded = controller.quality
+        self.assertLess(degraded, JPEG_QUALITY)
+        self.run_acks(controller, latency=0.01, client=0.005, adjustments=40)
+        self.assertEqual(controller.interval, 0)
+        self.assertEqual(controller.quality, JPEG_QUALITY)
+
+    def test_unacknowledged_frames_hold_back_droppable_ones(self):
+        """Against a real server: a page that acknowledges frames but has
+        WINDOW of them outstanding is skipped for droppable frames until it
+        catches up, and is still sent everything that is not droppable."""
+        from maniml.web.congestion import WINDOW
+        from maniml.web.server import WebServer
+
+        server = WebServer(port=0)
+        try:
+            with ws_connect(server.url.replace("http", "ws"),
+                            origin=server.url.rstrip("/"), open_timeout=3) as ws:
+                self.assertEqual(json.loads(ws.recv(timeout=3))["type"], "ready")
+                deadline = time.monotonic() + 3
+                while not server.has_clients() and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+                def send(count, droppable):
+                    for i in range(count):
+                        server.send_frame(bytes([1, i]), droppable)
+                        time.sleep(0.05)  # each send finishes on its own
+
+                def received():
+                    frames = []
+                    try:
+                        while True:
+                            frames.append(ws.recv(timeout=0.3))
+                    except TimeoutError:
+                        return frames
+
+                def ack(frames):
+                    ws.send(json.dumps({"type": "ack", "frames": frames,
+                                        "decode": 1.5, "render": 0.5}))
+                    time.sleep(0.1)
+
+                # Until a page acknowledges anything, it is not held back
+                send(WINDOW + 1, droppable=True)
+                self.assertEqual(len(received()), WINDOW + 1)
+                ack(WINDOW + 1)
+
+                send(WINDOW + 2, droppable=True)
+                self.assertEqual(len(received()), WINDOW)
+                send(2, droppable=False)
+                self.assertEqual(len(received()), 2)
+                ack(WINDOW + 2)
+                send(1, droppable=True)
+                self.assertEqual(len(received()), 1)
+        finally:
+            server.stop()
+
+
+    def test_frames_follow_the_fastest_client_and_each_gets_its_own_quality(self):
+        """A congested page gets fewer frames, at its own quality tier,
+        without lowering the rate or quality of a healthy one."""
+        from maniml.web.congestion import MIN_QUALITY, FrameController
+        from maniml.web.pixels import JPEG_QUALITY
+        from maniml.web.server import WebServer
+
+        server = WebServer(port=0)
+        url, origin = server.url.replace("http", "ws"), server.url.rstrip("/")
+        try:
+            with ws_connect(url, origin=origin, open_timeout=3) as first, \
+                    ws_connect(url, origin=origin, open_timeout=3) as second:
+                for ws in (first, second):
+                    self.assertEqual(json.loads(ws.recv(timeout=3))["type"], "ready")
+                deadline = time.monotonic() + 3
+                while len(server._controllers) < 2 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                healthy, congested = server._controllers.values()
+                congested.interval, congested.quality = 0.2, 60
+                self.assertEqual(server.frame_interval(), 0)
+                self.assertEqual(server.frame_interval(shared=True), 0.2)
+                self.assertEqual(server.jpeg_qualities(), (JPEG_QUALITY, MIN_QUALITY))
+
+                frames = {JPEG_QUALITY: b"\x01best", MIN_QUALITY: b"\x01least"}
+                server.send_frame(frames, droppable=True)
+                time.sleep(0.05)
+                server.send_frame(frames, droppable=True)  # inside its interval
+
+                def received(ws):
+                    messages = []
+                    try:
+                        while True:
+                            messages.append(ws.recv(timeout=0.3))
+                    except TimeoutError:
+                        return messages
+
+                self.assertEqual(
+                    sorted([received(first), received(second)]),
+                    [[b"\x01best", b"\x01best"], [b"\x01least"]])
+        finally:
+            server.stop()
+
 RAIL_SOURCE = """
 from manim import *
 